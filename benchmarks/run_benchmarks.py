@@ -0,0 +1,577 @@
+"""Modifier Pie Kit 헤드리스 벤치마크
+
+사용법:
+    blender -b --factory-startup --python benchmarks/run_benchmarks.py -- \
+        --scales small,medium --repeat 3 --output bench.json
+
+    # 이전 결과와 비교
+    blender -b --factory-startup --python benchmarks/run_benchmarks.py -- \
+        --output new.json --compare old.json
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import types
+
+import bpy
+import bmesh
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_NAME = "modifier_pie_kit"
+
+# N: 오브젝트 수, M: 오브젝트당 모디파이어 수, V: 메시당 버텍스 수,
+# K: 불리언 커터 수, C: 카메라 수, T: 핸들러 측정 틱 수
+SCALES = {
+    "small": dict(N=10, M=3, V=1_000, K=3, C=5, T=50),
+    "medium": dict(N=100, M=4, V=10_000, K=10, C=50, T=100),
+    "large": dict(N=300, M=6, V=50_000, K=30, C=150, T=200),
+}
+
+MODIFIER_SETUPS = [
+    ('BEVEL', dict(width=0.02, segments=2)),
+    ('MIRROR', dict()),
+    ('SOLIDIFY', dict(thickness=0.05)),
+    ('SUBSURF', dict(levels=1)),
+    ('ARRAY', dict(count=2)),
+    ('WIREFRAME', dict(thickness=0.01)),
+    ('DISPLACE', dict(strength=0.05)),
+]
+
+
+# ─────────────────────────────────────────────
+# 애드온 로드 / 오퍼레이터 실행
+# ─────────────────────────────────────────────
+
+def enable_addon():
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    import addon_utils
+    module = addon_utils.enable(ADDON_NAME, default_set=True, handle_error=None)
+    if module is None:
+        module = __import__(ADDON_NAME)
+        module.register()
+    return module
+
+
+class OperatorHarness:
+    """창이 없는 백그라운드 모드에서 오퍼레이터 execute 를 직접 호출하기 위한 대역
+
+    poll 이 area 를 요구하는 오퍼레이터도 측정할 수 있도록 bpy.ops 를 거치지 않습니다.
+    """
+
+    def __init__(self, op_cls, **props):
+        self._cls = op_cls
+        self.reports = []
+        for prop in op_cls.bl_rna.properties:
+            if prop.identifier == "rna_type":
+                continue
+            default = getattr(prop, "default_array", None) if getattr(prop, "is_array", False) else getattr(prop, "default", None)
+            object.__setattr__(self, prop.identifier, default)
+        for name, value in props.items():
+            object.__setattr__(self, name, value)
+
+    def __getattr__(self, name):
+        attr = getattr(self._cls, name)
+        if isinstance(attr, types.FunctionType):
+            return types.MethodType(attr, self)
+        return attr
+
+    def report(self, level, message):
+        self.reports.append((set(level), message))
+
+    def execute(self, context):
+        return self._cls.execute(self, context)
+
+
+def run_operator(op_cls, **props):
+    harness = OperatorHarness(op_cls, **props)
+    start = time.perf_counter()
+    result = harness.execute(bpy.context)
+    elapsed = time.perf_counter() - start
+    if 'FINISHED' not in result:
+        raise RuntimeError(f"{op_cls.bl_idname} returned {result}: {harness.reports}")
+    return elapsed
+
+
+# ─────────────────────────────────────────────
+# 합성 씬 생성
+# ─────────────────────────────────────────────
+
+_base_meshes = {}
+
+
+def reset_scene():
+    bpy.data.batch_remove(list(bpy.data.objects))
+    # 기본 메시는 fake user 라 users == 0 정리에 걸리지 않으므로 직접 지움 (안 지우면 케이스/반복마다 누적)
+    base_meshes = list(_base_meshes.values())
+    for mesh in base_meshes:
+        mesh.use_fake_user = False
+    bpy.data.batch_remove(base_meshes)
+    _base_meshes.clear()
+    for collection in (bpy.data.meshes, bpy.data.cameras, bpy.data.lights,
+                       bpy.data.collections, bpy.data.curves):
+        bpy.data.batch_remove([data for data in collection if data.users == 0])
+    random.seed(0)
+
+
+def base_mesh(vertex_count):
+    """버텍스 수가 약 vertex_count 인 UV 구 메시 (닫힌 메시라 불리언에도 사용)"""
+    mesh = _base_meshes.get(vertex_count)
+    if mesh is None:
+        segments = max(3, int(math.sqrt(vertex_count)))
+        mesh = bpy.data.meshes.new(f"BenchBase_{vertex_count}")
+        bm = bmesh.new()
+        bmesh.ops.create_uvsphere(bm, u_segments=segments, v_segments=segments, radius=1.0)
+        bm.to_mesh(mesh)
+        bm.free()
+        mesh.use_fake_user = True
+        _base_meshes[vertex_count] = mesh
+    return mesh
+
+
+def add_mesh_object(name, vertex_count, shared=False):
+    mesh = base_mesh(vertex_count)
+    obj = bpy.data.objects.new(name, mesh if shared else mesh.copy())
+    bpy.context.scene.collection.objects.link(obj)
+    obj.location = (random.uniform(-50, 50), random.uniform(-50, 50), random.uniform(-5, 5))
+    obj.rotation_euler = (random.uniform(0, math.pi), random.uniform(0, math.pi), random.uniform(0, math.pi))
+    return obj
+
+
+def add_modifiers(obj, count):
+    for i in range(count):
+        mod_type, settings = MODIFIER_SETUPS[i % len(MODIFIER_SETUPS)]
+        mod = obj.modifiers.new(name=f"{mod_type.title()}{i}", type=mod_type)
+        for key, value in settings.items():
+            setattr(mod, key, value)
+
+
+def select_only(objects, active=None):
+    view_layer = bpy.context.view_layer
+    for obj in view_layer.objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    view_layer.objects.active = active or (objects[0] if objects else None)
+
+
+def make_mesh_objects(p, with_modifiers=False, shared=False):
+    objects = []
+    for i in range(p["N"]):
+        obj = add_mesh_object(f"Bench_{i:05d}", p["V"], shared=shared)
+        if with_modifiers:
+            add_modifiers(obj, p["M"])
+        objects.append(obj)
+    bpy.context.view_layer.update()
+    return objects
+
+
+def make_boolean_scene(p):
+    host = add_mesh_object("BoolHost", p["V"])
+    host.location = (0, 0, 0)
+    for i in range(p["K"]):
+        cutter = add_mesh_object(f"BoolCutter_{i:03d}", 1_000)
+        cutter.scale = (0.3, 0.3, 0.3)
+        mod = host.modifiers.new(name=f"Boolean{i}", type='BOOLEAN')
+        mod.object = cutter
+    others = make_mesh_objects(dict(p, V=1_000))
+    select_only([host])
+    bpy.context.view_layer.update()
+    return host, others
+
+
+def make_cameras(count):
+    cameras = []
+    for i in range(count):
+        cam = bpy.data.objects.new(f"Cam_{i:04d}", bpy.data.cameras.new(f"Cam_{i:04d}"))
+        bpy.context.scene.collection.objects.link(cam)
+        cam["resolution_x"] = 1920 + i
+        cam["resolution_y"] = 1080
+        cameras.append(cam)
+    if cameras:
+        bpy.context.scene.camera = cameras[0]
+    return cameras
+
+
+# ─────────────────────────────────────────────
+# 측정 케이스
+# ─────────────────────────────────────────────
+
+def bench_apply_all_common_modifiers(addon, p):
+    objects = make_mesh_objects(p, with_modifiers=True)
+    select_only(objects)
+    return run_operator(addon.operators.popup_modifiers.MODIFIER_PIE_OT_apply_all_common_modifiers)
+
+
+def _bench_mirror_apply(addon, p, shared):
+    objects = make_mesh_objects(p, shared=shared)
+    for obj in objects:
+        obj.modifiers.new(name="Mirror", type='MIRROR')
+    select_only(objects)
+    return run_operator(addon.operators.popup_modifiers.MODIFIER_PIE_OT_confirm_mirror_and_apply)
+
+
+def bench_mirror_apply(addon, p):
+    return _bench_mirror_apply(addon, p, shared=False)
+
+
+def bench_mirror_apply_shared(addon, p):
+    return _bench_mirror_apply(addon, p, shared=True)
+
+
+def bench_origin_to_bottom(addon, p):
+    objects = make_mesh_objects(p)
+    select_only(objects)
+    return run_operator(addon.operators.popup_pivot.OBJECT_OT_origin_to_bottom)
+
+
+def bench_origin_to_bottom_shared(addon, p):
+    objects = make_mesh_objects(p, shared=True)
+    select_only(objects)
+    return run_operator(addon.operators.popup_pivot.OBJECT_OT_origin_to_bottom)
+
+
+def bench_group_by_empty(addon, p):
+    objects = make_mesh_objects(p)
+    select_only(objects)
+    return run_operator(addon.operators.grouping.OBJECT_OT_group_by_empty)
+
+
+def bench_ungroup_empty(addon, p):
+    objects = make_mesh_objects(p)
+    empty = bpy.data.objects.new("- Group", None)
+    bpy.context.scene.collection.objects.link(empty)
+    for obj in objects:
+        obj.parent = empty
+    bpy.context.view_layer.update()
+    select_only(objects)
+    return run_operator(addon.operators.grouping.OBJECT_OT_ungroup_empty)
+
+
+def bench_move_bottom_to_z0(addon, p):
+    objects = make_mesh_objects(p, with_modifiers=True)
+    select_only(objects)
+    return run_operator(addon.operators.popup_modifiers.MODIFIER_PIE_OT_move_bottom_to_z0)
+
+
+def bench_move_bottom_to_z0_evaluated(addon, p):
+    objects = make_mesh_objects(p, with_modifiers=True)
+    select_only(objects)
+    return run_operator(addon.operators.popup_modifiers.MODIFIER_PIE_OT_move_bottom_to_z0, use_evaluated=True)
+
+
+def bench_rotational_array(addon, p):
+    obj = add_mesh_object("RotArray", p["V"])
+    select_only([obj])
+    return run_operator(addon.operators.popup_modifiers.MODIFIER_PIE_OT_rotational_array, count=max(6, p["M"] * 8))
+
+
+def bench_rotational_array_apply_transforms(addon, p):
+    """기존 방식: transform_apply + origin_set + parent_set"""
+    obj = add_mesh_object("RotArray", p["V"])
+    select_only([obj])
+    return run_operator(addon.operators.popup_modifiers.MODIFIER_PIE_OT_rotational_array,
+                        count=max(6, p["M"] * 8), keep_mesh_data=False)
+
+
+def bench_rotational_array_instances(addon, p):
+    """지오메트리 노드 인스턴스 방식 (평가 포함)"""
+    obj = add_mesh_object("RotArray", p["V"])
+    select_only([obj])
+    start = time.perf_counter()
+    addon.operators.radial_instances.add_radial_instances(
+        obj, max(6, p["M"] * 8), 'Z', bpy.context.scene.cursor.location.copy())
+    bpy.context.view_layer.update()
+    return time.perf_counter() - start
+
+
+def make_lights(count):
+    for i in range(count):
+        light = bpy.data.objects.new(f"Light_{i:04d}", bpy.data.lights.new(f"Light_{i:04d}", 'POINT'))
+        bpy.context.scene.collection.objects.link(light)
+
+
+def bench_sort_all(addon, p):
+    make_mesh_objects(p)
+    make_cameras(p["C"])
+    make_lights(p["C"])
+    start = time.perf_counter()
+    addon.operators.Outliner_Enhancer.sort_all_objects()
+    return time.perf_counter() - start
+
+
+def bench_sort_all_sorted(addon, p):
+    """이미 정리된 씬에서 다시 정리 (옮길 오브젝트가 없는 경우)"""
+    make_mesh_objects(p)
+    make_cameras(p["C"])
+    make_lights(p["C"])
+    outliner = addon.operators.Outliner_Enhancer
+    outliner.sort_all_objects()
+    start = time.perf_counter()
+    outliner.sort_all_objects()
+    return time.perf_counter() - start
+
+
+def bench_auto_sort_handler_tick(addon, p):
+    """새 오브젝트 자동 정리가 켜진 상태에서 틱마다 카메라 하나를 추가"""
+    objects = make_mesh_objects(dict(p, V=1_000))
+    outliner = addon.operators.Outliner_Enhancer
+    outliner.set_auto_sort(True)
+    mover = objects[0]
+
+    def mutate(tick):
+        mover.location.x += 0.01
+        make_cameras(1)
+
+    try:
+        return measure_handler_ticks(outliner.auto_sort_depsgraph_handler, p["T"], mutate)
+    finally:
+        outliner.set_auto_sort(False)
+
+
+def measure_handler_ticks(handler, ticks, mutate):
+    """depsgraph_update_post 핸들러를 감싸서 틱당 소요 시간을 잽니다"""
+    handlers = bpy.app.handlers.depsgraph_update_post
+    samples = []
+
+    def timed(scene, depsgraph):
+        start = time.perf_counter()
+        handler(scene, depsgraph)
+        samples.append(time.perf_counter() - start)
+
+    index = handlers.index(handler) if handler in handlers else None
+    if index is not None:
+        handlers[index] = timed
+    else:
+        handlers.append(timed)
+    try:
+        for tick in range(ticks):
+            mutate(tick)
+            bpy.context.view_layer.update()
+    finally:
+        if index is not None:
+            handlers[handlers.index(timed)] = handler
+        else:
+            handlers.remove(timed)
+    return sum(samples) / len(samples) if samples else 0.0
+
+
+def bench_boolean_handler_tick(addon, p):
+    host, others = make_boolean_scene(p)
+    mover = others[0]
+
+    def mutate(tick):
+        mover.location.x += 0.01
+
+    return measure_handler_ticks(addon.operators.boolean.boolean_target_update_handler, p["T"], mutate)
+
+
+def bench_boolean_handler_tick_cutter_move(addon, p):
+    host, _ = make_boolean_scene(p)
+    cutter = host.modifiers[0].object
+
+    def mutate(tick):
+        cutter.location.x += 0.01
+
+    return measure_handler_ticks(addon.operators.boolean.boolean_target_update_handler, p["T"], mutate)
+
+
+def bench_camera_handler_tick(addon, p):
+    objects = make_mesh_objects(dict(p, V=1_000))
+    make_cameras(p["C"])
+    mover = objects[0]
+
+    def mutate(tick):
+        mover.location.x += 0.01
+
+    return measure_handler_ticks(addon.operators.camera_quick_settings.on_depsgraph_update_post, p["T"], mutate)
+
+
+def bench_camera_cycle(addon, p):
+    """다음 카메라 T 번 (카메라 C 개, 메시 N 개 씬) - 1회 평균"""
+    make_mesh_objects(dict(p, V=1_000))
+    make_cameras(p["C"])
+    op_cls = addon.operators.camera_quick_settings.VIEW3D_OT_camera_select_next
+    start = time.perf_counter()
+    for _ in range(p["T"]):
+        run_operator(op_cls)
+    return (time.perf_counter() - start) / p["T"]
+
+
+def bench_camera_profile_switch(addon, p):
+    """렌더 프로필이 있는 카메라 사이를 전환하며 핸들러 틱 측정 (절반은 같은 프로필)"""
+    make_mesh_objects(dict(p, V=1_000))
+    cameras = make_cameras(p["C"])
+    for i, cam in enumerate(cameras):
+        profile = cam.camera_render_profile
+        profile.use_frame_range = profile.use_percentage = profile.use_output_path = True
+        profile.frame_start, profile.frame_end = 1, 100 + (i % 2) * 50
+        profile.resolution_percentage = 100
+        profile.filepath = "//render/"
+    camera_module = addon.operators.camera_quick_settings
+
+    def mutate(tick):
+        camera_module.step_camera(bpy.context.scene, 1)
+
+    return measure_handler_ticks(camera_module.on_depsgraph_update_post, p["T"], mutate)
+
+
+class RecordingLayout:
+    """UILayout 대역. 파이 draw 의 파이썬 쪽 비용만 잽니다"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def _child(self, *args, **kwargs):
+        self.calls += 1
+        return self
+
+    menu_pie = grid_flow = separator = label = _child
+
+    def operator(self, *args, **kwargs):
+        self.calls += 1
+        return types.SimpleNamespace()
+
+
+PIE_DRAWS = 200
+
+
+def _time_pie_draws(pie_pivot, invalidate):
+    menu = types.SimpleNamespace(layout=RecordingLayout())
+    start = time.perf_counter()
+    for _ in range(PIE_DRAWS):
+        if invalidate:
+            pie_pivot.invalidate_pie_layout()
+        pie_pivot.PIE_MT_pivot_pie.draw(menu, bpy.context)
+    return (time.perf_counter() - start) / PIE_DRAWS
+
+
+def bench_pie_draw_cold(addon, p):
+    """레이아웃 캐시 없이 파이를 한 번 그리는 시간 (파이를 여는 순간)"""
+    return _time_pie_draws(addon.operators.pie_pivot, invalidate=True)
+
+
+def bench_pie_draw_warm(addon, p):
+    """파이가 열린 상태에서 마우스 이동마다 다시 그리는 시간"""
+    return _time_pie_draws(addon.operators.pie_pivot, invalidate=False)
+
+
+def bench_addon_register(addon, p):
+    """애드온 재등록 시간 (시작 시간 비교용, 씬 크기와 무관)"""
+    addon.unregister()
+    start = time.perf_counter()
+    addon.register()
+    return time.perf_counter() - start
+
+
+CASES = [
+    bench_addon_register,
+    bench_pie_draw_cold,
+    bench_pie_draw_warm,
+    bench_apply_all_common_modifiers,
+    bench_mirror_apply,
+    bench_mirror_apply_shared,
+    bench_origin_to_bottom,
+    bench_origin_to_bottom_shared,
+    bench_group_by_empty,
+    bench_ungroup_empty,
+    bench_move_bottom_to_z0,
+    bench_move_bottom_to_z0_evaluated,
+    bench_rotational_array,
+    bench_rotational_array_apply_transforms,
+    bench_rotational_array_instances,
+    bench_sort_all,
+    bench_sort_all_sorted,
+    bench_auto_sort_handler_tick,
+    bench_boolean_handler_tick,
+    bench_boolean_handler_tick_cutter_move,
+    bench_camera_handler_tick,
+    bench_camera_cycle,
+    bench_camera_profile_switch,
+]
+
+
+# ─────────────────────────────────────────────
+# 실행 / 결과
+# ─────────────────────────────────────────────
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Modifier Pie Kit benchmark")
+    parser.add_argument("--scales", default="small,medium", help="쉼표로 구분: " + ",".join(SCALES))
+    parser.add_argument("--cases", default="", help="실행할 케이스 이름 일부 (쉼표 구분, 비우면 전체)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="bench_output.json")
+    parser.add_argument("--compare", default="", help="비교할 이전 결과 JSON")
+    return parser.parse_args(argv)
+
+
+def run_case(addon, case, scale_name, params, repeat):
+    times = []
+    error = None
+    for _ in range(repeat):
+        reset_scene()
+        try:
+            times.append(case(addon, params))
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            break
+    name = case.__name__[len("bench_"):]
+    result = {"case": name, "scale": scale_name, "params": params, "times": times}
+    if times:
+        result.update(min=min(times), median=statistics.median(times), max=max(times))
+    if error:
+        result["error"] = error
+    status = f"{result['median'] * 1000:10.2f} ms" if times else f"ERROR {error}"
+    print(f"{name:40s} {scale_name:8s} {status}")
+    return result
+
+
+def compare(results, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["case"], r["scale"]): r for r in json.load(f)["results"]}
+    print("\ncase                                     scale      baseline        current    ratio")
+    for r in results:
+        old = baseline.get((r["case"], r["scale"]))
+        if not old or "median" not in old or "median" not in r:
+            continue
+        ratio = r["median"] / old["median"] if old["median"] else float("inf")
+        flag = "  << slower" if ratio > 1.2 else ""
+        print(f"{r['case']:40s} {r['scale']:8s} {old['median'] * 1000:10.2f} ms {r['median'] * 1000:10.2f} ms {ratio:6.2f}x{flag}")
+
+
+def main():
+    args = parse_args()
+    addon = enable_addon()
+    selected = [c for c in CASES if not args.cases or any(k in c.__name__ for k in args.cases.split(","))]
+
+    results = []
+    for scale_name in args.scales.split(","):
+        params = SCALES[scale_name]
+        for case in selected:
+            results.append(run_case(addon, case, scale_name, params, args.repeat))
+
+    output = {
+        "addon_version": ".".join(map(str, getattr(addon, "bl_info", {}).get("version", ()))),
+        "blender_version": bpy.app.version_string,
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+    print(f"\nwrote {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
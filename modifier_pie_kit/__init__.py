@@ -1,7 +1,11 @@
 import bpy
+import time
 from . import preferences
 from . import ui
 from .operators import register as register_ops, unregister as unregister_ops
+from .log import get_logger
+
+logger = get_logger(__name__)
 
 bl_info = {
     "name": "Modifier Pie Kit",
@@ -14,9 +18,11 @@ bl_info = {
 }
 
 def register():
+    start = time.perf_counter()
     register_ops()
     ui.register()
     preferences.register()
+    logger.info("애드온 등록 완료 %.1f ms", (time.perf_counter() - start) * 1000)
 
 def unregister():
     preferences.unregister()
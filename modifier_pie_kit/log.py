@@ -0,0 +1,78 @@
+import bpy
+import logging
+from collections import deque
+
+# ─────────────────────────────────────────────
+# 애드온 공용 로거
+# ─────────────────────────────────────────────
+# print() 대신 사용합니다. 메시지는 %-포맷 인자로 넘겨서 레벨이 꺼져 있으면 문자열을 만들지 않습니다.
+#   logger = get_logger(__name__)
+#   logger.debug("모디파이어 적용: %s", mod.name)
+
+LOGGER_NAME = "modifier_pie_kit"
+LOG_LEVELS = [
+    ('DEBUG', "Debug", "모든 세부 로그 (느릴 수 있음)"),
+    ('INFO', "Info", "일반 진행 상황"),
+    ('WARNING', "Warning", "경고와 오류만"),
+    ('ERROR', "Error", "오류만"),
+]
+DEFAULT_LEVEL = 'WARNING'
+RING_BUFFER_SIZE = 1000
+
+_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+
+class RingBufferHandler(logging.Handler):
+    """최근 로그를 메모리에 보관하는 핸들러 (블렌더 안에서 확인용)"""
+
+    def __init__(self, capacity=RING_BUFFER_SIZE):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        try:
+            self.records.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    def lines(self):
+        return list(self.records)
+
+    def clear(self):
+        self.records.clear()
+
+
+_root = logging.getLogger(LOGGER_NAME)
+ring_buffer = RingBufferHandler()
+
+if not _root.handlers:
+    _root.setLevel(DEFAULT_LEVEL)
+    _root.propagate = False
+    _formatter = logging.Formatter(_FORMAT, datefmt="%H:%M:%S")
+    _console = logging.StreamHandler()
+    _console.setFormatter(_formatter)
+    ring_buffer.setFormatter(_formatter)
+    _root.addHandler(_console)
+    _root.addHandler(ring_buffer)
+else:
+    # 모듈 리로드 시 기존 링 버퍼를 그대로 사용
+    ring_buffer = next((h for h in _root.handlers if isinstance(h, RingBufferHandler)), ring_buffer)
+
+
+def get_logger(name):
+    """모듈 이름(__name__)으로 애드온 하위 로거를 반환"""
+    return _root.getChild(name.rsplit('.', 1)[-1])
+
+
+def set_level(level):
+    _root.setLevel(level)
+
+
+def apply_preferences(prefs=None):
+    """ModifierPiePreferences.log_level 을 로거에 반영"""
+    if prefs is None:
+        try:
+            prefs = bpy.context.preferences.addons[LOGGER_NAME].preferences
+        except (KeyError, AttributeError):
+            return
+    set_level(getattr(prefs, "log_level", DEFAULT_LEVEL))
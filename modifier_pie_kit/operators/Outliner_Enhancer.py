@@ -1,45 +1,211 @@
 # 파일 이름: Outliner_Enhancer.py
 
 import bpy
+import time
 from bpy.app.handlers import persistent
+from ..log import get_logger
+from ..profiling import profiled
+
+logger = get_logger(__name__)
 
 # --- 전역 변수 ---
 _owner_id = object()
 _previous_active = None
 
-# --- 자동 포커스 로직 (변경 없음) ---
+# ─────────────────────────────────────────────
+# 자동 포커스 (디바운스)
+# ─────────────────────────────────────────────
+# 활성 오브젝트가 연달아 바뀌면(박스 선택, 스크립트 순회) 마지막 변경 후 FOCUS_DEBOUNCE 초가 지나서
+# 한 번만 show_active 를 실행합니다. 아웃라이너 영역/리전은 스크린별로 캐시하고,
+# 스크린이 바뀌거나 영역 구성(영역 포인터 집합)이 달라지면 다시 찾습니다. 열려 있는 모든 창의 아웃라이너에 적용됩니다.
+
+FOCUS_DEBOUNCE = 0.15
+
+_focus_state = {"last_change": 0.0}
+# 스크린 포인터 → (영역 포인터 집합, [(영역 포인터, 리전 포인터), ...])
+# 해제된 영역을 역참조하지 않도록 구조체가 아닌 포인터만 보관하고, 매번 현재 screen.areas 에서 다시 꺼냅니다.
+_outliner_cache = {}
+
+def invalidate_outliner_cache(*args):
+    _outliner_cache.clear()
+
+def _scan_outliners(areas):
+    outliners = []
+    for area in areas.values():
+        if area.type != 'OUTLINER': continue
+        region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+        if region: outliners.append((area, region))
+    return outliners
+
+def find_outliners(screen):
+    """screen 안의 (OUTLINER 영역, WINDOW 리전) 목록 (캐시 사용)"""
+    key = screen.as_pointer()
+    areas = {area.as_pointer(): area for area in screen.areas}
+    signature = frozenset(areas)
+    cached = _outliner_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        result = []
+        for area_ptr, region_ptr in cached[1]:
+            area = areas[area_ptr]
+            region = next((r for r in area.regions if r.as_pointer() == region_ptr), None)
+            # 같은 주소에 다른 영역이 생겼을 수도 있으니 현재 구조체로 종류를 확인
+            if region is None or area.type != 'OUTLINER': break
+            result.append((area, region))
+        else:
+            return result
+    outliners = _scan_outliners(areas)
+    _outliner_cache[key] = (signature, [(area.as_pointer(), region.as_pointer()) for area, region in outliners])
+    return outliners
+
 def focus_on_active_object():
-    outliner_area = next((area for area in bpy.context.screen.areas if area.type == 'OUTLINER'), None)
-    if not outliner_area: return
-    outliner_region = next((region for region in outliner_area.regions if region.type == 'WINDOW'), None)
-    if not outliner_region: return
-    with bpy.context.temp_override(area=outliner_area, region=outliner_region):
-        bpy.ops.outliner.show_active()
+    live_screens = set()
+    for window in bpy.context.window_manager.windows:
+        screen = window.screen
+        if screen is None: continue
+        live_screens.add(screen.as_pointer())
+        for area, region in find_outliners(screen):
+            try:
+                with bpy.context.temp_override(window=window, screen=screen, area=area, region=region):
+                    bpy.ops.outliner.show_active()
+            except (RuntimeError, ReferenceError) as e:
+                logger.debug("아웃라이너 포커스 실패: %s", e); invalidate_outliner_cache()
+    # 닫힌 창/임시 스크린 항목 정리
+    for key in [key for key in _outliner_cache if key not in live_screens]:
+        del _outliner_cache[key]
+
+def _run_pending_focus():
+    remaining = FOCUS_DEBOUNCE - (time.perf_counter() - _focus_state["last_change"])
+    if remaining > 0: return remaining
+    try: focus_on_active_object()
+    except Exception as e: logger.warning("Focus error: %s", e)
+    return None
+
+def schedule_focus():
+    _focus_state["last_change"] = time.perf_counter()
+    if not bpy.app.timers.is_registered(_run_pending_focus):
+        bpy.app.timers.register(_run_pending_focus, first_interval=FOCUS_DEBOUNCE)
 
+@profiled("outliner.msgbus_active")
 def on_active_object_change(*args):
     global _previous_active
     if not hasattr(bpy.context, "active_object"): return
     active_obj = bpy.context.active_object
     if not active_obj or active_obj == _previous_active: return
     _previous_active = active_obj
-    focus_on_active_object()
+    schedule_focus()
 
 # --- 콜렉션 정리 및 닫기 로직 (변경 없음) ---
-def collapse_all_hierarchies():
+# ─────────────────────────────────────────────
+# 계층 접기
+# ─────────────────────────────────────────────
+# 파이썬 API 로는 아웃라이너 항목의 열림 상태를 읽거나 쓸 수 없어서, show_one_level(open=False) 를
+# 반복합니다. 트리가 더 이상 바뀌지 않는지도 확인할 수 없으므로, 씬 데이터로 트리 깊이(상한)를 계산해
+# 그만큼만 실행하되 기존 고정 횟수(FALLBACK_PASSES)를 넘지는 않습니다.
+
+# 오브젝트 아래 항목 깊이: 모디파이어/컨스트레인트 그룹 → 항목 → 참조 ID(타겟, GN 노드 그룹) → 그 하위
+OBJECT_SUBTREE_DEPTH = 4
+# 아마추어: 아마추어 데이터/포즈 한 단계 + 본 계층 + 본 컨스트레인트 그룹 → 컨스트레인트
+ARMATURE_EXTRA_DEPTH = 3
+# 기존 고정 접기 횟수. 계산한 깊이의 상한이자, 뷰 레이어/씬 이외 표시 모드의 기본값
+FALLBACK_PASSES = 10
+
+def layer_collection_depth(layer_coll):
+    """layer_coll 자신을 포함한 컬렉션 계층 깊이"""
+    deepest = 0; stack = [(layer_coll, 1)]
+    while stack:
+        coll, depth = stack.pop()
+        deepest = max(deepest, depth)
+        stack.extend((child, depth + 1) for child in coll.children)
+    return deepest
+
+def chain_depths(items, parent_of):
+    """항목별 부모 체인 길이 {항목: 깊이}. 재귀 없이 계산 (아주 긴 체인도 안전)"""
+    depths = {}
+    for item in items:
+        path = []; node = item
+        while node is not None and node not in depths:
+            path.append(node); node = parent_of(node)
+        depth = depths[node] if node is not None else 0
+        for node in reversed(path):
+            depth += 1; depths[node] = depth
+    return depths
+
+def object_subtree_depth(obj, bone_depths):
+    """오브젝트 행 아래 트리 깊이. 아마추어는 본 계층만큼 더 깊어짐 (bone_depths 는 아마추어 데이터별 캐시)"""
+    if obj.type != 'ARMATURE' or obj.data is None: return OBJECT_SUBTREE_DEPTH
+    bones = bone_depths.get(obj.data)
+    if bones is None:
+        bones = bone_depths[obj.data] = max(chain_depths(obj.data.bones, lambda bone: bone.parent).values(), default=0)
+    return max(OBJECT_SUBTREE_DEPTH, bones + ARMATURE_EXTRA_DEPTH)
+
+def find_layer_collection_path(root, target):
+    """root 에서 target 까지의 LayerCollection 경로 (없으면 None)"""
+    if root == target: return [root]
+    for child in root.children:
+        path = find_layer_collection_path(child, target)
+        if path: return [root] + path
+    return None
+
+def outliner_tree_depth(space, view_layer, root=None):
+    """아웃라이너 트리가 가질 수 있는 최대 깊이. 컬렉션 깊이 + 오브젝트별 (부모 체인 + 하위 항목/본 계층) 중 최대"""
+    if space.display_mode not in {'VIEW_LAYER', 'SCENES'}: return FALLBACK_PASSES
+    root = root or view_layer.layer_collection
+    depth = layer_collection_depth(root)
+    objects = root.collection.all_objects
+    if objects:
+        parents = chain_depths(objects, lambda obj: obj.parent) if space.use_filter_children else None
+        bone_depths = {}
+        depth += max((parents[obj] if parents else 1) + object_subtree_depth(obj, bone_depths) for obj in objects)
+    if space.display_mode == 'SCENES': depth += 1
+    return depth
+
+def collapse_all_hierarchies(passes=FALLBACK_PASSES):
+    """가장 깊은 단계부터 passes 번 접고 실제 실행 횟수를 반환"""
+    done = 0
     try:
-        for _ in range(10): bpy.ops.outliner.show_one_level(open=False)
+        for _ in range(passes): bpy.ops.outliner.show_one_level(open=False); done += 1
     except RuntimeError: pass
+    return done
 COLLECTION_MAP = {'CAMERA': "Cameras", 'LIGHT': "Lighting", 'EMPTY_IMAGE': "Images", 'LINEART': "LineArt"}
+# 오브젝트 타입만으로 대상이 정해지는 경우 (나머지 타입은 이름/표시 방식까지 확인)
+TYPE_TARGETS = {'CAMERA': COLLECTION_MAP['CAMERA'], 'LIGHT': COLLECTION_MAP['LIGHT']}
+
+# 컬렉션 이름 → bpy 컬렉션 (삭제/이름 변경되면 다시 찾음)
+_collection_cache = {}
+
+def get_cached_collection(name):
+    coll = _collection_cache.get(name)
+    if coll is not None:
+        try:
+            if coll.name == name: return coll
+        except ReferenceError: pass
+    coll = bpy.data.collections.get(name)
+    if coll is None: _collection_cache.pop(name, None)
+    else: _collection_cache[name] = coll
+    return coll
+
 def ensure_collection(name):
-    if name not in bpy.data.collections:
-        col = bpy.data.collections.new(name); bpy.context.scene.collection.children.link(col)
-        if name == COLLECTION_MAP['CAMERA']: col.color_tag = 'COLOR_01'
-        col["auto_sort_generated"] = True
-    return bpy.data.collections[name]
-def move_to_collection(obj, target_coll_name):
+    coll = get_cached_collection(name)
+    if coll is None:
+        coll = bpy.data.collections.new(name); bpy.context.scene.collection.children.link(coll)
+        if name == COLLECTION_MAP['CAMERA']: coll.color_tag = 'COLOR_01'
+        coll["auto_sort_generated"] = True
+        _collection_cache[name] = coll
+    return coll
+def move_to_collection(obj, target_coll_name, touched=None):
+    """대상 컬렉션으로 옮김. 이미 그 컬렉션에만 있으면 아무것도 하지 않고 False 를 반환"""
     try:
-        target_coll = ensure_collection(target_coll_name); [coll.objects.unlink(obj) for coll in list(obj.users_collection)]; target_coll.objects.link(obj)
-    except Exception as e: print(f"[Outliner Enhancer] Move error: {e}")
+        users = obj.users_collection
+        if len(users) == 1 and users[0].name == target_coll_name: return False
+        target_coll = ensure_collection(target_coll_name)
+        for coll in users:
+            if coll != target_coll:
+                coll.objects.unlink(obj)
+                if touched is not None: touched.add(coll.name)
+        if target_coll not in users: target_coll.objects.link(obj)
+        return True
+    except Exception as e: logger.warning("Move error: %s", e)
+    return False
 def is_lineart_object(obj):
     try:
         if "lineart" in obj.name.lower() or "라인아트" in obj.name.lower(): return True
@@ -48,41 +214,173 @@ def is_lineart_object(obj):
 def is_image_empty(obj):
     try: return obj.type == 'EMPTY' and obj.empty_display_type == 'IMAGE' and obj.data is not None
     except: return False
-def auto_sort_new_object(obj):
+def sort_target(obj):
+    """오브젝트가 들어가야 할 컬렉션 이름 (정리 대상이 아니면 None)"""
+    target = TYPE_TARGETS.get(obj.type)
+    if target: return target
+    if is_image_empty(obj): return COLLECTION_MAP['EMPTY_IMAGE']
+    if is_lineart_object(obj): return COLLECTION_MAP['LINEART']
+    return None
+def auto_sort_new_object(obj, touched=None):
     try:
-        if obj.type == 'CAMERA': move_to_collection(obj, COLLECTION_MAP['CAMERA'])
-        elif obj.type == 'LIGHT': move_to_collection(obj, COLLECTION_MAP['LIGHT'])
-        elif is_image_empty(obj): move_to_collection(obj, COLLECTION_MAP['EMPTY_IMAGE'])
-        elif is_lineart_object(obj): move_to_collection(obj, COLLECTION_MAP['LINEART'])
-    except Exception as e: print(f"[Outliner Enhancer] Sort error: {e}")
+        target = sort_target(obj)
+        if target: return move_to_collection(obj, target, touched)
+    except Exception as e: logger.warning("Sort error: %s", e)
+    return False
+def sort_objects(objects, full_cleanup=False):
+    """objects 를 정리하고 옮긴 개수를 반환. 옮긴 게 없으면 컬렉션 재정렬/정리도 건너뜀"""
+    touched = set(); moved = 0
+    for obj in objects:
+        if auto_sort_new_object(obj, touched): moved += 1
+    if moved: move_collections_to_ordered_positions()
+    if full_cleanup: remove_empty_collections()
+    elif touched: remove_empty_collections(touched)
+    return moved
 def sort_all_objects():
-    try:
-        [auto_sort_new_object(obj) for obj in bpy.context.scene.objects]; move_collections_to_ordered_positions(); remove_empty_collections()
-    except Exception as e: print(f"[Outliner Enhancer] Sort all error: {e}")
+    try: return sort_objects(bpy.context.scene.objects, full_cleanup=True)
+    except Exception as e: logger.warning("Sort all error: %s", e)
+    return 0
 def move_collections_to_ordered_positions():
     try:
         scene_col = bpy.context.scene.collection; order = list(COLLECTION_MAP.values()); existing = [scene_col.children.get(n) for n in order if scene_col.children.get(n)]
+        # 이미 순서대로 맨 뒤에 있으면 unlink/link 를 반복하지 않음
+        if not existing or list(scene_col.children)[-len(existing):] == existing: return
         for col in existing: scene_col.children.unlink(col); scene_col.children.link(col)
-    except Exception as e: print(f"[Outliner Enhancer] Reorder error: {e}")
-def remove_empty_collections():
+    except Exception as e: logger.warning("Reorder error: %s", e)
+def remove_empty_collections(names=None):
+    """names 가 주어지면 그 컬렉션만 검사 (증분 정리용)"""
     try:
-        for coll in list(bpy.data.collections):
+        candidates = list(bpy.data.collections) if names is None else [c for c in map(bpy.data.collections.get, names) if c]
+        for coll in candidates:
             is_addon_coll = coll.get("auto_sort_generated") or coll.name.startswith("SKP ")
-            if not coll.objects and not coll.children and coll.name != "Collection" and is_addon_coll and coll.users <= 1: bpy.data.collections.remove(coll)
-    except Exception as e: print(f"[Outliner Enhancer] Remove empty error: {e}")
+            if not coll.objects and not coll.children and coll.name != "Collection" and is_addon_coll and coll.users <= 1:
+                _collection_cache.pop(coll.name, None); bpy.data.collections.remove(coll)
+    except Exception as e: logger.warning("Remove empty error: %s", e)
+
+# ─────────────────────────────────────────────
+# 새 오브젝트 자동 정리 (백그라운드)
+# ─────────────────────────────────────────────
+# depsgraph 업데이트에서 처음 보는 오브젝트만 대기열에 넣고, 타이머가 틱마다 SORT_BATCH_SIZE 개씩 정리합니다.
+# 정리하면서 생기는 업데이트는 이미 아는 오브젝트라 다시 들어오지 않습니다.
+# 이름이 아닌 session_uid 로 추적하므로, 이름을 바꾼 오브젝트는 새 오브젝트로 보지 않고
+# 지웠다가 같은 이름으로 다시 만든 오브젝트는 새 오브젝트로 봅니다.
+
+SORT_BATCH_SIZE = 200
+SORT_INTERVAL = 0.1
+
+_auto_sort = {"enabled": False}
+# 이미 본 오브젝트의 session_uid
+_known_objects = set()
+# (session_uid, 이름 힌트)
+_pending_sort = []
+
+def rebuild_known_objects():
+    _known_objects.clear()
+    _known_objects.update(obj.session_uid for obj in bpy.data.objects)
+
+def prune_known_objects():
+    """삭제된 오브젝트가 많이 쌓였으면 현재 오브젝트로 다시 만듦"""
+    if len(_known_objects) > len(bpy.data.objects) + SORT_BATCH_SIZE:
+        rebuild_known_objects()
+
+def resolve_pending(entries):
+    """(uid, 이름 힌트) 목록 → 오브젝트 목록. 이름이 바뀐 것만 한 번에 전체에서 찾음"""
+    objects, missing = [], set()
+    for uid, name in entries:
+        obj = bpy.data.objects.get(name)
+        if obj is not None and obj.session_uid == uid: objects.append(obj)
+        else: missing.add(uid)
+    if missing:
+        objects.extend(obj for obj in bpy.data.objects if obj.session_uid in missing)
+    return objects
+
+@persistent
+@profiled("outliner.depsgraph_update_post")
+def auto_sort_depsgraph_handler(scene, depsgraph):
+    if not depsgraph.id_type_updated('OBJECT'): return
+    for update in depsgraph.updates:
+        obj = update.id
+        if not isinstance(obj, bpy.types.Object): continue
+        obj = obj.original; uid = obj.session_uid
+        if uid in _known_objects: continue
+        _known_objects.add(uid); _pending_sort.append((uid, obj.name))
+    if _pending_sort and not bpy.app.timers.is_registered(_process_pending_sort):
+        bpy.app.timers.register(_process_pending_sort, first_interval=SORT_INTERVAL)
+
+@persistent
+@profiled("outliner.undo_post")
+def auto_sort_undo_handler(*args):
+    """언두/리두로 되살아난 오브젝트는 새 오브젝트가 아니므로 현재 상태를 모두 아는 것으로 처리"""
+    _pending_sort.clear()
+    rebuild_known_objects()
+
+def _process_pending_sort():
+    if not _pending_sort or not _auto_sort["enabled"]: return None
+    batch = _pending_sort[:SORT_BATCH_SIZE]; del _pending_sort[:SORT_BATCH_SIZE]
+    scene_objects = bpy.context.scene.objects
+    objects = [obj for obj in resolve_pending(batch) if obj.name in scene_objects]
+    try:
+        moved = sort_objects(objects)
+        if moved: logger.debug("새 오브젝트 %d개 자동 정리", moved)
+    except Exception as e: logger.warning("Auto sort error: %s", e)
+    if _pending_sort: return SORT_INTERVAL
+    prune_known_objects()
+    return None
+
+def set_auto_sort(enabled):
+    _auto_sort["enabled"] = bool(enabled)
+    _pending_sort.clear()
+    if bpy.app.timers.is_registered(_process_pending_sort): bpy.app.timers.unregister(_process_pending_sort)
+    if enabled:
+        rebuild_known_objects()
+        if auto_sort_depsgraph_handler not in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.append(auto_sort_depsgraph_handler)
+        for handler_list in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+            if auto_sort_undo_handler not in handler_list: handler_list.append(auto_sort_undo_handler)
+    else:
+        _known_objects.clear()
+        if auto_sort_depsgraph_handler in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.remove(auto_sort_depsgraph_handler)
+        for handler_list in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+            if auto_sort_undo_handler in handler_list: handler_list.remove(auto_sort_undo_handler)
+    logger.info("새 오브젝트 자동 정리 %s", "켜짐" if enabled else "꺼짐")
+
+def apply_auto_sort_preferences(prefs=None):
+    if prefs is None:
+        try: prefs = bpy.context.preferences.addons["modifier_pie_kit"].preferences
+        except (KeyError, AttributeError): return
+    set_auto_sort(prefs.use_collection_sorting and prefs.use_auto_sort_new_objects)
 
 # --- Operators (변경 없음) ---
 class OUTLINER_ENHANCER_OT_sort_all(bpy.types.Operator):
     bl_idname = "outliner_enhancer.sort_all"; bl_label = "컬렉션 정리"; bl_description = "카메라, 조명 등을 지정된 컬렉션으로 자동 정렬합니다"; bl_options = {'REGISTER', 'UNDO'}
-    def execute(self, context): sort_all_objects(); self.report({'INFO'}, "콜렉션 정리 완료"); return {'FINISHED'}
+    def execute(self, context):
+        start = time.perf_counter(); moved = sort_all_objects()
+        self.report({'INFO'}, f"콜렉션 정리 완료: {moved}개 이동 ({(time.perf_counter() - start) * 1000:.0f} ms)"); return {'FINISHED'}
 class OUTLINER_ENHANCER_OT_collapse_all(bpy.types.Operator):
-    bl_idname = "outliner_enhancer.collapse_all"; bl_label = "컬렉션 닫기"; bl_description = "아웃라이너의 모든 계층을 접습니다"; bl_options = {'REGISTER', 'UNDO'}
+    bl_idname = "outliner_enhancer.collapse_all"; bl_label = "컬렉션 닫기"; bl_description = "아웃라이너의 모든 계층을 접습니다. Ctrl+클릭: 활성 컬렉션 깊이보다 깊은 단계만 접습니다"; bl_options = {'REGISTER', 'UNDO'}
+    below_active_level: bpy.props.BoolProperty(name="활성 컬렉션 깊이 아래만", description="활성 컬렉션의 깊이까지는 모든 가지를 열어 두고 그보다 깊은 단계만 접습니다", default=False, options={'SKIP_SAVE'})
+    def invoke(self, context, event):
+        self.below_active_level = event.ctrl
+        return self.execute(context)
     def execute(self, context):
-        area = next((a for a in context.screen.areas if a.type == 'OUTLINER'), None)
-        if area:
-            region = next((r for r in area.regions if r.type == 'WINDOW'), None)
-            if region:
-                with context.temp_override(area=area, region=region): collapse_all_hierarchies()
+        if context.area and context.area.type == 'OUTLINER':
+            area = context.area; region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+        else:
+            area, region = next(iter(find_outliners(context.screen)), (None, None))
+        if not area or not region:
+            self.report({'WARNING'}, "아웃라이너를 찾을 수 없습니다"); return {'CANCELLED'}
+        start = time.perf_counter()
+        view_layer = context.view_layer; space = area.spaces.active
+        depth = outliner_tree_depth(space, view_layer)
+        keep = 0
+        if self.below_active_level:
+            # show_one_level 은 트리 전체에 단계 단위로 동작하므로, 다른 가지도 같은 깊이까지 열린 채로 남음
+            path = find_layer_collection_path(view_layer.layer_collection, view_layer.active_layer_collection)
+            keep = len(path) if path else 0
+        passes = min(max(depth - keep, 0), FALLBACK_PASSES)
+        with context.temp_override(area=area, region=region): passes = collapse_all_hierarchies(passes)
+        self.report({'INFO'}, f"{passes}단계 접기 완료 ({(time.perf_counter() - start) * 1000:.0f} ms)")
         return {'FINISHED'}
 
 # --- UI 및 등록/해제 ---
@@ -98,8 +396,12 @@ classes = (OUTLINER_ENHANCER_OT_sort_all, OUTLINER_ENHANCER_OT_collapse_all)
 
 # `reinitialize_handler` 함수 자체는 이전과 동일합니다.
 @persistent
+@profiled("outliner.load_post")
 def reinitialize_handler(is_enabled):
     global _previous_active; _previous_active = None
+    _collection_cache.clear(); invalidate_outliner_cache()
+    if bpy.app.timers.is_registered(_run_pending_focus): bpy.app.timers.unregister(_run_pending_focus)
+    if not isinstance(is_enabled, bool): apply_auto_sort_preferences()
     bpy.msgbus.clear_by_owner(_owner_id)
     if not isinstance(is_enabled, bool):
         try:
@@ -108,11 +410,13 @@ def reinitialize_handler(is_enabled):
         except (KeyError, AttributeError):
             is_enabled = False
     if not is_enabled:
-        print("[Outliner Enhancer] 자동 포커스 기능이 비활성화 상태입니다.")
+        logger.info("자동 포커스 기능이 비활성화 상태입니다.")
         return
     subscribe_to = (bpy.types.LayerObjects, "active")
     bpy.msgbus.subscribe_rna(key=subscribe_to, owner=_owner_id, args=(), notify=on_active_object_change)
-    print("[Outliner Enhancer] 자동 포커스 핸들러가 활성화되었습니다.")
+    for prop in ("screen", "workspace"):
+        bpy.msgbus.subscribe_rna(key=(bpy.types.Window, prop), owner=_owner_id, args=(), notify=invalidate_outliner_cache)
+    logger.info("자동 포커스 핸들러가 활성화되었습니다.")
 
 # ▼▼▼ 이 부분이 수정되었습니다 ▼▼▼
 def register():
@@ -122,15 +426,18 @@ def register():
     # 다른 파일(preferences.py)에서 이 함수를 쉽게 찾을 수 있도록
     # 블렌더의 Scene 타입에 함수 참조를 저장합니다.
     bpy.types.Scene.outliner_enhancer_reinit_handler = reinitialize_handler
+    bpy.types.Scene.outliner_enhancer_apply_auto_sort = apply_auto_sort_preferences
     
     bpy.types.OUTLINER_HT_header.prepend(custom_outliner_buttons_draw)
     if reinitialize_handler not in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.append(reinitialize_handler)
     bpy.app.timers.register(lambda: reinitialize_handler(None), first_interval=0.1)
-    print("[Outliner Enhancer] 모듈이 등록되었습니다.")
+    logger.debug("모듈이 등록되었습니다.")
 
 def unregister():
     bpy.msgbus.clear_by_owner(_owner_id)
+    set_auto_sort(False); _collection_cache.clear(); invalidate_outliner_cache()
+    if bpy.app.timers.is_registered(_run_pending_focus): bpy.app.timers.unregister(_run_pending_focus)
     if reinitialize_handler in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(reinitialize_handler)
     bpy.types.OUTLINER_HT_header.remove(custom_outliner_buttons_draw)
@@ -140,6 +447,8 @@ def unregister():
     # 애드온이 비활성화될 때 Scene에 저장했던 함수 참조를 깨끗하게 삭제합니다.
     if hasattr(bpy.types.Scene, "outliner_enhancer_reinit_handler"):
         del bpy.types.Scene.outliner_enhancer_reinit_handler
+    if hasattr(bpy.types.Scene, "outliner_enhancer_apply_auto_sort"):
+        del bpy.types.Scene.outliner_enhancer_apply_auto_sort
         
-    print("[Outliner Enhancer] 모듈이 해제되었습니다.")
+    logger.debug("모듈이 해제되었습니다.")
 # ▲▲▲ 수정 완료 ▲▲▲
\ No newline at end of file
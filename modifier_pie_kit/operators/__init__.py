@@ -1,37 +1,71 @@
 import importlib
+import os
+import time
 
+import bpy
+from ..log import get_logger
 
-from . import grouping
-from . import popup_modifiers
-from . import popup_pivot
-from . import pie_pivot
-from . import boolean
-from . import array_modifier_popup
-from . import clean_view
-from . import camera_quick_settings
-from . import Outliner_Enhancer
-
-modules = [
-    grouping,
-    popup_modifiers,
-    popup_pivot,
-    pie_pivot,
-    boolean,    
-    array_modifier_popup,
-    clean_view,
-    camera_quick_settings,
-    Outliner_Enhancer,
+logger = get_logger(__name__)
+
+# 등록 순서대로 나열합니다. 파일이 없는 모듈(선택 기능)은 경고만 남기고 건너뜁니다.
+module_names = [
+    "grouping",
+    "popup_modifiers",
+    "popup_pivot",
+    "pie_pivot",
+    "boolean",
+    "array_modifier_popup",
+    "clean_view",
+    "camera_quick_settings",
+    "Outliner_Enhancer",
+    "popup_session",
 ]
 
-def register():  
-    for mod in modules:
-        importlib.reload(mod)
-        
+modules = []
+
+# 마지막 등록에 걸린 시간 (초) - 시작 시간 측정용
+startup_times = {"import": 0.0, "register": 0.0, "modules": {}}
+
+
+def is_dev_mode():
+    """MODIFIER_PIE_KIT_DEV 환경 변수나 --debug-python 으로 실행했을 때만 모듈을 리로드합니다"""
+    return bool(os.environ.get("MODIFIER_PIE_KIT_DEV")) or bpy.app.debug_python
+
+
+def load_modules():
+    loaded = []
+    reload = is_dev_mode()
+    for name in module_names:
+        full_name = f"{__name__}.{name}"
+        try:
+            mod = importlib.import_module(full_name)
+        except ModuleNotFoundError as e:
+            if e.name != full_name:
+                raise
+            logger.warning("모듈을 찾을 수 없어 건너뜁니다: %s", name)
+            continue
+        if reload:
+            mod = importlib.reload(mod)
+        loaded.append(mod)
+    return loaded
+
+
+def register():
+    start = time.perf_counter()
+    modules[:] = load_modules()
+    startup_times["import"] = time.perf_counter() - start
+
+    startup_times["modules"].clear()
     for mod in modules:
         if hasattr(mod, 'register'):
+            mod_start = time.perf_counter()
             mod.register()
-            
-def unregister(): 
+            startup_times["modules"][mod.__name__.rsplit('.', 1)[-1]] = time.perf_counter() - mod_start
+    startup_times["register"] = time.perf_counter() - start
+    logger.info("오퍼레이터 등록 %.1f ms (import %.1f ms)", startup_times["register"] * 1000, startup_times["import"] * 1000)
+
+
+def unregister():
     for mod in reversed(modules):
         if hasattr(mod, 'unregister'):
-            mod.unregister()
\ No newline at end of file
+            mod.unregister()
@@ -1,5 +1,7 @@
 import bpy
 
+from . import popup_session
+
 class MODIFIER_PIE_OT_add_array_popup(bpy.types.Operator):
     bl_idname = "modifier_pie.add_array_popup"
     bl_label = "Add Array Modifier"
@@ -17,6 +19,22 @@ class MODIFIER_PIE_OT_add_array_popup(bpy.types.Operator):
             any(obj.type == 'MESH' for obj in context.selected_objects)
         )
     
+    def get_array_modifiers(self, obj):
+        cache = getattr(self, '_mod_cache', None)
+        if cache is None:
+            cache = self._mod_cache = popup_session.ModifierListCache('ARRAY')
+        return cache.get(obj)
+    
+    @classmethod
+    def current_array_modifiers(cls, obj):
+        """열려 있는 팝업의 캐시를 재사용하고, 없으면 직접 필터링"""
+        if cls._current_popup is not None:
+            return cls._current_popup.get_array_modifiers(obj)
+        return [m for m in obj.modifiers if m.type == 'ARRAY']
+    
+    def redraw_popup(self, context):
+        popup_session.tag_popup_area(getattr(self, '_area', None) or context.area)
+    
     def invoke(self, context, event):
         if MODIFIER_PIE_OT_add_array_popup._current_popup is not None:
             try:
@@ -26,7 +44,9 @@ class MODIFIER_PIE_OT_add_array_popup(bpy.types.Operator):
             MODIFIER_PIE_OT_add_array_popup._current_popup = None
         
         obj = context.active_object
-        array_modifiers = [m for m in obj.modifiers if m.type == 'ARRAY']
+        self._mod_cache = popup_session.ModifierListCache('ARRAY')
+        self._area = context.area
+        array_modifiers = self.get_array_modifiers(obj)
         
         if not array_modifiers:
             modifier_name = "Array"
@@ -45,20 +65,23 @@ class MODIFIER_PIE_OT_add_array_popup(bpy.types.Operator):
     
     def check(self, context):
         obj = context.active_object
-        array_modifiers = [m for m in obj.modifiers if m.type == 'ARRAY']
+        array_modifiers = self.get_array_modifiers(obj)
         if array_modifiers and self.selected_modifier_index < len(array_modifiers):
-            bpy.ops.ed.undo_push(message="Array Modifier Update")
-            context.view_layer.update()
-            if context.area:
-                context.area.tag_redraw()
+            # 드래그 중에는 언두를 하나로 합치고, 팝업을 띄운 영역만 다시 그림
+            popup_session.request_undo_push("Array Modifier Update")
+            self.redraw_popup(context)
         return True
     
     def execute(self, context):
+        # 확인 시에는 오퍼레이터 자체 언두 스텝이 남으므로 대기 중인 요청은 버림
+        popup_session.cancel_undo_push()
         if MODIFIER_PIE_OT_add_array_popup._current_popup == self:
             MODIFIER_PIE_OT_add_array_popup._current_popup = None
         return {'FINISHED'}
     
     def cancel(self, context):
+        # 팝업이 닫힌 뒤 타이머가 언두를 기록하지 않도록 지금 바로 기록
+        popup_session.flush_undo_push()
         if MODIFIER_PIE_OT_add_array_popup._current_popup == self:
             MODIFIER_PIE_OT_add_array_popup._current_popup = None
         return {'CANCELLED'}
@@ -75,7 +98,7 @@ class MODIFIER_PIE_OT_add_array_popup(bpy.types.Operator):
     def draw(self, context):
         layout = self.layout
         obj = context.active_object
-        array_modifiers = [m for m in obj.modifiers if m.type == 'ARRAY']
+        array_modifiers = self.get_array_modifiers(obj)
         
         if not array_modifiers:
             layout.label(text="No Array modifiers", icon='INFO')
@@ -128,10 +151,10 @@ class MODIFIER_PIE_OT_switch_array(bpy.types.Operator):
     target_index: bpy.props.IntProperty()
     
     def execute(self, context):
-        if MODIFIER_PIE_OT_add_array_popup._current_popup:
-            MODIFIER_PIE_OT_add_array_popup._current_popup.selected_modifier_index = self.target_index
-            if context.area:
-                context.area.tag_redraw()
+        popup = MODIFIER_PIE_OT_add_array_popup._current_popup
+        if popup:
+            popup.selected_modifier_index = self.target_index
+            popup.redraw_popup(context)
         return {'FINISHED'}
 
 class MODIFIER_PIE_OT_add_array_quick(bpy.types.Operator):
@@ -142,7 +165,7 @@ class MODIFIER_PIE_OT_add_array_quick(bpy.types.Operator):
     
     def execute(self, context):
         obj = context.active_object
-        array_modifiers = [m for m in obj.modifiers if m.type == 'ARRAY']
+        array_modifiers = MODIFIER_PIE_OT_add_array_popup.current_array_modifiers(obj)
         modifier_count = len(array_modifiers)
         
         modifier_name = f"Array.{modifier_count:03d}" if array_modifiers else "Array"
@@ -164,10 +187,10 @@ class MODIFIER_PIE_OT_add_array_quick(bpy.types.Operator):
             new_mod.relative_offset_displace[1] = 0.0
             new_mod.relative_offset_displace[2] = 1.0
         
-        if MODIFIER_PIE_OT_add_array_popup._current_popup:
-            MODIFIER_PIE_OT_add_array_popup._current_popup.selected_modifier_index = len(array_modifiers)
-            if context.area:
-                context.area.tag_redraw()
+        popup = MODIFIER_PIE_OT_add_array_popup._current_popup
+        if popup:
+            popup.selected_modifier_index = modifier_count
+            popup.redraw_popup(context)
         
         return {'FINISHED'}
 
@@ -181,7 +204,7 @@ class MODIFIER_PIE_OT_delete_array_quick(bpy.types.Operator):
     
     def execute(self, context):
         obj = context.active_object
-        array_modifiers = [m for m in obj.modifiers if m.type == 'ARRAY']
+        array_modifiers = MODIFIER_PIE_OT_add_array_popup.current_array_modifiers(obj)
         
         if self.target_index < len(array_modifiers):
             mod = array_modifiers[self.target_index]
@@ -193,8 +216,7 @@ class MODIFIER_PIE_OT_delete_array_quick(bpy.types.Operator):
             popup = MODIFIER_PIE_OT_add_array_popup._current_popup
             if popup.selected_modifier_index >= len(array_modifiers) - 1:
                 popup.selected_modifier_index = max(0, len(array_modifiers) - 2)
-            if context.area:
-                context.area.tag_redraw()
+            popup.redraw_popup(context)
         
         return {'FINISHED'}
 
@@ -226,8 +248,8 @@ class MODIFIER_PIE_OT_apply_modifier_array(bpy.types.Operator):
             bpy.ops.object.modifier_apply(modifier=mod.name)
             self.report({'INFO'}, f"Applied {mod.name}")
         
-        if MODIFIER_PIE_OT_add_array_popup._current_popup and context.area:
-            context.area.tag_redraw()
+        if MODIFIER_PIE_OT_add_array_popup._current_popup:
+            MODIFIER_PIE_OT_add_array_popup._current_popup.redraw_popup(context)
         
         return {'FINISHED'}
 
@@ -0,0 +1,171 @@
+import bpy
+import time
+
+from . import boolean
+
+# ─────────────────────────────────────────────
+# 모디파이어 일괄 적용 엔진
+# ─────────────────────────────────────────────
+# bpy.ops.object.modifier_apply 는 모디파이어마다 depsgraph 전체를 다시 평가하고
+# 활성 오브젝트 전환이 필요합니다. 여기서는 depsgraph 를 한 번만 평가한 뒤
+# new_from_object 로 최종 메시를 만들어 교체합니다.
+
+
+def build_apply_plan(obj, apply_names):
+    """적용할 모디파이어 이름 목록과 유지할 모디파이어 이름 목록을 묶어 반환
+
+    뷰포트에서 꺼진 모디파이어는 굽지 않고 꺼진 채로 유지합니다.
+    """
+    apply_names = [name for name in apply_names if name in obj.modifiers and obj.modifiers[name].show_viewport]
+    keep_names = [m.name for m in obj.modifiers if m.name not in apply_names]
+    return (obj, apply_names, keep_names)
+
+
+# 오브젝트 변환과 무관하게 같은 결과를 내는 모디파이어. 공유 메시 중복 제거에 사용
+SHAREABLE_TYPES = {'MIRROR', 'BEVEL', 'SUBSURF', 'SOLIDIFY', 'WIREFRAME', 'TRIANGULATE', 'WELD', 'SCREW', 'ARRAY', 'REMESH'}
+_SIGNATURE_SKIP = {"rna_type", "name", "show_expanded", "is_active", "use_pin_to_last", "is_override_data_editable", "persistent_uid"}
+
+
+def modifier_signature(mod):
+    """모디파이어 설정을 비교 가능한 튜플로 반환. 다른 데이터를 참조하면 None (공유 불가)"""
+    if mod.type not in SHAREABLE_TYPES:
+        return None
+    values = [mod.type]
+    for prop in mod.bl_rna.properties:
+        name = prop.identifier
+        if name in _SIGNATURE_SKIP or prop.type == 'COLLECTION':
+            continue
+        value = getattr(mod, name)
+        if prop.type == 'POINTER':
+            # 미러 오브젝트, 오프셋 오브젝트 등은 오브젝트마다 결과가 달라짐
+            if value is not None:
+                return None
+            continue
+        if getattr(prop, "is_array", False):
+            value = tuple(value)
+        values.append((name, value))
+    return tuple(values)
+
+
+def plan_share_key(plan):
+    """같은 메시 데이터 + 같은 모디파이어 설정이면 같은 키. 공유할 수 없으면 None"""
+    obj, apply_names, keep_names = plan
+    signatures = []
+    for name in apply_names:
+        signature = modifier_signature(obj.modifiers[name])
+        if signature is None:
+            return None
+        signatures.append(signature)
+    return (obj.data.as_pointer(), tuple(signatures))
+
+
+def _prepare_visibility(plans):
+    """유지할 모디파이어는 평가 동안만 끕니다"""
+    hidden = []
+    for obj, apply_names, keep_names in plans:
+        for name in keep_names:
+            mod = obj.modifiers[name]
+            if mod.show_viewport:
+                mod.show_viewport = False
+                hidden.append((obj, name))
+    return hidden
+
+
+def _restore_visibility(hidden):
+    for obj, name in hidden:
+        mod = obj.modifiers.get(name)
+        if mod:
+            mod.show_viewport = True
+
+
+def _use_final_solvers(plans):
+    """실제로 구울 불리언만 AUTO 정책의 최종 솔버(Exact)로 전환. 되돌릴 목록을 반환"""
+    switched = []
+    for obj, apply_names, keep_names in plans:
+        for name in apply_names:
+            previous = boolean.use_final_solver(obj.modifiers[name])
+            if previous is not None:
+                switched.append((obj, name, previous))
+    return switched
+
+
+def _restore_solvers(switched):
+    for obj, name, solver in switched:
+        mod = obj.modifiers.get(name)
+        if mod:
+            mod.solver = solver
+
+
+def bake_plans(context, plans, share_meshes=False):
+    """평가된 메시를 한 번에 만들어 오브젝트 데이터와 교체합니다.
+
+    plans 는 build_apply_plan 결과 목록이며, 오브젝트별 (이름, 소요 시간, 적용된 타입) 목록을 반환합니다.
+    share_meshes 가 True 이면 같은 메시를 같은 설정으로 쓰는 오브젝트는 한 번만 평가하고
+    결과 메시도 계속 공유합니다.
+    """
+    plans = [plan for plan in plans if plan[1]]
+    if not plans:
+        return []
+
+    # 공유 메시 묶기: 대표 plan 하나에 나머지 오브젝트를 매달아 둠
+    groups = []
+    if share_meshes:
+        by_key = {}
+        for plan in plans:
+            key = plan_share_key(plan)
+            if key is not None and key in by_key:
+                by_key[key][1].append(plan)
+                continue
+            group = (plan, [plan])
+            groups.append(group)
+            if key is not None:
+                by_key[key] = group
+    else:
+        groups = [(plan, [plan]) for plan in plans]
+
+    leaders = [leader for leader, _ in groups]
+    switched = _use_final_solvers(leaders)
+    hidden = _prepare_visibility(leaders)
+    baked_all = False
+    try:
+        # 1) depsgraph 평가는 전체 배치에 대해 한 번만
+        depsgraph = context.evaluated_depsgraph_get()
+
+        # 2) 원본을 건드리기 전에 모든 결과 메시를 먼저 생성
+        baked = []
+        for (obj, apply_names, keep_names), members in groups:
+            start = time.perf_counter()
+            obj_eval = obj.evaluated_get(depsgraph)
+            mesh = bpy.data.meshes.new_from_object(
+                obj_eval, preserve_all_data_layers=True, depsgraph=depsgraph
+            )
+            baked.append((members, mesh, time.perf_counter() - start))
+
+        # 3) 메시 교체 및 적용된 모디파이어 제거
+        timings = []
+        for members, mesh, elapsed in baked:
+            start = time.perf_counter()
+            old_mesh = members[0][0].data
+            mesh_name = old_mesh.name
+            applied = []
+            for obj, apply_names, keep_names in members:
+                applied.append((obj, [obj.modifiers[name].type for name in apply_names]))
+                if obj.data == old_mesh:
+                    obj.data = mesh
+                for name in apply_names:
+                    obj.modifiers.remove(obj.modifiers[name])
+            if old_mesh.users == 0:
+                bpy.data.meshes.remove(old_mesh)
+            mesh.name = mesh_name
+
+            elapsed += time.perf_counter() - start
+            for obj, applied_types in applied:
+                timings.append((obj.name, elapsed / len(members), applied_types))
+        baked_all = True
+    finally:
+        _restore_visibility(hidden)
+        # 굽지 못한 불리언은 편집하던 솔버로 되돌림 (적용된 모디파이어는 이미 사라짐)
+        if not baked_all:
+            _restore_solvers(switched)
+
+    return timings
@@ -1,7 +1,14 @@
 import bpy
+import time
 
 from bpy.types import Operator
 
+from . import popup_session
+from ..log import get_logger
+from ..profiling import profiled
+
+logger = get_logger(__name__)
+
 def auto_wireframe_update(self, context):
     """타겟 오브젝트 변경 시 자동 와이어프레임 적용"""
     obj = context.active_object
@@ -11,7 +18,7 @@ def auto_wireframe_update(self, context):
         if mod.type == 'BOOLEAN' and mod.operand_type == 'OBJECT' and mod.object:
             if mod.object != obj and mod.object.type == 'MESH':
                 set_wireframe_with_flag(mod.object)
-                print(f"자동 와이어프레임 적용: {mod.object.name}")
+                logger.debug("자동 와이어프레임 적용: %s", mod.object.name)
 
 def set_wireframe_with_flag(obj):
     """와이어프레임 설정과 함께 플래그 저장"""
@@ -22,7 +29,7 @@ def set_wireframe_with_flag(obj):
             obj['boolean_wireframe'] = True
             obj.display_type = 'WIRE'
     except Exception as e:
-        print(f"와이어프레임 설정 오류: {e}")
+        logger.warning("와이어프레임 설정 오류: %s", e)
 
 class MODIFIER_PIE_OT_add_boolean_popup(bpy.types.Operator):
     bl_idname = "modifier_pie.add_boolean_popup"
@@ -42,6 +49,22 @@ class MODIFIER_PIE_OT_add_boolean_popup(bpy.types.Operator):
             context.active_object.type == 'MESH'
         )
 
+    def get_boolean_modifiers(self, obj):
+        cache = getattr(self, '_mod_cache', None)
+        if cache is None:
+            cache = self._mod_cache = popup_session.ModifierListCache('BOOLEAN')
+        return cache.get(obj)
+
+    @classmethod
+    def current_boolean_modifiers(cls, obj):
+        """열려 있는 팝업의 캐시를 재사용하고, 없으면 직접 필터링"""
+        if cls._current_popup is not None:
+            return cls._current_popup.get_boolean_modifiers(obj)
+        return [m for m in obj.modifiers if m.type == 'BOOLEAN']
+
+    def redraw_popup(self, context):
+        popup_session.tag_popup_area(getattr(self, '_area', None) or context.area)
+
     def invoke(self, context, event):
         if MODIFIER_PIE_OT_add_boolean_popup._current_popup is not None:
             try:
@@ -51,37 +74,44 @@ class MODIFIER_PIE_OT_add_boolean_popup(bpy.types.Operator):
             MODIFIER_PIE_OT_add_boolean_popup._current_popup = None
 
         obj = context.active_object
-        bool_mods = [m for m in obj.modifiers if m.type == 'BOOLEAN']
+        self._mod_cache = popup_session.ModifierListCache('BOOLEAN')
+        self._area = context.area
+        bool_mods = self.get_boolean_modifiers(obj)
         if not bool_mods:
             obj.modifiers.new(name="Boolean", type='BOOLEAN')
             self.selected_modifier_index = 0
         else:
             if self.selected_modifier_index >= len(bool_mods):
                 self.selected_modifier_index = 0
-
         MODIFIER_PIE_OT_add_boolean_popup._current_popup = self
+        for mod in self.get_boolean_modifiers(obj):
+            apply_interactive_solver(obj, mod)
         return context.window_manager.invoke_props_dialog(self, width=400)
 
     def check(self, context):
         obj = context.active_object
-        bool_mods = [m for m in obj.modifiers if m.type == 'BOOLEAN']
+        bool_mods = self.get_boolean_modifiers(obj)
         if bool_mods and self.selected_modifier_index < len(bool_mods):
-            bpy.ops.ed.undo_push(message="Boolean Modifier Update")
-            context.view_layer.update()
-            for area in context.screen.areas:
-                if area.type == 'VIEW_3D':
-                    area.tag_redraw()
+            # 드래그 중에는 언두를 하나로 합치고, 팝업을 띄운 영역만 다시 그림
+            popup_session.request_undo_push("Boolean Modifier Update")
+            self.redraw_popup(context)
             return True
         return False
 
     def execute(self, context):
+        # 확인 시에는 오퍼레이터 자체 언두 스텝이 남으므로 대기 중인 요청은 버림
+        popup_session.cancel_undo_push()
         if MODIFIER_PIE_OT_add_boolean_popup._current_popup == self:
             MODIFIER_PIE_OT_add_boolean_popup._current_popup = None
+        restore_original_solvers()
         return {'FINISHED'}
 
     def cancel(self, context):
+        # 팝업이 닫힌 뒤 타이머가 언두를 기록하지 않도록 지금 바로 기록
+        popup_session.flush_undo_push()
         if MODIFIER_PIE_OT_add_boolean_popup._current_popup == self:
             MODIFIER_PIE_OT_add_boolean_popup._current_popup = None
+        restore_original_solvers()
         return {'CANCELLED'}
 
     @classmethod
@@ -96,7 +126,7 @@ class MODIFIER_PIE_OT_add_boolean_popup(bpy.types.Operator):
     def draw(self, context):
         layout = self.layout
         obj = context.active_object
-        bool_mods = [m for m in obj.modifiers if m.type == 'BOOLEAN']
+        bool_mods = self.get_boolean_modifiers(obj)
 
         if not bool_mods:
             layout.label(text="No Boolean modifiers", icon='INFO')
@@ -120,6 +150,15 @@ class MODIFIER_PIE_OT_add_boolean_popup(bpy.types.Operator):
 
         layout.prop(current_mod, "operation", expand=True)
         layout.prop(current_mod, "operand_type")
+
+        solver_row = layout.row(align=True)
+        solver_row.prop(current_mod, "solver", expand=True)
+        solver_row.operator("modifier_pie.time_boolean_solvers", text="", icon='TIME').mod_name = current_mod.name
+        timings = get_solver_timings(obj, current_mod)
+        if timings:
+            policy = " (Auto)" if get_solver_policy() == 'AUTO' else ""
+            text = " / ".join(f"{solver.title()} {timings[solver] * 1000:.0f} ms" for solver in SOLVERS if solver in timings)
+            layout.label(text=f"{text}{policy}", icon='INFO')
         if current_mod.operand_type == 'OBJECT':
             target_row = layout.row()
             target_row.prop(current_mod, "object", text="Target Object (Auto Wireframe)")
@@ -135,6 +174,15 @@ class MODIFIER_PIE_OT_add_boolean_popup(bpy.types.Operator):
         layout.separator()
         action_row = layout.row(align=True)
         action_row.operator("modifier_pie.apply_modifier_boolean_keep_wire", text="Apply This Boolean", icon='CHECKMARK').mod_name = current_mod.name
+
+        # 인덱스 조회라 draw 마다 불러도 모디파이어를 다시 훑지 않음
+        host_count = host_count_of_cutter(obj)
+        if host_count:
+            layout.operator("modifier_pie.select_boolean_hosts", text=f"이 오브젝트를 쓰는 호스트 선택 ({host_count})", icon='RESTRICT_SELECT_OFF')
+
+        tools_row = layout.row(align=True)
+        tools_row.operator("modifier_pie.find_dead_booleans", text="Find Dead Booleans", icon='ERROR')
+        tools_row.operator("modifier_pie.reset_target_wireframe", text="Reset All Wire", icon='SHADING_SOLID').all_targets = True
         
 
 class MODIFIER_PIE_OT_switch_boolean(bpy.types.Operator):
@@ -144,11 +192,10 @@ class MODIFIER_PIE_OT_switch_boolean(bpy.types.Operator):
     target_index: bpy.props.IntProperty()
 
     def execute(self, context):
-        if MODIFIER_PIE_OT_add_boolean_popup._current_popup:
-            MODIFIER_PIE_OT_add_boolean_popup._current_popup.selected_modifier_index = self.target_index
-            for area in context.screen.areas:
-                if area.type == 'VIEW_3D':
-                    area.tag_redraw()
+        popup = MODIFIER_PIE_OT_add_boolean_popup._current_popup
+        if popup:
+            popup.selected_modifier_index = self.target_index
+            popup.redraw_popup(context)
         return {'FINISHED'}
 
 class MODIFIER_PIE_OT_add_boolean_quick(bpy.types.Operator):
@@ -159,15 +206,15 @@ class MODIFIER_PIE_OT_add_boolean_quick(bpy.types.Operator):
 
     def execute(self, context):
         obj = context.active_object
-        bool_mods = [m for m in obj.modifiers if m.type == 'BOOLEAN']
+        bool_count = len(MODIFIER_PIE_OT_add_boolean_popup.current_boolean_modifiers(obj))
         mod = obj.modifiers.new(name="Boolean", type='BOOLEAN')
-        print(f"새 Boolean 추가: {mod.name}")
+        apply_interactive_solver(obj, mod)
+        logger.debug("새 Boolean 추가: %s", mod.name)
 
-        if MODIFIER_PIE_OT_add_boolean_popup._current_popup:
-            MODIFIER_PIE_OT_add_boolean_popup._current_popup.selected_modifier_index = len(bool_mods)
-            for area in context.screen.areas:
-                if area.type == 'VIEW_3D':
-                    area.tag_redraw()
+        popup = MODIFIER_PIE_OT_add_boolean_popup._current_popup
+        if popup:
+            popup.selected_modifier_index = bool_count
+            popup.redraw_popup(context)
         return {'FINISHED'}
 
 class MODIFIER_PIE_OT_reset_target_wireframe(bpy.types.Operator):
@@ -177,8 +224,19 @@ class MODIFIER_PIE_OT_reset_target_wireframe(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     mod_name: bpy.props.StringProperty()
+    all_targets: bpy.props.BoolProperty(name="All Cutters", description="씬의 모든 불리언 커터 표시를 한 번에 되돌립니다", default=False)
 
     def execute(self, context):
+        if self.all_targets:
+            # 의존성 인덱스에서 바로 커터를 얻으므로 모든 오브젝트의 모디파이어를 훑지 않음
+            restored = 0
+            for cutter in all_cutters():
+                if cutter.get('boolean_wireframe') or cutter.get('original_display_type') is not None:
+                    self.safe_reset_display(cutter)
+                    restored += 1
+            self.report({'INFO'}, f"와이어프레임 리셋: {restored}개 오브젝트")
+            return {'FINISHED'}
+
         obj = context.active_object
         if not obj:
             return {'CANCELLED'}
@@ -207,7 +265,7 @@ class MODIFIER_PIE_OT_reset_target_wireframe(bpy.types.Operator):
                 if obj.get('boolean_wireframe'):
                     del obj['boolean_wireframe']
         except Exception as e:
-            print(f"디스플레이 복원 오류: {e}")
+            logger.warning("디스플레이 복원 오류: %s", e)
 
 class MODIFIER_PIE_OT_apply_modifier_boolean_keep_wire(bpy.types.Operator):
     bl_idname = "modifier_pie.apply_modifier_boolean_keep_wire"
@@ -249,12 +307,16 @@ class MODIFIER_PIE_OT_apply_modifier_boolean_keep_wire(bpy.types.Operator):
                     if target_obj and target_obj.type == 'MESH' and target_obj.get('boolean_wireframe'):
                         wireframe_objects.append(target_obj)
         except Exception as e:
-            print(f"와이어프레임 오브젝트 수집 오류: {e}")
+            logger.warning("와이어프레임 오브젝트 수집 오류: %s", e)
 
+        # AUTO 정책: 편집 중 Fast 였더라도 최종 결과는 Exact 로
+        previous_solver = use_final_solver(mod)
         try:
             bpy.ops.object.modifier_apply(modifier=mod.name)
             self.report({'INFO'}, f"Boolean 모디파이어 '{mod.name}'이 적용되었습니다.")
         except Exception as e:
+            if previous_solver is not None:
+                mod.solver = previous_solver
             self.report({'ERROR'}, f"모디파이어 적용 실패: {str(e)}")
             return {'CANCELLED'}
 
@@ -264,7 +326,7 @@ class MODIFIER_PIE_OT_apply_modifier_boolean_keep_wire(bpy.types.Operator):
                     wire_obj.display_type = 'WIRE'
                     wire_obj['boolean_wireframe'] = True
             except Exception as e:
-                print(f"와이어프레임 유지 오류: {e}")
+                logger.warning("와이어프레임 유지 오류: %s", e)
 
         if wireframe_objects:
             self.report({'INFO'}, f"와이어프레임 유지: {len(wireframe_objects)}개 오브젝트")
@@ -292,23 +354,444 @@ class MODIFIER_PIE_OT_set_wireframe_collection(bpy.types.Operator):
             self.report({'INFO'}, f"와이어프레임 설정: {count}개 오브젝트")
         return {'FINISHED'}
 
+# ─────────────────────────────────────────────
+# 불리언 의존성 인덱스 (호스트 ↔ 커터)
+# ─────────────────────────────────────────────
+# 호스트 session_uid → 불리언 타겟 시그니처.
+# depsgraph 업데이트마다 모디파이어를 다시 훑지 않고, 지오메트리가 바뀐 오브젝트만
+# 시그니처를 비교해 object/collection 이 실제로 바뀐 경우에만 인덱스와 와이어프레임을 갱신합니다.
+# 파일을 열 때 한 번 전체를 만들고 이후에는 바뀐 호스트만 반영합니다.
+# 이름 대신 session_uid 로 기록하므로 커터/컬렉션/호스트 이름을 바꿔도 인덱스가 낡지 않습니다.
+_boolean_target_cache = {}
+# 역방향: 커터 오브젝트 uid / 컬렉션 uid → 호스트 uid 집합
+_cutter_hosts = {}
+_collection_hosts = {}
+# uid → 마지막으로 본 이름 (조회 힌트, 틀리면 전체에서 다시 찾음)
+_id_names = {}
+
+def _uid(id_data):
+    if id_data is None:
+        return None
+    _id_names[id_data.session_uid] = id_data.name
+    return id_data.session_uid
+
+def resolve_ids(data, uids):
+    """uid 목록 → {uid: ID}. 이름 힌트가 맞지 않는 uid 가 있을 때만 data 전체를 한 번 훑음"""
+    found, missing = {}, []
+    for uid in uids:
+        id_data = data.get(_id_names.get(uid, ""))
+        if id_data is not None and id_data.session_uid == uid:
+            found[uid] = id_data
+        else:
+            missing.append(uid)
+    if missing:
+        wanted = set(missing)
+        for id_data in data:
+            if id_data.session_uid in wanted:
+                found[id_data.session_uid] = id_data
+                _id_names[id_data.session_uid] = id_data.name
+    return found
+
+def resolve_id(data, uid):
+    return resolve_ids(data, (uid,)).get(uid) if uid is not None else None
+
+def get_boolean_signature(obj):
+    """오브젝트의 불리언 모디파이어 타겟 구성을 비교 가능한 튜플로 반환"""
+    return tuple(
+        (mod.name, mod.operand_type, _uid(mod.object), _uid(mod.collection))
+        for mod in obj.modifiers if mod.type == 'BOOLEAN'
+    )
+
+def _reverse_maps(signature):
+    for _, operand_type, target_uid, collection_uid in signature:
+        if operand_type == 'OBJECT' and target_uid is not None:
+            yield _cutter_hosts, target_uid
+        elif operand_type == 'COLLECTION' and collection_uid is not None:
+            yield _collection_hosts, collection_uid
+
+def set_host_signature(host_uid, new_signature):
+    """호스트 시그니처를 바꾸고 역방향 인덱스도 함께 갱신"""
+    old_signature = _boolean_target_cache.pop(host_uid, ())
+    for index, key in _reverse_maps(old_signature):
+        hosts = index.get(key)
+        if hosts:
+            hosts.discard(host_uid)
+            if not hosts:
+                del index[key]
+    if new_signature:
+        _boolean_target_cache[host_uid] = new_signature
+        for index, key in _reverse_maps(new_signature):
+            index.setdefault(key, set()).add(host_uid)
+
+def rebuild_boolean_target_cache():
+    """씬 전체 불리언 호스트 인덱스를 다시 만듭니다 (와이어프레임은 건드리지 않음)"""
+    _boolean_target_cache.clear()
+    _cutter_hosts.clear()
+    _collection_hosts.clear()
+    _id_names.clear()
+    for obj in bpy.data.objects:
+        if obj.type != 'MESH':
+            continue
+        signature = get_boolean_signature(obj)
+        if signature:
+            set_host_signature(_uid(obj), signature)
+
+def host_count_of_cutter(cutter):
+    """cutter 를 오브젝트 오퍼랜드로 쓰는 호스트 수 (인덱스 조회만)"""
+    return len(_cutter_hosts.get(cutter.session_uid, ()))
+
+def hosts_of_cutter(cutter):
+    """cutter 를 오브젝트 또는 컬렉션 오퍼랜드로 쓰는 호스트 오브젝트 목록"""
+    uids = set(_cutter_hosts.get(cutter.session_uid, ()))
+    collections = resolve_ids(bpy.data.collections, _collection_hosts)
+    for collection_uid, hosts in _collection_hosts.items():
+        collection = collections.get(collection_uid)
+        if collection and cutter.name in collection.all_objects:
+            uids |= hosts
+    # 삭제된 호스트는 여기서 걸러냄
+    hosts = [obj for obj in resolve_ids(bpy.data.objects, uids).values() if obj != cutter]
+    return sorted(hosts, key=lambda obj: obj.name)
+
+def cutters_of_host(host):
+    """호스트의 불리언 모디파이어가 참조하는 메시 커터 목록 (컬렉션 포함)"""
+    cutters = []
+    for _, operand_type, target_uid, collection_uid in _boolean_target_cache.get(host.session_uid, ()):
+        if operand_type == 'OBJECT':
+            target = resolve_id(bpy.data.objects, target_uid)
+            if target:
+                cutters.append(target)
+        elif operand_type == 'COLLECTION':
+            collection = resolve_id(bpy.data.collections, collection_uid)
+            if collection:
+                cutters.extend(o for o in collection.all_objects if o.type == 'MESH' and o != host)
+    return cutters
+
+def all_cutters():
+    """인덱스에 있는 모든 커터 오브젝트"""
+    cutters = {}
+    for obj in resolve_ids(bpy.data.objects, _cutter_hosts).values():
+        cutters[obj.name] = obj
+    for collection in resolve_ids(bpy.data.collections, _collection_hosts).values():
+        for obj in collection.all_objects:
+            if obj.type == 'MESH':
+                cutters[obj.name] = obj
+    return list(cutters.values())
+
+def boolean_dead_reason(scene, mod):
+    """모디파이어의 현재 타겟을 직접 읽어 끊어진 이유를 반환 (정상이면 None)"""
+    if mod.operand_type == 'OBJECT':
+        if mod.object is None:
+            return "타겟 없음"
+        if scene not in mod.object.users_scene:
+            return f"씬에 없는 타겟: {mod.object.name}"
+    elif mod.operand_type == 'COLLECTION':
+        if mod.collection is None:
+            return "컬렉션 없음"
+        if not any(o.type == 'MESH' for o in mod.collection.all_objects):
+            return f"빈 컬렉션: {mod.collection.name}"
+    return None
+
+def dead_boolean_modifiers(scene):
+    """타겟이 비었거나, 삭제되었거나, 씬에 없는 불리언 모디파이어 (호스트, 모디파이어 이름, 사유)
+
+    인덱스는 후보 호스트를 고르는 데만 쓰고, 판정은 모디파이어의 현재 값으로 합니다.
+    """
+    dead = []
+    hosts = resolve_ids(bpy.data.objects, list(_boolean_target_cache))
+    for host_uid in list(_boolean_target_cache):
+        host = hosts.get(host_uid)
+        if host is None:
+            set_host_signature(host_uid, ())
+            continue
+        if scene not in host.users_scene:
+            continue
+        for mod in host.modifiers:
+            if mod.type != 'BOOLEAN':
+                continue
+            reason = boolean_dead_reason(scene, mod)
+            if reason:
+                dead.append((host, mod.name, reason))
+    return dead
+
+def apply_wireframe_for_new_targets(obj, old_signature, new_signature):
+    """새로 지정된 OBJECT 타겟에만 와이어프레임 적용"""
+    old_targets = {entry[2] for entry in old_signature if entry[1] == 'OBJECT'}
+    for name, operand_type, target_uid, _ in new_signature:
+        if operand_type != 'OBJECT' or target_uid is None or target_uid in old_targets:
+            continue
+        target = resolve_id(bpy.data.objects, target_uid)
+        if target and target != obj and target.type == 'MESH' and target.display_type != 'WIRE':
+            set_wireframe_with_flag(target)
+
+# ─────────────────────────────────────────────
+# 불리언 솔버 자동 선택 (Fast ↔ Exact)
+# ─────────────────────────────────────────────
+# AUTO 정책: 불리언 팝업이 열려 있는 동안에만 Fast, 최종 적용 때는 Exact.
+# 단, 측정해 보니 Exact 가 AUTO_EXACT_BUDGET 안에 끝나는 조합은 편집 중에도 Exact 를 유지합니다.
+# 바꾸기 전 솔버는 _original_solvers 에 두었다가 팝업을 닫을 때, 렌더/저장 직전에, 정책을 바꿀 때 되돌립니다.
+SOLVERS = ('FAST', 'EXACT')
+AUTO_EXACT_BUDGET = 0.05
+SOLVER_TIMING_INTERVAL = 0.5
+
+# (호스트 session_uid, 오퍼랜드 키) → {"FAST": 초, "EXACT": 초}
+_solver_timings = {}
+# 백그라운드에서 측정할 (호스트 session_uid, 모디파이어 이름)
+_solver_timing_queue = []
+# (호스트 session_uid, 모디파이어 이름) → 편집용으로 바꾸기 전 솔버
+_original_solvers = {}
+
+def get_solver_policy():
+    try:
+        return bpy.context.preferences.addons["modifier_pie_kit"].preferences.boolean_solver_policy
+    except (KeyError, AttributeError):
+        return 'MANUAL'
+
+def operand_key(mod):
+    """이름을 바꿔도 유지되도록 오퍼랜드를 session_uid 로 식별"""
+    if mod.operand_type == 'OBJECT' and mod.object:
+        return ('OBJECT', _uid(mod.object))
+    if mod.operand_type == 'COLLECTION' and mod.collection:
+        return ('COLLECTION', _uid(mod.collection))
+    return None
+
+def get_solver_timings(host, mod):
+    key = operand_key(mod)
+    return _solver_timings.get((host.session_uid, key)) if key else None
+
+def time_boolean_solvers(context, host, mod, solvers=SOLVERS):
+    """호스트를 solvers 순서대로 한 번씩 평가해 걸린 시간을 캐시에 합치고 반환"""
+    key = operand_key(mod)
+    if key is None:
+        return None
+    depsgraph = context.evaluated_depsgraph_get()
+    original = mod.solver
+    results = {}
+    try:
+        for solver in solvers:
+            if mod.solver != solver:
+                mod.solver = solver
+            else:
+                host.update_tag()
+            start = time.perf_counter()
+            # 태그된 호스트만 다시 평가
+            depsgraph.update()
+            results[solver] = time.perf_counter() - start
+    finally:
+        if mod.solver != original:
+            mod.solver = original
+    timings = _solver_timings.setdefault((host.session_uid, key), {})
+    timings.update(results)
+    logger.debug("솔버 측정 %s/%s: %s", host.name, mod.name,
+                 ", ".join(f"{solver} {seconds * 1000:.1f} ms" for solver, seconds in results.items()))
+    return timings
+
+def interactive_solver(host, mod):
+    timings = get_solver_timings(host, mod)
+    if timings and timings.get('EXACT', AUTO_EXACT_BUDGET + 1.0) <= AUTO_EXACT_BUDGET:
+        return 'EXACT'
+    return 'FAST'
+
+def apply_interactive_solver(host, mod):
+    """AUTO 정책이고 불리언 팝업이 열려 있을 때만 편집용 솔버로 전환 (원래 솔버는 기록)"""
+    if get_solver_policy() != 'AUTO' or mod.type != 'BOOLEAN':
+        return
+    if MODIFIER_PIE_OT_add_boolean_popup._current_popup is None:
+        return
+    solver = interactive_solver(host, mod)
+    if mod.solver != solver:
+        _original_solvers.setdefault((host.session_uid, mod.name), mod.solver)
+        mod.solver = solver
+
+def restore_original_solvers():
+    """편집용으로 바꾼 솔버를 사용자가 지정했던 값으로 되돌림"""
+    if not _original_solvers:
+        return
+    hosts = resolve_ids(bpy.data.objects, {uid for uid, _ in _original_solvers})
+    for (host_uid, mod_name), solver in _original_solvers.items():
+        host = hosts.get(host_uid)
+        mod = host.modifiers.get(mod_name) if host else None
+        if mod is not None and mod.type == 'BOOLEAN' and mod.solver != solver:
+            mod.solver = solver
+    _original_solvers.clear()
+
+def use_final_solver(mod):
+    """AUTO 정책일 때 적용 직전에 Exact 로 전환. 바꿨으면 이전 솔버를, 아니면 None 을 반환"""
+    if get_solver_policy() == 'AUTO' and mod.type == 'BOOLEAN' and mod.solver != 'EXACT':
+        previous = mod.solver
+        mod.solver = 'EXACT'
+        return previous
+    return None
+
+def _process_solver_timing_queue():
+    if not _solver_timing_queue:
+        return None
+    host_uid, mod_name = _solver_timing_queue.pop(0)
+    host = resolve_id(bpy.data.objects, host_uid)
+    mod = host.modifiers.get(mod_name) if host else None
+    # 현재 솔버가 Fast 일 때만 그대로 다시 평가해 잽니다 (솔버를 바꾸고 되돌리는 재평가 없음)
+    if mod is not None and mod.type == 'BOOLEAN' and mod.solver == 'FAST':
+        try:
+            time_boolean_solvers(bpy.context, host, mod, solvers=('FAST',))
+            apply_interactive_solver(host, mod)
+        except Exception as e:
+            logger.warning("솔버 측정 오류 (%s/%s): %s", host.name, mod_name, e)
+    # 한 틱에 한 조합만 측정해 UI 를 오래 막지 않음
+    return SOLVER_TIMING_INTERVAL if _solver_timing_queue else None
+
+def queue_solver_timing(host, mod):
+    """백그라운드 측정 예약 (AUTO 정책에서만).
+
+    백그라운드에서는 Fast 만 잽니다. Exact 는 에셋에 따라 몇 초씩 걸려 UI 가 멈추므로
+    팝업의 측정 버튼(time_boolean_solvers 오퍼레이터)으로만 잽니다.
+    """
+    if get_solver_policy() != 'AUTO' or operand_key(mod) is None or mod.solver != 'FAST':
+        return
+    entry = (_uid(host), mod.name)
+    if entry not in _solver_timing_queue:
+        _solver_timing_queue.append(entry)
+    if not bpy.app.timers.is_registered(_process_solver_timing_queue):
+        bpy.app.timers.register(_process_solver_timing_queue, first_interval=SOLVER_TIMING_INTERVAL)
+
+def queue_changed_targets(obj, old_signature, new_signature):
+    """타겟이 바뀐 불리언 모디파이어만 측정 예약"""
+    old_entries = set(old_signature)
+    for entry in new_signature:
+        if entry in old_entries:
+            continue
+        mod = obj.modifiers.get(entry[0])
+        if mod is not None:
+            apply_interactive_solver(obj, mod)
+            queue_solver_timing(obj, mod)
+
 @bpy.app.handlers.persistent
+@profiled("boolean.depsgraph_update_post")
 def boolean_target_update_handler(scene, depsgraph):
     """Boolean 타겟 변경 감지 및 자동 와이어프레임 적용"""
     try:
-        context = bpy.context
-        if not context.active_object:
+        if not depsgraph.id_type_updated('OBJECT'):
             return
-        obj = context.active_object
-        if obj.type != 'MESH':
-            return
-        for mod in obj.modifiers:
-            if mod.type == 'BOOLEAN' and mod.operand_type == 'OBJECT':
-                if mod.object and mod.object != obj and mod.object.type == 'MESH':
-                    if mod.object.display_type != 'WIRE':
-                        set_wireframe_with_flag(mod.object)
+        for update in depsgraph.updates:
+            # 모디파이어 속성 변경은 지오메트리 업데이트로 들어옵니다. 이동/회전만 한 경우는 무시.
+            if not update.is_updated_geometry:
+                continue
+            obj = update.id
+            if not isinstance(obj, bpy.types.Object) or obj.type != 'MESH':
+                continue
+            obj = obj.original
+            old_signature = _boolean_target_cache.get(obj.session_uid, ())
+            if not old_signature and not obj.modifiers:
+                continue
+            new_signature = get_boolean_signature(obj)
+            if new_signature == old_signature:
+                continue
+            set_host_signature(_uid(obj), new_signature)
+            apply_wireframe_for_new_targets(obj, old_signature, new_signature)
+            queue_changed_targets(obj, old_signature, new_signature)
     except Exception as e:
-        print(f"자동 와이어프레임 핸들러 오류: {e}")
+        logger.error("자동 와이어프레임 핸들러 오류: %s", e)
+
+@bpy.app.handlers.persistent
+@profiled("boolean.restore_solvers")
+def boolean_solver_restore_handler(*args):
+    """렌더/저장 전에 편집용 솔버를 원래대로 (결과물과 파일에는 사용자 솔버가 쓰이도록)"""
+    restore_original_solvers()
+
+@bpy.app.handlers.persistent
+@profiled("boolean.load_post")
+def boolean_cache_load_handler(dummy):
+    # 측정값은 session_uid 로 묶여 있어 다른 파일에서는 쓸 수 없음
+    _solver_timings.clear()
+    _solver_timing_queue.clear()
+    rebuild_boolean_target_cache()
+
+class MODIFIER_PIE_OT_select_boolean_hosts(bpy.types.Operator):
+    bl_idname = "modifier_pie.select_boolean_hosts"
+    bl_label = "Select Boolean Hosts"
+    bl_description = "활성 오브젝트를 커터(오브젝트 또는 컬렉션)로 쓰는 모든 호스트 오브젝트를 선택합니다"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    extend: bpy.props.BoolProperty(name="Extend", description="기존 선택을 유지합니다", default=False)
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and context.active_object is not None
+
+    def execute(self, context):
+        cutter = context.active_object
+        view_layer = context.view_layer
+        hosts = [host for host in hosts_of_cutter(cutter) if host.name in view_layer.objects]
+        if not hosts:
+            self.report({'INFO'}, f"'{cutter.name}'을(를) 쓰는 호스트가 없습니다.")
+            return {'CANCELLED'}
+
+        MODIFIER_PIE_OT_add_boolean_popup.close_current_popup()
+        if not self.extend:
+            for obj in context.selected_objects:
+                obj.select_set(False)
+        for host in hosts:
+            host.select_set(True)
+        view_layer.objects.active = hosts[0]
+        self.report({'INFO'}, f"호스트 {len(hosts)}개 선택")
+        return {'FINISHED'}
+
+class MODIFIER_PIE_OT_time_boolean_solvers(bpy.types.Operator):
+    bl_idname = "modifier_pie.time_boolean_solvers"
+    bl_label = "Time Boolean Solvers"
+    bl_description = "Fast/Exact 솔버로 각각 평가해 걸리는 시간을 측정합니다. Auto 정책에서는 결과에 따라 편집용 솔버를 고릅니다"
+
+    mod_name: bpy.props.StringProperty()
+
+    def execute(self, context):
+        obj = context.active_object
+        mod = obj.modifiers.get(self.mod_name) if obj else None
+        if not mod or mod.type != 'BOOLEAN':
+            self.report({'WARNING'}, "Boolean 모디파이어를 찾을 수 없습니다.")
+            return {'CANCELLED'}
+        timings = time_boolean_solvers(context, obj, mod)
+        if timings is None:
+            self.report({'WARNING'}, "타겟이 설정되지 않았습니다.")
+            return {'CANCELLED'}
+        apply_interactive_solver(obj, mod)
+        self.report({'INFO'}, f"Fast {timings['FAST'] * 1000:.1f} ms / Exact {timings['EXACT'] * 1000:.1f} ms")
+
+        popup = MODIFIER_PIE_OT_add_boolean_popup._current_popup
+        if popup:
+            popup.redraw_popup(context)
+        return {'FINISHED'}
+
+class MODIFIER_PIE_OT_find_dead_booleans(bpy.types.Operator):
+    bl_idname = "modifier_pie.find_dead_booleans"
+    bl_label = "Find Dead Booleans"
+    bl_description = "타겟이 비었거나 삭제된 불리언 모디파이어를 찾습니다. 제거 옵션을 켜면 해당 모디파이어를 지웁니다"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    remove: bpy.props.BoolProperty(name="Remove", description="찾은 불리언 모디파이어를 제거합니다", default=False)
+
+    def execute(self, context):
+        dead = dead_boolean_modifiers(context.scene)
+        if not dead:
+            self.report({'INFO'}, "끊어진 불리언이 없습니다.")
+            return {'FINISHED'}
+
+        for host, mod_name, reason in dead:
+            logger.info("끊어진 불리언: %s / %s (%s)", host.name, mod_name, reason)
+
+        if self.remove:
+            removed = 0
+            for host, mod_name, _ in dead:
+                mod = host.modifiers.get(mod_name)
+                # 지우기 직전에 현재 타겟을 다시 확인
+                if mod and mod.type == 'BOOLEAN' and boolean_dead_reason(context.scene, mod):
+                    host.modifiers.remove(mod)
+                    removed += 1
+            # 제거한 호스트만 인덱스 갱신
+            for host in {entry[0] for entry in dead}:
+                set_host_signature(_uid(host), get_boolean_signature(host))
+            self.report({'INFO'}, f"끊어진 불리언 {removed}개를 제거했습니다.")
+        else:
+            hosts = len({entry[0] for entry in dead})
+            self.report({'WARNING'}, f"끊어진 불리언 {len(dead)}개 (호스트 {hosts}개). 자세한 내용은 로그를 확인하세요.")
+        return {'FINISHED'}
 
 classes = (
     MODIFIER_PIE_OT_add_boolean_popup,
@@ -317,27 +800,53 @@ classes = (
     MODIFIER_PIE_OT_reset_target_wireframe,
     MODIFIER_PIE_OT_apply_modifier_boolean_keep_wire,
     MODIFIER_PIE_OT_set_wireframe_collection,
+    MODIFIER_PIE_OT_select_boolean_hosts,
+    MODIFIER_PIE_OT_time_boolean_solvers,
+    MODIFIER_PIE_OT_find_dead_booleans,
 )
 
 def register():
     for cls in classes:
         try:
             bpy.utils.register_class(cls)
-            print(f"✓ 등록 성공: {cls.__name__}")
+            logger.debug("등록 성공: %s", cls.__name__)
         except Exception as e:
-            print(f"✗ 등록 실패: {cls.__name__} - {e}")
+            logger.error("등록 실패: %s - %s", cls.__name__, e)
     if boolean_target_update_handler not in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.append(boolean_target_update_handler)
+    if boolean_cache_load_handler not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(boolean_cache_load_handler)
+    for handler_list in (bpy.app.handlers.render_pre, bpy.app.handlers.save_pre):
+        if boolean_solver_restore_handler not in handler_list:
+            handler_list.append(boolean_solver_restore_handler)
+    if not bpy.app.timers.is_registered(rebuild_boolean_target_cache):
+        bpy.app.timers.register(rebuild_boolean_target_cache, first_interval=0.1)
 
 def unregister():
     if boolean_target_update_handler in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(boolean_target_update_handler)
+    if boolean_cache_load_handler in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(boolean_cache_load_handler)
+    for handler_list in (bpy.app.handlers.render_pre, bpy.app.handlers.save_pre):
+        if boolean_solver_restore_handler in handler_list:
+            handler_list.remove(boolean_solver_restore_handler)
+    # 등록 직후 해제되면 예약된 인덱스 재구성이 해제된 모듈에서 실행되지 않도록 취소
+    if bpy.app.timers.is_registered(rebuild_boolean_target_cache):
+        bpy.app.timers.unregister(rebuild_boolean_target_cache)
+    restore_original_solvers()
+    _boolean_target_cache.clear()
+    _cutter_hosts.clear()
+    _collection_hosts.clear()
+    _id_names.clear()
+    if bpy.app.timers.is_registered(_process_solver_timing_queue):
+        bpy.app.timers.unregister(_process_solver_timing_queue)
+    _solver_timing_queue.clear()
     for cls in reversed(classes):
         try:
             bpy.utils.unregister_class(cls)
-            print(f"✓ 해제 성공: {cls.__name__}")
+            logger.debug("해제 성공: %s", cls.__name__)
         except Exception as e:
-            print(f"✗ 해제 실패: {cls.__name__} - {e}")
+            logger.error("해제 실패: %s - %s", cls.__name__, e)
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
@@ -0,0 +1,45 @@
+import numpy as np
+
+# ─────────────────────────────────────────────
+# 바운딩 박스 일괄 계산 (NumPy)
+# ─────────────────────────────────────────────
+
+
+def world_bound_box_corners(objects, depsgraph=None):
+    """오브젝트들의 월드 바운딩 박스 8개 꼭짓점을 (N, 8, 3) 배열로 반환
+
+    depsgraph 를 넘기면 모디파이어가 적용된(평가된) 바운딩 박스를 사용합니다.
+    """
+    if not objects:
+        return np.empty((0, 8, 3))
+
+    # 모디파이어가 없는 오브젝트는 데이터가 같으면 바운딩 박스도 같으므로 공유 메시는 한 번만 읽음
+    local_corners = {}
+    corners = []
+    for obj in objects:
+        if depsgraph is not None:
+            corners.append([corner[:] for corner in obj.evaluated_get(depsgraph).bound_box])
+            continue
+        key = obj.data.name_full if obj.data is not None and not obj.modifiers else None
+        cached = local_corners.get(key) if key is not None else None
+        if cached is None:
+            cached = [corner[:] for corner in obj.bound_box]
+            if key is not None:
+                local_corners[key] = cached
+        corners.append(cached)
+
+    corners = np.array(corners, dtype=np.float64)
+    matrices = np.array([obj.matrix_world for obj in objects], dtype=np.float64)
+    # (N, 4, 4) 행렬을 (N, 8, 3) 꼭짓점에 한 번에 적용
+    return np.einsum('nij,nkj->nki', matrices[:, :3, :3], corners) + matrices[:, None, :3, 3]
+
+
+def mesh_local_bounds_center(mesh):
+    """메시 버텍스의 로컬 바운딩 박스 중심. 버텍스가 없으면 None"""
+    count = len(mesh.vertices)
+    if count == 0:
+        return None
+    co = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    co = co.reshape(count, 3)
+    return (co.min(axis=0).astype(np.float64) + co.max(axis=0)) * 0.5
@@ -9,6 +9,7 @@ bl_info = {
 }
 
 import bpy
+from ..profiling import profiled
 
 # ▼▼▼ 1단계: Getter/Setter 함수 정의 ▼▼▼
 # 이 함수들은 프록시 속성과 실제 속성 사이의 값을 주고받는 역할을 합니다.
@@ -33,16 +34,214 @@ def get_addon_prefs():
             default_height = 1080
         return DummyPrefs()
 
-def apply_camera_resolution(scene):
-    prefs = get_addon_prefs()
-    if not prefs.use_custom_camera_resolution: return
-    if not scene: return
+# ─────────────────────────────────────────────
+# 카메라별 렌더 프로필
+# ─────────────────────────────────────────────
+# 해상도 외에 프레임 범위, 픽셀 비율, 해상도 %, 투명 배경, 출력 경로를 카메라마다 지정합니다.
+# 켜 둔 항목만 적용하고, 씬 값과 다른 항목만 써서 불필요한 depsgraph/컴포지터 갱신을 피합니다.
+
+class CameraRenderProfile(bpy.types.PropertyGroup):
+    use_frame_range: bpy.props.BoolProperty(name="프레임 범위", default=False)
+    frame_start: bpy.props.IntProperty(name="시작", default=1, min=0)
+    frame_end: bpy.props.IntProperty(name="끝", default=250, min=0)
+    use_pixel_aspect: bpy.props.BoolProperty(name="픽셀 비율", default=False)
+    pixel_aspect_x: bpy.props.FloatProperty(name="X", default=1.0, min=1.0, max=200.0)
+    pixel_aspect_y: bpy.props.FloatProperty(name="Y", default=1.0, min=1.0, max=200.0)
+    use_percentage: bpy.props.BoolProperty(name="해상도 %", default=False)
+    resolution_percentage: bpy.props.IntProperty(name="%", default=100, min=1, max=32767, subtype='PERCENTAGE')
+    use_film_transparent: bpy.props.BoolProperty(name="투명 배경", default=False)
+    film_transparent: bpy.props.BoolProperty(name="투명", default=False)
+    use_output_path: bpy.props.BoolProperty(name="출력 경로", default=False)
+    filepath: bpy.props.StringProperty(name="경로", default="//render/", subtype='FILE_PATH')
+
+# (사용 여부, 프로필 속성, 씬 쪽 대상, 씬 속성). 프레임은 시작 → 끝 순서로 써야 범위가 뒤집히지 않습니다.
+PROFILE_FIELDS = (
+    ("use_frame_range", "frame_start", "scene", "frame_start"),
+    ("use_frame_range", "frame_end", "scene", "frame_end"),
+    ("use_pixel_aspect", "pixel_aspect_x", "render", "pixel_aspect_x"),
+    ("use_pixel_aspect", "pixel_aspect_y", "render", "pixel_aspect_y"),
+    ("use_percentage", "resolution_percentage", "render", "resolution_percentage"),
+    ("use_film_transparent", "film_transparent", "render", "film_transparent"),
+    ("use_output_path", "filepath", "render", "filepath"),
+)
+
+def profile_settings(cam_obj):
+    """켜 둔 항목의 (대상, 속성, 값) 튜플"""
+    profile = cam_obj.camera_render_profile
+    return tuple(
+        (owner, attr, getattr(profile, prop))
+        for use, prop, owner, attr in PROFILE_FIELDS
+        if getattr(profile, use)
+    )
+
+def apply_settings_diff(scene, settings):
+    """씬 값과 다른 항목만 쓰고 쓴 개수를 반환"""
+    written = 0
+    for owner_name, attr, value in settings:
+        owner = scene.render if owner_name == "render" else scene
+        if getattr(owner, attr) != value:
+            setattr(owner, attr, value)
+            written += 1
+    return written
+
+# 마지막으로 적용한 (씬, 카메라, 가로, 세로, 프로필). 같으면 핸들러가 아무 것도 하지 않습니다.
+_last_applied_resolution = None
+
+# 핸들러 호출 횟수 / 실제 적용 횟수 (재생·작업 중 얼마나 자주 동작하는지 확인용)
+resolution_sync_stats = {"handler_calls": 0, "applied": 0, "written": 0}
+
+def get_camera_resolution_key(scene, prefs):
     cam_obj = scene.camera
-    if cam_obj and cam_obj.type == 'CAMERA':
+    if not (cam_obj and cam_obj.type == 'CAMERA'): return None
+    if prefs.use_custom_camera_resolution:
         res_x = cam_obj.get("resolution_x", prefs.default_width)
         res_y = cam_obj.get("resolution_y", prefs.default_height)
-        if scene.render.resolution_x != res_x: scene.render.resolution_x = res_x
-        if scene.render.resolution_y != res_y: scene.render.resolution_y = res_y
+    else:
+        res_x = res_y = None
+    return (scene.name, cam_obj.name, res_x, res_y, profile_settings(cam_obj))
+
+def invalidate_camera_resolution_cache():
+    global _last_applied_resolution
+    _last_applied_resolution = None
+
+def apply_camera_resolution(scene):
+    """활성 카메라의 해상도(커스텀 속성)와 렌더 프로필을 씬에 적용. 쓴 항목 수를 반환"""
+    global _last_applied_resolution
+    if not scene: return 0
+    prefs = get_addon_prefs()
+    key = get_camera_resolution_key(scene, prefs)
+    _last_applied_resolution = key
+    if not key: return 0
+    res_x, res_y, settings = key[2], key[3], key[4]
+    written = 0
+    if res_x is not None:
+        written += apply_settings_diff(scene, (("render", "resolution_x", res_x), ("render", "resolution_y", res_y)))
+    written += apply_settings_diff(scene, settings)
+    return written
+
+# ─────────────────────────────────────────────
+# 씬별 카메라 목록 (이전/다음, 카메라 선택용)
+# ─────────────────────────────────────────────
+# 씬 session_uid → {"cameras": [Object], "names": [이름], "index": {이름: 위치}, "dirty": bool}
+# 카메라 추가는 depsgraph 업데이트에서, 삭제/이름 변경은 보관한 참조를 확인해서 감지합니다.
+# 다시 만드는 작업(씬 전체 순회)은 타이머에서 한 번만 하고, 이전/다음은 index 조회만 합니다.
+_camera_registry = {}
+
+class CameraRegistryItem(bpy.types.PropertyGroup):
+    """카메라 선택 목록 항목 (name 만 사용)"""
+    pass
+
+def camera_sort_key(scene):
+    if scene.camera_sort_mode == 'SHOT':
+        return lambda cam: (cam.camera_shot_order, cam.name)
+    return lambda cam: cam.name
+
+def sync_camera_items(scene, names):
+    """패널 선택 목록을 names 와 맞춤. 같으면 쓰지 않음"""
+    items = scene.camera_registry_items
+    if len(items) == len(names) and all(item.name == name for item, name in zip(items, names)): return
+    items.clear()
+    for name in names:
+        items.add().name = name
+
+def rebuild_camera_registry(scene):
+    cameras = sorted((o for o in scene.objects if o.type == 'CAMERA'), key=camera_sort_key(scene))
+    names = [cam.name for cam in cameras]
+    registry = _camera_registry[scene.session_uid] = {
+        "cameras": cameras,
+        "names": names,
+        "index": {name: i for i, name in enumerate(names)},
+        "dirty": False,
+    }
+    sync_camera_items(scene, names)
+    return registry
+
+def get_camera_registry(scene):
+    registry = _camera_registry.get(scene.session_uid)
+    if registry is None or registry["dirty"]:
+        registry = rebuild_camera_registry(scene)
+    return registry
+
+def is_registry_valid(registry):
+    """보관한 카메라가 모두 살아 있고 이름이 그대로인지 (삭제되면 ReferenceError)"""
+    try:
+        return all(cam.name == name and cam.type == 'CAMERA' for cam, name in zip(registry["cameras"], registry["names"]))
+    except ReferenceError:
+        return False
+
+def _sync_camera_registries():
+    current = bpy.context.scene
+    live = set()
+    for scene in bpy.data.scenes:
+        live.add(scene.session_uid)
+        registry = _camera_registry.get(scene.session_uid)
+        if (registry is None and scene == current) or (registry is not None and registry["dirty"]):
+            rebuild_camera_registry(scene)
+    # 삭제된 씬의 목록 정리
+    for uid in _camera_registry.keys() - live:
+        del _camera_registry[uid]
+    return None
+
+def mark_camera_registry_dirty(scene):
+    registry = _camera_registry.get(scene.session_uid)
+    if registry is not None: registry["dirty"] = True
+    if not bpy.app.timers.is_registered(_sync_camera_registries):
+        bpy.app.timers.register(_sync_camera_registries, first_interval=0.1)
+
+def check_camera_registry(scene, depsgraph):
+    """depsgraph 업데이트에서 카메라 추가/삭제/이름 변경을 감지해 다시 만들기 예약"""
+    registry = _camera_registry.get(scene.session_uid)
+    if registry is None or registry["dirty"]: return
+    if depsgraph.id_type_updated('OBJECT'):
+        index = registry["index"]
+        for update in depsgraph.updates:
+            obj = update.id
+            if isinstance(obj, bpy.types.Object) and obj.type == 'CAMERA' and obj.original.name not in index:
+                mark_camera_registry_dirty(scene)
+                return
+    if not is_registry_valid(registry):
+        mark_camera_registry_dirty(scene)
+
+def is_scene_camera(scene, cam):
+    """cam 이 살아 있고 scene 에 링크된 카메라인지. users_scene 은 씬을 훑으므로 전환할 대상 하나에만 사용"""
+    try:
+        return cam.type == 'CAMERA' and scene in cam.users_scene
+    except ReferenceError:
+        return False
+
+def step_camera(scene, offset):
+    """목록에서 offset 만큼 이동한 카메라를 활성화. 카메라가 없으면 False"""
+    # 활성 카메라가 목록에 없으면(이름 변경 등) 첫 카메라로 건너뛰지 않도록 먼저 다시 만듦
+    registry = get_camera_registry(scene)
+    if scene.camera and scene.camera.name not in registry["index"]:
+        registry["dirty"] = True
+    for _ in range(2):
+        registry = get_camera_registry(scene)
+        cameras = registry["cameras"]
+        if not cameras: return False
+        current = registry["index"].get(scene.camera.name) if scene.camera else None
+        target = cameras[(current + offset) % len(cameras)] if current is not None else cameras[0]
+        if is_scene_camera(scene, target):
+            scene.camera = target
+            return True
+        # 삭제되었거나 씬에서 빠진 카메라: 목록을 다시 만들고 한 번 더 시도
+        registry["dirty"] = True
+    return False
+
+def get_camera_picker(self):
+    return self.camera.name if self.camera else ""
+
+def set_camera_picker(self, value):
+    registry = get_camera_registry(self)
+    i = registry["index"].get(value)
+    if i is None: return
+    cam = registry["cameras"][i]
+    if is_scene_camera(self, cam): self.camera = cam
+    else: mark_camera_registry_dirty(self)
+
+def update_camera_order(self, context):
+    for scene in ([self] if isinstance(self, bpy.types.Scene) else self.users_scene):
+        mark_camera_registry_dirty(scene)
 
 # --- 오퍼레이터 (이전과 동일) ---
 class CAMERA_OT_add_resolution_properties(bpy.types.Operator):
@@ -62,6 +261,24 @@ class CAMERA_OT_add_resolution_properties(bpy.types.Operator):
         apply_camera_resolution(context.scene)
         return {'FINISHED'}
 
+class CAMERA_OT_capture_render_profile(bpy.types.Operator):
+    bl_idname = "camera.capture_render_profile"
+    bl_label = "현재 값 가져오기"
+    bl_description = "현재 씬의 렌더 설정을 활성 카메라의 렌더 프로필에 복사합니다 (사용 여부는 그대로)"
+    bl_options = {'REGISTER', 'UNDO'}
+    def execute(self, context):
+        scene = context.scene
+        cam_obj = scene.camera
+        if not (cam_obj and cam_obj.type == 'CAMERA'):
+            self.report({'WARNING'}, "활성화된 카메라가 없습니다.")
+            return {'CANCELLED'}
+        profile = cam_obj.camera_render_profile
+        for use, prop, owner_name, attr in PROFILE_FIELDS:
+            owner = scene.render if owner_name == "render" else scene
+            setattr(profile, prop, getattr(owner, attr))
+        invalidate_camera_resolution_cache()
+        return {'FINISHED'}
+
 class VIEW3D_OT_align_camera_to_view(bpy.types.Operator):
     bl_idname = "view3d.align_camera_to_view"
     bl_label = "새 카메라"
@@ -89,26 +306,27 @@ class VIEW3D_OT_camera_select_prev(bpy.types.Operator):
     bl_idname = "view3d.camera_select_prev"
     bl_label = "이전 카메라"
     def execute(self, context):
-        scene, cameras = context.scene, sorted([o for o in context.scene.objects if o.type == 'CAMERA'], key=lambda c: c.name)
-        if not cameras: return {'CANCELLED'}
-        try:
-            idx = (cameras.index(scene.camera) - 1) % len(cameras)
-        except (ValueError, IndexError):
-            idx = 0
-        scene.camera = cameras[idx]
+        if not step_camera(context.scene, -1): return {'CANCELLED'}
         return {'FINISHED'}
 
 class VIEW3D_OT_camera_select_next(bpy.types.Operator):
     bl_idname = "view3d.camera_select_next"
     bl_label = "다음 카메라"
     def execute(self, context):
-        scene, cameras = context.scene, sorted([o for o in context.scene.objects if o.type == 'CAMERA'], key=lambda c: c.name)
-        if not cameras: return {'CANCELLED'}
-        try:
-            idx = (cameras.index(scene.camera) + 1) % len(cameras)
-        except (ValueError, IndexError):
-            idx = 0
-        scene.camera = cameras[idx]
+        if not step_camera(context.scene, 1): return {'CANCELLED'}
+        return {'FINISHED'}
+
+class CAMERA_OT_report_resolution_sync_stats(bpy.types.Operator):
+    bl_idname = "camera.report_resolution_sync_stats"
+    bl_label = "해상도 동기화 통계"
+    bl_description = "카메라 해상도 동기화 핸들러의 호출 횟수와 실제 적용 횟수를 보고하고 초기화합니다"
+    def execute(self, context):
+        calls, applied = resolution_sync_stats["handler_calls"], resolution_sync_stats["applied"]
+        written = resolution_sync_stats["written"]
+        self.report({'INFO'}, f"Resolution sync: {applied} applied ({written} settings written) / {calls} depsgraph updates")
+        resolution_sync_stats["handler_calls"] = 0
+        resolution_sync_stats["applied"] = 0
+        resolution_sync_stats["written"] = 0
         return {'FINISHED'}
 
 class VIEW3D_OT_camera_view_toggle(bpy.types.Operator):
@@ -145,10 +363,15 @@ class MODIFIER_PIE_PT_camera_quick_settings(bpy.types.Panel):
         col.operator("view3d.align_camera_to_view", icon='FILE_NEW')
 
         row = col.row(align=True)
-        row.prop_search(scene, "camera", scene, "objects", text="", icon='CAMERA_DATA')
+        row.prop_search(scene, "camera_picker", scene, "camera_registry_items", text="", icon='CAMERA_DATA')
         row.operator("view3d.camera_select_prev", text="", icon='TRIA_UP')
         row.operator("view3d.camera_select_next", text="", icon='TRIA_DOWN')
 
+        row = col.row(align=True)
+        row.prop(scene, "camera_sort_mode", expand=True)
+        if scene.camera_sort_mode == 'SHOT' and cam_obj and cam_obj.type == 'CAMERA':
+            row.prop(cam_obj, "camera_shot_order", text="샷")
+
         row = col.row(align=True)
         is_camera_view = view.region_3d.view_perspective == 'CAMERA'
         op_text = "뷰 전환" if is_camera_view else "뷰 전환"
@@ -227,6 +450,29 @@ class MODIFIER_PIE_PT_camera_quick_settings(bpy.types.Panel):
             else:
                 col.label(text="카메라를 선택하세요.", icon='CAMERA_DATA')
 
+        if cam_obj and cam_obj.type == 'CAMERA':
+            profile = cam_obj.camera_render_profile
+            col.separator()
+            row = col.row(align=True)
+            row.label(text="렌더 프로필")
+            row.operator(CAMERA_OT_capture_render_profile.bl_idname, text="", icon='IMPORT')
+
+            groups = (
+                ("use_frame_range", ("frame_start", "frame_end")),
+                ("use_pixel_aspect", ("pixel_aspect_x", "pixel_aspect_y")),
+                ("use_percentage", ("resolution_percentage",)),
+                ("use_film_transparent", ("film_transparent",)),
+                ("use_output_path", ("filepath",)),
+            )
+            for use, props in groups:
+                row = col.row()
+                split = row.split(factor=0.5)
+                split.prop(profile, use)
+                values = split.row(align=True)
+                values.enabled = getattr(profile, use)
+                for prop in props:
+                    values.prop(profile, prop, text="")
+
 # --- 핸들러 및 등록/해제 (이전과 동일) ---
 temp_res_on_save = None
 def initialize_default_camera():
@@ -240,16 +486,28 @@ def initialize_default_camera():
     return None
 
 @bpy.app.handlers.persistent
+@profiled("camera.depsgraph_update_post")
 def on_depsgraph_update_post(scene, depsgraph):
-    if depsgraph.id_type_updated('CAMERA') or depsgraph.id_type_updated('OBJECT'):
-        apply_camera_resolution(scene)
-        if hasattr(bpy.context, "screen"):
-            for window in bpy.context.window_manager.windows:
-                for area in window.screen.areas:
-                    if area.type == 'VIEW_3D':
-                        area.tag_redraw()
+    resolution_sync_stats["handler_calls"] += 1
+    if not (depsgraph.id_type_updated('CAMERA') or depsgraph.id_type_updated('OBJECT')
+            or depsgraph.id_type_updated('SCENE')):
+        return
+    check_camera_registry(scene, depsgraph)
+    prefs = get_addon_prefs()
+    # 활성 카메라와 해상도/프로필 값이 그대로면 쓰기/리드로우 모두 생략
+    if get_camera_resolution_key(scene, prefs) == _last_applied_resolution: return
+    written = apply_camera_resolution(scene)
+    resolution_sync_stats["applied"] += 1
+    resolution_sync_stats["written"] += written
+    if not written: return
+    if hasattr(bpy.context, "screen"):
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
 
 @bpy.app.handlers.persistent
+@profiled("camera.save_pre")
 def on_save_pre(dummy):
     prefs = get_addon_prefs()
     if not prefs.use_custom_camera_resolution: return
@@ -265,6 +523,7 @@ def on_save_pre(dummy):
         bpy.context.view_layer.update()
 
 @bpy.app.handlers.persistent
+@profiled("camera.save_post")
 def on_save_post(dummy):
     global temp_res_on_save
     if not hasattr(bpy.context, "scene") or not bpy.context.scene or not temp_res_on_save:
@@ -275,14 +534,23 @@ def on_save_post(dummy):
     temp_res_on_save = None
 
 @bpy.app.handlers.persistent
+@profiled("camera.load_post")
 def on_load_post(dummy):
+    invalidate_camera_resolution_cache()
+    _camera_registry.clear()
+    if not bpy.app.timers.is_registered(_sync_camera_registries):
+        bpy.app.timers.register(_sync_camera_registries, first_interval=0.1)
     bpy.app.timers.register(initialize_default_camera, first_interval=0.1)
 
 classes = (
+    CameraRegistryItem,
+    CameraRenderProfile,
     CAMERA_OT_add_resolution_properties,
+    CAMERA_OT_capture_render_profile,
     VIEW3D_OT_align_camera_to_view,
     VIEW3D_OT_camera_select_prev,
     VIEW3D_OT_camera_select_next,
+    CAMERA_OT_report_resolution_sync_stats,
     VIEW3D_OT_camera_view_toggle,
     VIEW3D_OT_lock_camera_toggle,
     MODIFIER_PIE_PT_camera_quick_settings,
@@ -310,6 +578,29 @@ def register():
         set=set_passepartout_proxy
     )
 
+    bpy.types.Object.camera_render_profile = bpy.props.PointerProperty(type=CameraRenderProfile)
+    bpy.types.Scene.camera_registry_items = bpy.props.CollectionProperty(type=CameraRegistryItem)
+    bpy.types.Scene.camera_picker = bpy.props.StringProperty(
+        name="카메라",
+        description="씬의 카메라 중에서 활성 카메라를 선택합니다",
+        get=get_camera_picker,
+        set=set_camera_picker
+    )
+    bpy.types.Scene.camera_sort_mode = bpy.props.EnumProperty(
+        name="카메라 순서",
+        description="이전/다음 카메라와 선택 목록의 순서",
+        items=[('NAME', "이름순", "카메라 이름 순서"),
+               ('SHOT', "샷 순서", "카메라마다 지정한 샷 번호 순서 (같으면 이름순)")],
+        default='NAME',
+        update=update_camera_order
+    )
+    bpy.types.Object.camera_shot_order = bpy.props.IntProperty(
+        name="샷 순서",
+        description="샷 순서로 정렬할 때 사용할 번호",
+        min=0,
+        update=update_camera_order
+    )
+
     handlers = [
         (bpy.app.handlers.depsgraph_update_post, on_depsgraph_update_post),
         (bpy.app.handlers.save_pre, on_save_pre),
@@ -320,6 +611,7 @@ def register():
         if handler_func not in handler_list:
             handler_list.append(handler_func)
     bpy.app.timers.register(initialize_default_camera, first_interval=0)
+    bpy.app.timers.register(_sync_camera_registries, first_interval=0.1)
 
 def unregister():
     handlers = [
@@ -339,5 +631,16 @@ def unregister():
     if hasattr(bpy.types.Camera, 'passepartout_proxy'):
         del bpy.types.Camera.passepartout_proxy
 
+    if bpy.app.timers.is_registered(_sync_camera_registries):
+        bpy.app.timers.unregister(_sync_camera_registries)
+    _camera_registry.clear()
+    for attr in ("camera_registry_items", "camera_picker", "camera_sort_mode"):
+        if hasattr(bpy.types.Scene, attr):
+            delattr(bpy.types.Scene, attr)
+    if hasattr(bpy.types.Object, 'camera_shot_order'):
+        del bpy.types.Object.camera_shot_order
+    if hasattr(bpy.types.Object, 'camera_render_profile'):
+        del bpy.types.Object.camera_render_profile
+
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
\ No newline at end of file
@@ -1,5 +1,8 @@
 import bpy
-from mathutils import Vector
+import numpy as np
+from mathutils import Matrix, Vector
+
+from . import bounds
 
 # ─────────────────────────────────────────────
 # 1) 그루핑 오퍼레이터
@@ -32,31 +35,74 @@ class OBJECT_OT_group_by_empty(bpy.types.Operator):
         # 1) XY 평균 무게중심
         center = sum((o.matrix_world.translation for o in sel), Vector()) / len(sel)
 
-        # 2) 선택 오브젝트들의 바운딩 박스 최상단 Z
-        max_z = max(max(o.matrix_world @ Vector(corner) for corner in o.bound_box)[2]
-                    for o in sel)
+        # 2) 선택 오브젝트들의 바운딩 박스 최상단 Z (N×8 꼭짓점 일괄 계산)
+        max_z = float(bounds.world_bound_box_corners(sel)[:, :, 2].max())
 
         # 3) Empty 위치 = 무게중심 XY + (최상단 Z + 5 m)
         empty_location = Vector((center.x, center.y, max_z + 5.0))
 
-        # 4) 각 오브젝트 오리진을 지오메트리 중앙으로
+        # 4) 각 오브젝트 오리진을 지오메트리(바운딩 박스) 중앙으로
+        #    origin_set 오퍼레이터 대신 데이터를 직접 이동하고 월드 행렬로 보정
+        sel_set = set(sel)
+        world_matrices = {o: o.matrix_world.copy() for o in sel}
+        processed_data = set()
+        data_users = None
         for obj in sel:
-            obj.select_set(True)
-            context.view_layer.objects.active = obj
-            for other in sel:
-                if other != obj:
-                    other.select_set(False)
-            bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY')
-
-        # 5) 선택한 오브젝트를 루트(Scene Collection)로 이동
+            data = obj.data
+            if data is None or data.name_full in processed_data:
+                continue
+            if obj.type == 'MESH':
+                offset = bounds.mesh_local_bounds_center(data)
+            elif obj.type in {'CURVE', 'SURFACE'}:
+                corners = np.array([c[:] for c in obj.bound_box])
+                offset = (corners.min(axis=0) + corners.max(axis=0)) * 0.5
+            else:
+                continue
+            processed_data.add(data.name_full)
+            if offset is None:
+                continue
+            offset = Vector(offset)
+            if offset.length < 1e-6:
+                continue
+
+            data.transform(Matrix.Translation(-offset), shape_keys=True)
+
+            # 같은 데이터를 쓰는 오브젝트 모두 보정
+            users = [obj]
+            if data.users > 1:
+                if data_users is None:
+                    data_users = {}
+                    for o in bpy.data.objects:
+                        if o.data is not None:
+                            data_users.setdefault(o.data.name_full, []).append(o)
+                users = data_users.get(data.name_full, users)
+            shift = Matrix.Translation(offset)
+            for user in users:
+                if user in sel_set:
+                    world_matrices[user] = world_matrices[user] @ shift
+                else:
+                    user.matrix_world = user.matrix_world @ shift
+                # 선택되지 않은 자식은 제자리에 유지
+                for child in user.children:
+                    if child not in sel_set:
+                        child.matrix_parent_inverse = shift.inverted() @ child.matrix_parent_inverse
+
+        # 5) 선택한 오브젝트를 루트(Scene Collection)로 이동 (한 번에 재링크)
         scene_collection = context.scene.collection
         for obj in sel:
+            in_root = False
             for col in obj.users_collection:
-                col.objects.unlink(obj)
-            scene_collection.objects.link(obj)
+                if col == scene_collection:
+                    in_root = True
+                else:
+                    col.objects.unlink(obj)
+            if not in_root:
+                scene_collection.objects.link(obj)
 
         # 6) Empty를 루트(Scene Collection)에 직접 생성-링크
-        bpy.ops.object.select_all(action='DESELECT')
+        for o in context.selected_objects:
+            if o not in sel_set:
+                o.select_set(False)
 
         empty = bpy.data.objects.new("TempEmpty", None)          # 데이터 생성
         empty.empty_display_type = 'PLAIN_AXES'
@@ -72,11 +118,14 @@ class OBJECT_OT_group_by_empty(bpy.types.Operator):
             i += 1
         empty.name = name
 
-        # 8) 선택 오브젝트들을 다시 선택해 Empty에 부모로 설정
+        # 8) Empty에 부모로 설정 (월드 변환 유지)
+        empty_inverse = Matrix.Translation(empty_location).inverted()
         for o in sel:
+            o.parent = empty
+            o.matrix_parent_inverse = empty_inverse
+            o.matrix_basis = world_matrices[o]
             o.select_set(True)
         context.view_layer.objects.active = empty
-        bpy.ops.object.parent_set(type='OBJECT', keep_transform=True)
 
         # 9) 완료 메시지
         self.report({'INFO'}, f"Grouped {len(sel)} object(s) into '{empty.name}' "
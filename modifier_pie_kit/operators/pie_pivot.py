@@ -1,6 +1,9 @@
 import bpy
 import os
 import bpy.utils.previews
+from ..log import get_logger
+
+logger = get_logger(__name__)
 
 custom_icons = None
 
@@ -38,124 +41,149 @@ class INTERNAL_OT_create_image_plane(bpy.types.Operator):
         return {'RUNNING_MODAL'}
 
 
-class PIE_MT_pivot_pie(bpy.types.Menu):
-    bl_label = " "
-    bl_idname = "PIE_MT_pivot_pie"
+# ─────────────────────────────────────────────
+# 파이 메뉴 레이아웃 테이블
+# ─────────────────────────────────────────────
+# 항목: (오퍼레이터, 표시 이름, 기본 아이콘, 커스텀 아이콘 이름, 오퍼레이터 속성)
+# None 은 빈 칸(separator), LABEL 은 빈 라벨입니다.
+LABEL = "LABEL"
+
+PIE_LAYOUT = (
+    # 왼쪽
+    (
+        ("modifier_pie.origin_to_geometry", "Geometry", 'OBJECT_ORIGIN', "object_origin_icon", ()),
+        ("object.origin_to_bottom", "Bottom", 'AXIS_TOP', None, ()),
+        ("modifier_pie.origin_to_cursor", "3D Cursor", 'PIVOT_CURSOR', "pivot_cursor_icon", ()),
+        ("modifier_pie.cursor_to_selection", "to Select", 'CURSOR', None, ()),
+        ("modifier_pie.cursor_to_origin", "World Origin", 'FILE_REFRESH', "file_refresh_icon", ()),
+        ("modifier_pie.selection_to_cursor", "to Cursor", 'FORWARD', None, ()),
+        ("modifier_pie.toggle_pivot", "Tog Pivot", 'PIVOT_MEDIAN', None, ()),
+        ("view3d.toggle_overlay", "Tog Overlay", 'OVERLAY', None, ()),
+        ("view3d.view_selected", "Focus", 'ZOOM_SELECTED', None, ()),
+        None,
+        ("modifier_pie.apply_all_common_modifiers", "Apply All", 'CHECKMARK', None, ()),
+        ("object.transform_apply", "Scale&Rot", 'CON_LOCLIKE', None, (("location", False), ("rotation", True), ("scale", True))),
+    ),
+    # 오른쪽
+    (
+        ("mesh_vertex.add_vertex_at_cursor", "Vertex", 'VERTEXSEL', None, ()),
+        ("mesh.primitive_plane_add", "Plane", 'MESH_PLANE', None, ()),
+        ("mesh.primitive_cube_add", "Cube", 'MESH_CUBE', None, ()),
+        ("mesh.primitive_circle_add", "Circle", 'MESH_CIRCLE', None, ()),
+        ("mesh.primitive_uv_sphere_add", "Sphere", 'MESH_UVSPHERE', None, ()),
+        ("mesh.primitive_cylinder_add", "Cylinder", 'MESH_CYLINDER', None, ()),
+        ("curve.primitive_nurbs_path_add", "Nb Path", 'CURVE_PATH', None, ()),
+        ("curve.primitive_nurbs_curve_add", "Nb Curve", 'CURVE_NCURVE', None, ()),
+        ("curve.primitive_bezier_circle_add", "Bz Circle", 'CURVE_BEZCIRCLE', None, ()),
+        ("internal.create_image_plane", "Reference", 'IMAGE_REFERENCE', None, ()),
+        ("object.empty_add", "Empty Axes", 'EMPTY_AXIS', None, (("type", 'PLAIN_AXES'),)),
+        LABEL,
+    ),
+    # 아래
+    (
+        None,
+        ("modifier_pie.move_bottom_to_z0", "Drop", 'TRIA_DOWN', None, ()),
+        None,
+        ("modifier_pie.add_solidify_popup", "Solidify", 'MOD_SOLIDIFY', None, ()),
+        ("modifier_pie.add_boolean_popup", "Boolean", 'MOD_BOOLEAN', None, ()),
+        ("modifier_pie.add_subsurf_popup", "Subsur", 'MOD_SUBSURF', None, ()),
+        ("modifier_pie.mirror_live_popup", "Mirror", 'MOD_MIRROR', None, ()),
+        ("modifier_pie.add_bevel_popup", "Bevel", 'MOD_BEVEL', None, ()),
+        ("modifier_pie.rotational_array", "Rotate", 'FORCE_MAGNETIC', None, ()),
+        ("modifier_pie.add_array_popup", "Array", 'MOD_ARRAY', None, ()),
+        ("modifier_pie.add_screw_popup", "Screw", 'MOD_SCREW', None, ()),
+        ("modifier_pie.add_wireframe_popup", "Wire", 'MOD_WIREFRAME', None, ()),
+    ),
+)
 
-    def draw(self, context):
-        layout = self.layout
-        pie = layout.menu_pie()
+# 빈 파이 슬롯 수 (나머지 방향은 비워 둠)
+PIE_EMPTY_SLOTS = 5
+
+ADDON_NAME = __name__.split('.')[0]
+
+# 아이콘 크기와 아이콘/텍스트가 결정된 항목 목록. 환경설정의 icon_size/show_text 가 바뀌면
+# preferences.py 의 update 콜백이 비웁니다. draw 에서는 환경설정을 읽지 않습니다.
+_layout_cache = {"icon_scale": 1.0, "sections": None}
 
+
+def invalidate_pie_layout():
+    _layout_cache["sections"] = None
+
+
+def build_pie_layout(show_text):
+    """PIE_LAYOUT 의 텍스트와 아이콘을 미리 결정해 draw 에서 바로 쓸 수 있게 만듭니다"""
+    icons = get_custom_icons()
+    sections = []
+    for entries in PIE_LAYOUT:
+        prepared = []
+        for entry in entries:
+            if entry is None or entry is LABEL:
+                prepared.append(entry)
+                continue
+            idname, text, icon, custom_icon, props = entry
+            if custom_icon and custom_icon in icons:
+                icon_kwargs = {"icon_value": icons[custom_icon].icon_id}
+            else:
+                icon_kwargs = {"icon": icon}
+            prepared.append((idname, text if show_text else "", icon_kwargs, props))
+        sections.append(tuple(prepared))
+    return tuple(sections)
+
+
+def get_pie_layout(context):
+    if _layout_cache["sections"] is None:
         try:
-            addon_name = __name__.split('.')[0]
-            prefs = context.preferences.addons[addon_name].preferences
+            prefs = context.preferences.addons[ADDON_NAME].preferences
             icon_scale = prefs.icon_size
             show_text = prefs.show_text
         except (KeyError, AttributeError):
             icon_scale = 1.0
             show_text = True
+        _layout_cache["icon_scale"] = icon_scale
+        _layout_cache["sections"] = build_pie_layout(show_text)
+    return _layout_cache["icon_scale"], _layout_cache["sections"]
 
-        grid_left = pie.grid_flow(row_major=True, columns=3, even_columns=True, even_rows=True, align=True)
-        grid_left.scale_x = icon_scale
-        grid_left.scale_y = icon_scale
-
-        if custom_icons and "object_origin_icon" in custom_icons:
-            
-            grid_left.operator("modifier_pie.origin_to_geometry", text="Geometry" if show_text else "", 
-                               icon_value=custom_icons["object_origin_icon"].icon_id)
-        else:
-            grid_left.operator("modifier_pie.origin_to_geometry", text="Geometry" if show_text else "", icon='OBJECT_ORIGIN')
 
+class PIE_MT_pivot_pie(bpy.types.Menu):
+    bl_label = " "
+    bl_idname = "PIE_MT_pivot_pie"
 
-        grid_left.operator("object.origin_to_bottom", text="Bottom" if show_text else "", icon='AXIS_TOP')
-
-   
-        if custom_icons and "pivot_cursor_icon" in custom_icons:
-            
-            grid_left.operator("modifier_pie.origin_to_cursor", text="3D Cursor" if show_text else "", 
-                               icon_value=custom_icons["pivot_cursor_icon"].icon_id)
-        else:
-            grid_left.operator("modifier_pie.origin_to_cursor", text="3D Cursor" if show_text else "", icon='PIVOT_CURSOR')
-        
-        
-        grid_left.operator("modifier_pie.cursor_to_selection", text="to Select" if show_text else "", icon='CURSOR')
-
-        if custom_icons and "file_refresh_icon" in custom_icons:
-            
-            grid_left.operator("modifier_pie.cursor_to_origin", text="World Origin" if show_text else "", 
-                               icon_value=custom_icons["file_refresh_icon"].icon_id)
-        else:
-            grid_left.operator("modifier_pie.cursor_to_origin", text="World Origin" if show_text else "", icon='FILE_REFRESH')
-
-        grid_left.operator("modifier_pie.selection_to_cursor", text="to Cursor" if show_text else "", icon='FORWARD')
-        grid_left.operator("modifier_pie.toggle_pivot", text="Tog Pivot" if show_text else "", icon='PIVOT_MEDIAN')
-        grid_left.operator("view3d.toggle_overlay", text="Tog Overlay" if show_text else "", icon='OVERLAY')
-        grid_left.operator("view3d.view_selected", text="Focus" if show_text else "", icon='ZOOM_SELECTED')
-        grid_left.separator()
-        grid_left.operator("modifier_pie.apply_all_common_modifiers", text="Apply All" if show_text else "", icon='CHECKMARK')        
-        op = grid_left.operator("object.transform_apply", text="Scale&Rot" if show_text else "", icon='CON_LOCLIKE')
-        op.location = False
-        op.rotation = True 
-        op.scale = True
-        
-        # (이하 생략 - draw 함수의 나머지 부분은 기존과 동일합니다.)
-
-        grid_right = pie.grid_flow(row_major=True, columns=3, even_columns=True, even_rows=True, align=True)
-        grid_right.scale_x = icon_scale
-        grid_right.scale_y = icon_scale
-        grid_right.operator("mesh_vertex.add_vertex_at_cursor", text="Vertex" if show_text else "", icon='VERTEXSEL')
-        grid_right.operator("mesh.primitive_plane_add", text="Plane" if show_text else "", icon='MESH_PLANE')
-        grid_right.operator("mesh.primitive_cube_add", text="Cube" if show_text else "", icon='MESH_CUBE')
-        grid_right.operator("mesh.primitive_circle_add", text="Circle" if show_text else "", icon='MESH_CIRCLE')
-        grid_right.operator("mesh.primitive_uv_sphere_add", text="Sphere" if show_text else "", icon='MESH_UVSPHERE')
-        grid_right.operator("mesh.primitive_cylinder_add", text="Cylinder" if show_text else "", icon='MESH_CYLINDER')
-        grid_right.operator("curve.primitive_nurbs_path_add", text="Nb Path" if show_text else "", icon='CURVE_PATH')
-        grid_right.operator("curve.primitive_nurbs_curve_add", text="Nb Curve" if show_text else "", icon='CURVE_NCURVE')
-        grid_right.operator("curve.primitive_bezier_circle_add", text="Bz Circle" if show_text else "", icon='CURVE_BEZCIRCLE')
-        
-        grid_right.operator("internal.create_image_plane", text="Reference" if show_text else "", icon='IMAGE_REFERENCE')
-        empty_axes = grid_right.operator("object.empty_add", text="Empty Axes" if show_text else "", icon='EMPTY_AXIS')
-        empty_axes.type = 'PLAIN_AXES'
-
-        grid_right.label(text="")
-
-        grid_bottom = pie.grid_flow(row_major=True, columns=3, even_columns=True, even_rows=True, align=True)
-        grid_bottom.scale_x = icon_scale
-        grid_bottom.scale_y = icon_scale
-        grid_bottom.separator()
-        grid_bottom.operator("modifier_pie.move_bottom_to_z0", text="Drop" if show_text else "", icon='TRIA_DOWN')
-        grid_bottom.separator()
-        grid_bottom.operator("modifier_pie.add_solidify_popup", text="Solidify" if show_text else "", icon='MOD_SOLIDIFY')
-        grid_bottom.operator("modifier_pie.add_boolean_popup", text="Boolean" if show_text else "", icon='MOD_BOOLEAN')
-        grid_bottom.operator("modifier_pie.add_subsurf_popup", text="Subsur" if show_text else "", icon='MOD_SUBSURF')
-        grid_bottom.operator("modifier_pie.mirror_live_popup", text="Mirror" if show_text else "", icon='MOD_MIRROR')
-        grid_bottom.operator("modifier_pie.add_bevel_popup", text="Bevel" if show_text else "", icon='MOD_BEVEL')
-        grid_bottom.operator("modifier_pie.rotational_array", text="Rotate" if show_text else "", icon='FORCE_MAGNETIC')
-        grid_bottom.operator("modifier_pie.add_array_popup", text="Array" if show_text else "", icon='MOD_ARRAY')
-        grid_bottom.operator("modifier_pie.add_screw_popup", text="Screw" if show_text else "", icon='MOD_SCREW')        
-        grid_bottom.operator("modifier_pie.add_wireframe_popup", text="Wire" if show_text else "", icon='MOD_WIREFRAME')
-        
-
-        pie.separator()
-        pie.separator()
-        pie.separator()
-        pie.separator()
-        pie.separator()
+    def draw(self, context):
+        pie = self.layout.menu_pie()
+        icon_scale, sections = get_pie_layout(context)
+
+        for entries in sections:
+            grid = pie.grid_flow(row_major=True, columns=3, even_columns=True, even_rows=True, align=True)
+            grid.scale_x = icon_scale
+            grid.scale_y = icon_scale
+            for entry in entries:
+                if entry is None:
+                    grid.separator()
+                elif entry is LABEL:
+                    grid.label(text="")
+                else:
+                    idname, text, icon_kwargs, props = entry
+                    op = grid.operator(idname, text=text, **icon_kwargs)
+                    for name, value in props:
+                        setattr(op, name, value)
+
+        for _ in range(PIE_EMPTY_SLOTS):
+            pie.separator()
 
 classes = (
     INTERNAL_OT_create_image_plane,
     PIE_MT_pivot_pie,
 )
 
-def register():
-    print("--- PIVOT PIE ADDON REGISTERING ---")
+def get_custom_icons():
+    """파이 메뉴를 처음 그릴 때 아이콘을 불러옵니다 (애드온 등록 시간 단축)"""
     global custom_icons
-    custom_icons = bpy.utils.previews.new()
+    if custom_icons is not None:
+        return custom_icons
 
-    addon_dir = os.path.dirname(__file__)
-    icons_dir = os.path.join(addon_dir, "icons")
-    
-    print(f"Searching for icons in: {icons_dir}")
+    custom_icons = bpy.utils.previews.new()
+    icons_dir = os.path.join(os.path.dirname(__file__), "icons")
+    logger.debug("Searching for icons in: %s", icons_dir)
 
     if os.path.exists(icons_dir):
         loaded_icons = []
@@ -165,20 +193,25 @@ def register():
                 custom_icons.load(icon_name, os.path.join(icons_dir, f), 'IMAGE')
                 loaded_icons.append(icon_name)
         if loaded_icons:
-            print(f"Successfully loaded icons: {loaded_icons}")
+            logger.debug("Loaded icons: %s", loaded_icons)
         else:
-            print("Found 'icons' folder, but no .png files inside.")
+            logger.warning("Found 'icons' folder, but no .png files inside.")
     else:
-        print("Error: 'icons' folder not found.")
+        logger.warning("'icons' folder not found: %s", icons_dir)
+    return custom_icons
 
+
+def register():
     for cls in classes:
         bpy.utils.register_class(cls)
-    
-    print("--- REGISTER COMPLETE ---")
+
 
 def unregister():
     global custom_icons
-    bpy.utils.previews.remove(custom_icons)
+    if custom_icons is not None:
+        bpy.utils.previews.remove(custom_icons)
+        custom_icons = None
+    invalidate_pie_layout()
 
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
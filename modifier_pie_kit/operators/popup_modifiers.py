@@ -1,9 +1,66 @@
 import bpy
 import math
+import time
+import logging
 import bmesh
-from mathutils import Euler, Vector
+from mathutils import Euler, Matrix
 from bpy.types import Operator
 
+from . import batch_apply
+from . import bounds
+from . import popup_session
+from . import radial_instances
+from .popup_session import preview_update, capped_preview, coarse_voxel_preview
+from ..preferences import format_progress_bar
+from ..log import get_logger
+
+logger = get_logger(__name__)
+
+
+def apply_modifier_type(op, context, modifier_type, label):
+    """팝업의 Apply 버튼 공용 처리
+
+    use_selection 이 켜져 있으면 선택된 메시 전체의 첫 번째 modifier_type 모디파이어를
+    batch_apply 로 한 번에 적용하고, 아니면 활성 오브젝트에만 적용합니다.
+    """
+    popup_session.finish_popup_session()
+
+    if not op.use_selection:
+        mod = next((m for m in context.object.modifiers if m.type == modifier_type), None)
+        if not mod:
+            op.report({'WARNING'}, f"No {label} modifier found.")
+            return {'CANCELLED'}
+        bpy.ops.object.modifier_apply(modifier=mod.name)
+        return {'FINISHED'}
+
+    plans, skipped = [], []
+    for obj in context.selected_objects:
+        if obj.type != 'MESH':
+            continue
+        # 뷰포트에서 꺼 둔 모디파이어는 굽지 않음
+        mod = next((m for m in obj.modifiers if m.type == modifier_type and m.show_viewport), None)
+        if mod is None:
+            continue
+        # new_from_object 는 셰이프 키를 보존하지 못하므로 건너뜀
+        if obj.data.shape_keys:
+            skipped.append(obj.name)
+            continue
+        plans.append(batch_apply.build_apply_plan(obj, [mod.name]))
+
+    if not plans:
+        op.report({'WARNING'}, f"No {label} modifier found.")
+        return {'CANCELLED'}
+
+    start = time.perf_counter()
+    batch_apply.bake_plans(context, plans)
+    logger.info("%s 일괄 적용: %d개 오브젝트, %.3f초", label, len(plans), time.perf_counter() - start)
+
+    if skipped:
+        op.report({'WARNING'}, f"{label} applied to {len(plans)} objects, skipped {len(skipped)} with shape keys.")
+    else:
+        op.report({'INFO'}, f"{label} applied to {len(plans)} objects.")
+    return {'FINISHED'}
+
 
 # ─────────────────────────────────────────────
 # 회전 어레이
@@ -32,6 +89,19 @@ class MODIFIER_PIE_OT_rotational_array(bpy.types.Operator):
         default='Z'
     )
 
+    keep_mesh_data: bpy.props.BoolProperty(
+        name="Keep Mesh Data",
+        description="트랜스폼 적용/원점 이동 없이 엠프티 부모 행렬로 피벗을 맞춥니다. 메시 데이터와 링크 복제가 그대로 유지됩니다",
+        default=True
+    )
+
+    # 로컬 Z 축을 회전 축으로 돌리는 정렬 행렬 (피벗 엠프티는 항상 Z 회전만 드라이브)
+    AXIS_ALIGN = {
+        'X': Matrix.Rotation(math.radians(90.0), 4, 'Y'),
+        'Y': Matrix.Rotation(math.radians(-90.0), 4, 'X'),
+        'Z': Matrix.Identity(4),
+    }
+
     @classmethod
     def poll(cls, context):
         return (
@@ -46,11 +116,30 @@ class MODIFIER_PIE_OT_rotational_array(bpy.types.Operator):
         row = layout.row(align=True)
         row.prop(self, "axis", expand=True)
         layout.prop(self, "count")
+        if self.get_backend(context) == 'ARRAY':
+            layout.prop(self, "keep_mesh_data")
+
+    def get_backend(self, context):
+        try:
+            return context.preferences.addons["modifier_pie_kit"].preferences.rotational_array_backend
+        except (KeyError, AttributeError):
+            return 'ARRAY'
 
     def execute(self, context):
         obj = context.active_object
         cursor = context.scene.cursor.location.copy()
 
+        if self.get_backend(context) == 'INSTANCES':
+            # 지오메트리 노드 인스턴스: 드라이버 없이 개수만 입력값으로 바뀜
+            radial_instances.add_radial_instances(obj, self.count, self.axis, cursor)
+            self.report({'INFO'}, f"Rotational array (instances) created around {self.axis}-axis.")
+            return {'FINISHED'}
+
+        if self.keep_mesh_data:
+            self.build_keep_mesh_data(context, obj, cursor)
+            self.report({'INFO'}, f"Rotational array created around {self.axis}-axis.")
+            return {'FINISHED'}
+
         # 1) Apply transforms and move origin to 3D cursor
         bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
         bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
@@ -82,13 +171,7 @@ class MODIFIER_PIE_OT_rotational_array(bpy.types.Operator):
             drv_index = 2
 
         # 5) Add driver to update rotation dynamically
-        drv = empty_rotation.driver_add("rotation_euler", drv_index).driver
-        var = drv.variables.new()
-        var.name = "cnt"
-        var.targets[0].id_type = 'OBJECT'
-        var.targets[0].id = obj
-        var.targets[0].data_path = f'modifiers["{mod.name}"].count'
-        drv.expression = "radians(360/cnt)"
+        self.add_count_driver(empty_rotation, drv_index, obj, mod)
 
         # 6) Parent empty to object for grouped transform
         bpy.ops.object.select_all(action='DESELECT')
@@ -100,6 +183,50 @@ class MODIFIER_PIE_OT_rotational_array(bpy.types.Operator):
         self.report({'INFO'}, f"Rotational array created around {self.axis}-axis.")
         return {'FINISHED'}
 
+    def add_count_driver(self, empty, index, obj, mod):
+        drv = empty.driver_add("rotation_euler", index).driver
+        var = drv.variables.new()
+        var.name = "cnt"
+        var.targets[0].id_type = 'OBJECT'
+        var.targets[0].id = obj
+        var.targets[0].data_path = f'modifiers["{mod.name}"].count'
+        drv.expression = "radians(360/cnt)"
+
+    def build_keep_mesh_data(self, context, obj, cursor):
+        """오퍼레이터 호출 없이 데이터 API 로만 회전 어레이를 구성합니다.
+
+        피벗 엠프티(커서 위치, 드라이버로 Z 회전) 아래에 오프셋 엠프티를 두고,
+        부모 역행렬로 피벗까지의 이동을 상쇄해 오프셋 = M⁻¹ · R(커서, 각도) · M 이 되게 합니다.
+        """
+        collection = obj.users_collection[0] if obj.users_collection else context.scene.collection
+        obj_matrix = obj.matrix_world.copy()
+        align = self.AXIS_ALIGN[self.axis]
+        pivot_matrix = Matrix.Translation(cursor) @ align
+
+        pivot = bpy.data.objects.new(f"RotArray_Pivot_{obj.name}", None)
+        pivot.empty_display_type = 'SPHERE'
+        pivot.empty_display_size = 0.25
+        collection.objects.link(pivot)
+        pivot.parent = obj
+        pivot.matrix_parent_inverse = obj_matrix.inverted_safe() @ pivot_matrix
+        pivot.rotation_euler = Euler((0, 0, math.radians(360.0 / self.count)), 'XYZ')
+
+        empty_rotation = bpy.data.objects.new(f"RotArray_Empty_{obj.name}", None)
+        empty_rotation.empty_display_type = 'PLAIN_AXES'
+        collection.objects.link(empty_rotation)
+        empty_rotation.parent = pivot
+        empty_rotation.matrix_parent_inverse = pivot_matrix.inverted_safe() @ obj_matrix
+
+        if "RotationalArray" in obj.modifiers:
+            obj.modifiers.remove(obj.modifiers["RotationalArray"])
+        mod = obj.modifiers.new("RotationalArray", 'ARRAY')
+        mod.use_relative_offset = False
+        mod.use_object_offset = True
+        mod.offset_object = empty_rotation
+        mod.count = self.count
+
+        self.add_count_driver(pivot, 2, obj, mod)
+
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
 
@@ -108,7 +235,7 @@ class MODIFIER_PIE_OT_rotational_array(bpy.types.Operator):
 #  Bevel Modifier
 # ─────────────────────────────────────────────
 
-class MODIFIER_PIE_OT_add_bevel_popup(bpy.types.Operator):
+class MODIFIER_PIE_OT_add_bevel_popup(popup_session.MultiObjectPopup, bpy.types.Operator):
     bl_idname = "modifier_pie.add_bevel_popup"
     bl_label = "Add Bevel Modifier"
     bl_description = "선택한 오브젝트에 Bevel 모디파이어를 추가하고 설정창을 엽니다. 모서리를 부드럽게 깎습니다"
@@ -130,47 +257,69 @@ class MODIFIER_PIE_OT_add_bevel_popup(bpy.types.Operator):
         self.mod = next((m for m in obj.modifiers if m.type == 'BEVEL'), None)
         if not self.mod:
             self.mod = obj.modifiers.new(name="Bevel", type='BEVEL')
+        popup_session.begin_popup_multi_edit(self, context)
         return context.window_manager.invoke_props_dialog(self, width=300)
 
     def draw(self, context):
         mod = self.mod
         layout = self.layout
+        popup_session.draw_multi_object(layout, self)
         layout.prop(mod, "affect", expand=True, text="Affect")  # Vertices / Edges
         layout.prop(mod, "width_type", text="Width Type")
         layout.prop(mod, "width", text="Amount")
         layout.prop(mod, "segments", text="Segments")
         layout.separator()
-        layout.operator("modifier_pie.apply_modifier_bevel", text="Apply", icon='CHECKMARK')
+        op = layout.operator("modifier_pie.apply_modifier_bevel", text="Apply", icon='CHECKMARK')
+        op.use_selection = popup_session.linked_count() > 0
 
     def execute(self, context):
+        popup_session.finish_popup_session()
         return {'FINISHED'}
 
+    def cancel(self, context):
+        popup_session.finish_popup_session(cancelled=True)
+
 class MODIFIER_PIE_OT_apply_modifier_bevel(bpy.types.Operator):
     bl_idname = "modifier_pie.apply_modifier_bevel"
     bl_label = "Apply Bevel Modifier"
     bl_description = "Bevel 모디파이어를 적용합니다"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    use_selection: bpy.props.BoolProperty(name="Selected Objects", description="선택한 모든 메시의 Bevel 모디파이어를 한 번에 적용합니다", default=False)
 
     def execute(self, context):
-        mod = next((m for m in context.object.modifiers if m.type == 'BEVEL'), None)
-        if not mod:
-            self.report({'WARNING'}, "No Bevel modifier found.")
-            return {'CANCELLED'}
-        bpy.ops.object.modifier_apply(modifier=mod.name)
-        return {'FINISHED'}
+        return apply_modifier_type(self, context, 'BEVEL', "Bevel")
 
 
 # ─────────────────────────────────────────────
 # 미러 
 # ─────────────────────────────────────────────
 
-def update_mirror_modifier(self, context):
+def get_mirror_modifiers(context):
+    """선택된 메시마다 Mirror 모디파이어를 찾고, 없으면 만듭니다"""
+    mods = []
     for obj in context.selected_objects:
         if obj.type != 'MESH':
             continue
         mod = obj.modifiers.get("Mirror")
         if not mod:
             mod = obj.modifiers.new(name="Mirror", type='MIRROR')
-        mod.use_axis = (self.use_x, self.use_y, self.use_z)
+        mods.append(mod)
+    return mods
+
+
+def update_mirror_modifier(self, context):
+    # 팝업을 여는 동안 모디파이어 목록은 한 번만 모으고, 토글 시에는 바뀐 축만 씁니다
+    mods = getattr(self, '_mirror_mods', None)
+    if mods is None:
+        mods = self._mirror_mods = get_mirror_modifiers(context)
+    use_axis = (self.use_x, self.use_y, self.use_z)
+    for mod in mods:
+        try:
+            if tuple(mod.use_axis) != use_axis:
+                mod.use_axis = use_axis
+        except ReferenceError:
+            continue
         
     if not getattr(self, '_undo_pushed', False):
         bpy.ops.ed.undo_push(message="Mirror Preview")
@@ -194,6 +343,7 @@ class MODIFIER_PIE_OT_mirror_live_popup(bpy.types.Operator):
     def invoke(self, context, event):
         if hasattr(self, '_undo_pushed'):
             del self._undo_pushed
+        self._mirror_mods = get_mirror_modifiers(context)
         update_mirror_modifier(self, context)
         return context.window_manager.invoke_props_dialog(self, width=240)
 
@@ -217,15 +367,33 @@ class MODIFIER_PIE_OT_confirm_mirror_and_apply(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
+        # 활성 오브젝트를 바꿔 가며 modifier_apply 를 부르지 않고, depsgraph 한 번으로 일괄 적용
+        plans, skipped = [], []
         for obj in context.selected_objects:
             if obj.type != 'MESH':
                 continue
-            for mod in obj.modifiers:
-                if mod.type == 'MIRROR':
-                    context.view_layer.objects.active = obj
-                    bpy.ops.object.modifier_apply(modifier=mod.name)
-                    break
-        self.report({'INFO'}, "Mirror modifier applied.")
+            mod = next((m for m in obj.modifiers if m.type == 'MIRROR' and m.show_viewport), None)
+            if mod is None:
+                continue
+            if obj.data.shape_keys:
+                skipped.append(obj.name)
+                continue
+            plans.append(batch_apply.build_apply_plan(obj, [mod.name]))
+
+        if not plans:
+            self.report({'WARNING'}, "No Mirror modifier found.")
+            return {'CANCELLED'}
+
+        start = time.perf_counter()
+        mesh_count = len({obj.data.as_pointer() for obj, _, _ in plans})
+        # 같은 메시를 공유하는 오브젝트는 한 번만 평가하고 결과도 계속 공유
+        batch_apply.bake_plans(context, plans, share_meshes=True)
+        logger.info("Mirror 일괄 적용: 오브젝트 %d개, 메시 %d개, %.3f초", len(plans), mesh_count, time.perf_counter() - start)
+
+        if skipped:
+            self.report({'WARNING'}, f"Mirror modifier applied to {len(plans)} objects, skipped {len(skipped)} with shape keys.")
+        else:
+            self.report({'INFO'}, "Mirror modifier applied.")
         return {'FINISHED'}
 
     
@@ -238,6 +406,8 @@ class MODIFIER_PIE_OT_apply_all_common_modifiers(bpy.types.Operator):
     bl_description = "선택한 모든 오브젝트의 주요 모디파이어(Bevel, Mirror, Subsurf 등)를 한 번에 적용합니다"
     bl_options = {'REGISTER', 'UNDO'}
 
+    modifier_types = {'BOOLEAN', 'BEVEL', 'MIRROR', 'SUBSURF', 'ARRAY', 'SOLIDIFY', 'WIREFRAME', 'SCREW', 'REMESH', 'DISPLACE', 'DECIMATE'}
+
     @classmethod
     def poll(cls, context):
         return (
@@ -246,92 +416,187 @@ class MODIFIER_PIE_OT_apply_all_common_modifiers(bpy.types.Operator):
             any(obj.type == 'MESH' and len(obj.modifiers) > 0 for obj in context.selected_objects)
         )
     
+    # 이 개수 이하이면 모달 없이 바로 적용
+    sync_object_limit = 50
+    # 타이머 한 번에 쓰는 시간 (초)
+    chunk_time_budget = 0.1
+
+    _timer = None
+
     def execute(self, context):
-        selected_mesh_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
-        
-        if not selected_mesh_objects:
+        objects = self.get_target_objects(context)
+        if not objects:
             self.report({'WARNING'}, "No mesh objects selected.")
             return {'CANCELLED'}
 
-        total_applied = []
-        total_deleted = 0
-        processed_objects = 0
-        
-        modifier_types = ['BOOLEAN', 'BEVEL', 'MIRROR', 'SUBSURF', 'ARRAY', 'SOLIDIFY', 'WIREFRAME', 'SCREW', 'REMESH', 'DISPLACE', 'DECIMATE']
-        
-        for obj in selected_mesh_objects:
-            if len(obj.modifiers) == 0:
+        self.reset_stats()
+        try:
+            self.process_objects(context, objects)
+        except Exception as e:
+            self.report({'ERROR'}, f"Batch apply failed: {e}")
+            return {'CANCELLED'}
+        self.report_stats()
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        objects = self.get_target_objects(context)
+        if len(objects) <= self.sync_object_limit:
+            return self.execute(context)
+
+        # 많은 오브젝트는 타이머로 나눠서 처리 (ESC 로 중단, 처리된 오브젝트는 유지)
+        self.reset_stats()
+        self._queue = [obj.name for obj in objects]
+        self._total = len(self._queue)
+        self._chunk_size = 4
+        self._timer = context.window_manager.event_timer_add(0.01, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        self.update_status(context)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            return self.finish_modal(context, cancelled=True)
+
+        if event.type == 'TIMER':
+            try:
+                self.process_next_chunk(context)
+            except Exception as e:
+                self.report({'ERROR'}, f"Batch apply failed: {e}")
+                return self.finish_modal(context, cancelled=True)
+            if not self._queue:
+                return self.finish_modal(context)
+            self.update_status(context)
+            return {'RUNNING_MODAL'}
+
+        # 처리 중에도 뷰포트 이동은 허용
+        if event.type in {'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE', 'TRACKPADPAN', 'TRACKPADZOOM'}:
+            return {'PASS_THROUGH'}
+        return {'RUNNING_MODAL'}
+
+    def process_next_chunk(self, context):
+        chunk = self._queue[:self._chunk_size]
+        del self._queue[:self._chunk_size]
+        objects = [bpy.data.objects.get(name) for name in chunk]
+        objects = [obj for obj in objects if obj is not None and obj.type == 'MESH']
+
+        start = time.perf_counter()
+        self.process_objects(context, objects)
+        elapsed = time.perf_counter() - start
+
+        # 시간 예산에 맞춰 다음 청크 크기 조절
+        if elapsed < self.chunk_time_budget * 0.5:
+            self._chunk_size = min(self._chunk_size * 2, 256)
+        elif elapsed > self.chunk_time_budget and self._chunk_size > 1:
+            self._chunk_size //= 2
+
+    def update_status(self, context):
+        done = self._total - len(self._queue)
+        progress_bar = format_progress_bar(done / self._total if self._total else 1.0)
+        context.workspace.status_text_set_internal(
+            f"Applying modifiers {done}/{self._total} {progress_bar}  (ESC: stop)"
+        )
+
+    def finish_modal(self, context, cancelled=False):
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        context.workspace.status_text_set_internal(None)
+        if cancelled:
+            done = self._total - len(self._queue)
+            self.report({'WARNING'}, f"Stopped after {done}/{self._total} objects (processed objects kept)")
+        self.report_stats()
+        # 중단해도 이미 처리한 오브젝트는 한 번의 언두 스텝으로 남김
+        return {'FINISHED'}
+
+    def get_target_objects(self, context):
+        return [obj for obj in context.selected_objects if obj.type == 'MESH' and len(obj.modifiers) > 0]
+
+    def reset_stats(self):
+        self._stats = {
+            "deleted": 0,
+            "skipped_shape_keys": 0,
+            "processed": set(),
+            "applied_types": set(),
+            "timings": [],
+        }
+
+    def process_objects(self, context, objects):
+        stats = self._stats
+        plans = []
+        for obj in objects:
+            # 셰이프 키가 있는 메시는 모디파이어 적용이 불가능하므로 건드리지 않음
+            if obj.data.shape_keys:
+                logger.info("셰이프 키가 있어 스킵: %s", obj.name)
+                stats["skipped_shape_keys"] += 1
                 continue
-                
-            context.view_layer.objects.active = obj
-            
-            has_remesh = any(m.type == 'REMESH' for m in obj.modifiers)
-            has_displace = any(m.type == 'DISPLACE' for m in obj.modifiers)
-            has_subsurf = any(m.type == 'SUBSURF' for m in obj.modifiers)
-            skip_subsurf = has_remesh and has_displace and has_subsurf
-            
-            applied = []
-            failed_modifiers = []
-            
-            print(f"\n=== 오브젝트 '{obj.name}' 처리 시작 ===")
-            if skip_subsurf:
-                print(f"특정 조합(Remesh + Displace + Subsurf) 감지: Subsurf 적용 스킵")
-            
-            for t in modifier_types:
-                if skip_subsurf and t == 'SUBSURF':
-                    print(f"Subsurf 타입 스킵: {obj.name}")
-                    continue
-                
-                mods = [m for m in obj.modifiers if m.type == t]
-                
-                for mod in mods:
-                    try:
-                        if not mod.show_viewport:
-                            mod.show_viewport = True
-                            print(f"뷰포트 표시 활성화: {mod.name}")
-                        
-                        if not mod.show_render:
-                            mod.show_render = True
-                            print(f"렌더 표시 활성화: {mod.name}")
-                        
-                        if not self.validate_modifier(mod):
-                            print(f"모디파이어 유효성 검사 실패: {mod.name}")
-                            failed_modifiers.append(mod)
-                            continue
-                        
-                        modifier_name = mod.name
-                        bpy.ops.object.modifier_apply(modifier=modifier_name)
-                        applied.append(mod.type.title())
-                        print(f"모디파이어 적용 성공: {modifier_name}")
-                        
-                    except Exception as e:
-                        print(f"모디파이어 적용 실패 - {mod.name}: {e}")
-                        failed_modifiers.append(mod)
 
+            apply_names, failed_modifiers = self.collect_applicable_modifiers(obj)
             deleted_count = self.cleanup_failed_modifiers(obj, failed_modifiers)
-            
-            total_applied.extend(applied)
-            total_deleted += deleted_count
-            if applied or deleted_count > 0:
-                processed_objects += 1
-            
-            print(f"=== 오브젝트 '{obj.name}' 처리 완료 ===")
+            if deleted_count > 0:
+                stats["processed"].add(obj.name)
+                stats["deleted"] += deleted_count
+            plans.append(batch_apply.build_apply_plan(obj, apply_names))
+
+        # depsgraph 한 번 평가로 묶음 전체를 일괄 적용
+        timings = batch_apply.bake_plans(context, plans)
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for obj_name, elapsed, applied_types in timings:
+            stats["processed"].add(obj_name)
+            stats["applied_types"].update(t.title() for t in applied_types)
+            if debug:
+                logger.debug("모디파이어 적용 완료: %s (%d개, %.1f ms)", obj_name, len(applied_types), elapsed * 1000)
+        stats["timings"].extend(timings)
+
+    def report_stats(self):
+        stats = self._stats
+        timings = stats["timings"]
 
         messages = []
-        if processed_objects > 0:
-            messages.append(f"Processed {processed_objects} objects")
-        if total_applied:
-            unique_applied = list(set(total_applied))
-            messages.append(f"Applied: {', '.join(unique_applied)}")
-        if total_deleted > 0:
-            messages.append(f"Cleaned up: {total_deleted} failed modifiers")
+        if stats["processed"]:
+            messages.append(f"Processed {len(stats['processed'])} objects")
+        if stats["applied_types"]:
+            messages.append(f"Applied: {', '.join(sorted(stats['applied_types']))}")
+        if stats["deleted"] > 0:
+            messages.append(f"Cleaned up: {stats['deleted']} failed modifiers")
+        if stats["skipped_shape_keys"] > 0:
+            messages.append(f"Skipped {stats['skipped_shape_keys']} objects with shape keys")
+        if timings:
+            total_time = sum(t[1] for t in timings)
+            slowest = max(timings, key=lambda t: t[1])
+            messages.append(f"{total_time * 1000:.0f} ms (slowest: {slowest[0]} {slowest[1] * 1000:.0f} ms)")
             
         if messages:
             self.report({'INFO'}, " | ".join(messages))
         else:
             self.report({'INFO'}, "No applicable modifiers found in selected objects.")
-            
-        return {'FINISHED'}
+
+    def collect_applicable_modifiers(self, obj):
+        """적용할 모디파이어 이름과 유효성 검사에 실패한 모디파이어를 분류"""
+        has_remesh = any(m.type == 'REMESH' for m in obj.modifiers)
+        has_displace = any(m.type == 'DISPLACE' for m in obj.modifiers)
+        has_subsurf = any(m.type == 'SUBSURF' for m in obj.modifiers)
+        skip_subsurf = has_remesh and has_displace and has_subsurf
+
+        if skip_subsurf:
+            logger.debug("특정 조합(Remesh + Displace + Subsurf) 감지: Subsurf 적용 스킵 (%s)", obj.name)
+
+        apply_names = []
+        failed_modifiers = []
+        for mod in obj.modifiers:
+            if mod.type not in self.modifier_types:
+                continue
+            # 꺼 둔 모디파이어는 적용하지도, 정리 대상으로 지우지도 않음
+            if not mod.show_viewport:
+                continue
+            if skip_subsurf and mod.type == 'SUBSURF':
+                continue
+            if not self.validate_modifier(mod):
+                logger.info("모디파이어 유효성 검사 실패: %s", mod.name)
+                failed_modifiers.append(mod)
+                continue
+            apply_names.append(mod.name)
+        return apply_names, failed_modifiers
     
     def validate_modifier(self, mod):
         """모디파이어 유효성 검사"""
@@ -339,22 +604,22 @@ class MODIFIER_PIE_OT_apply_all_common_modifiers(bpy.types.Operator):
             if mod.type == 'BOOLEAN':
                 if mod.operand_type == 'OBJECT':
                     if not mod.object:
-                        print(f"Boolean 모디파이어 '{mod.name}': 타겟 오브젝트 없음")
+                        logger.info("Boolean 모디파이어 '%s': 타겟 오브젝트 없음", mod.name)
                         return False
                     if not mod.object.name in bpy.data.objects:
-                        print(f"Boolean 모디파이어 '{mod.name}': 타겟 오브젝트가 존재하지 않음")
+                        logger.info("Boolean 모디파이어 '%s': 타겟 오브젝트가 존재하지 않음", mod.name)
                         return False
                 elif mod.operand_type == 'COLLECTION':
                     if not mod.collection:
-                        print(f"Boolean 모디파이어 '{mod.name}': 타겟 컬렉션 없음")
+                        logger.info("Boolean 모디파이어 '%s': 타겟 컬렉션 없음", mod.name)
                         return False
                     if not mod.collection.name in bpy.data.collections:
-                        print(f"Boolean 모디파이어 '{mod.name}': 타겟 컬렉션이 존재하지 않음")
+                        logger.info("Boolean 모디파이어 '%s': 타겟 컬렉션이 존재하지 않음", mod.name)
                         return False
             
             elif mod.type == 'ARRAY':
                 if hasattr(mod, 'count') and mod.count <= 0:
-                    print(f"Array 모디파이어 '{mod.name}': 잘못된 카운트 값")
+                    logger.info("Array 모디파이어 '%s': 잘못된 카운트 값", mod.name)
                     return False
             
             elif mod.type == 'MIRROR':
@@ -362,7 +627,7 @@ class MODIFIER_PIE_OT_apply_all_common_modifiers(bpy.types.Operator):
             
             elif mod.type == 'BEVEL':
                 if hasattr(mod, 'width') and mod.width <= 0:
-                    print(f"Bevel 모디파이어 '{mod.name}': 잘못된 너비 값")
+                    logger.info("Bevel 모디파이어 '%s': 잘못된 너비 값", mod.name)
                     return False
             
             elif mod.type == 'SUBSURF':
@@ -370,13 +635,13 @@ class MODIFIER_PIE_OT_apply_all_common_modifiers(bpy.types.Operator):
             
             elif mod.type == 'SOLIDIFY':
                 if hasattr(mod, 'thickness') and mod.thickness == 0:
-                    print(f"Solidify 모디파이어 '{mod.name}': 두께가 0")
+                    logger.info("Solidify 모디파이어 '%s': 두께가 0", mod.name)
                     return False
             
             return True
             
         except Exception as e:
-            print(f"모디파이어 유효성 검사 중 오류 - {mod.name}: {e}")
+            logger.warning("모디파이어 유효성 검사 중 오류 - %s: %s", mod.name, e)
             return False
     
     def cleanup_failed_modifiers(self, obj, failed_modifiers):
@@ -389,9 +654,9 @@ class MODIFIER_PIE_OT_apply_all_common_modifiers(bpy.types.Operator):
                     modifier_name = mod.name
                     obj.modifiers.remove(mod)
                     deleted_count += 1
-                    print(f"실패한 모디파이어 삭제: {modifier_name}")
+                    logger.info("실패한 모디파이어 삭제: %s", modifier_name)
             except Exception as e:
-                print(f"모디파이어 삭제 실패 - {mod.name}: {e}")
+                logger.warning("모디파이어 삭제 실패 - %s: %s", mod.name, e)
         
         return deleted_count
 
@@ -407,15 +672,31 @@ class MODIFIER_PIE_OT_move_bottom_to_z0(bpy.types.Operator):
     bl_description = "선택한 오브젝트의 가장 낮은 지점을 월드 바닥(Z=0)에 맞춥니다"
     bl_options = {'REGISTER', 'UNDO'}
 
+    use_evaluated: bpy.props.BoolProperty(
+        name="Use Modifier Result",
+        description="모디파이어가 적용된 결과의 바운딩 박스를 기준으로 내립니다",
+        default=False
+    )
+
+    as_group: bpy.props.BoolProperty(
+        name="Drop as Group",
+        description="선택 전체의 가장 낮은 지점을 기준으로 함께 내려 서로의 높이 차이를 유지합니다",
+        default=False
+    )
+
     def execute(self, context):
-        for obj in context.selected_objects:
-            if obj.type != 'MESH':
-                continue
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not objects:
+            return {'FINISHED'}
+
+        depsgraph = context.evaluated_depsgraph_get() if self.use_evaluated else None
+        corners = bounds.world_bound_box_corners(objects, depsgraph)
+        min_z = corners[:, :, 2].min(axis=1)
 
-            bbox = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-            min_z = min(v.z for v in bbox)
-            delta_z = -min_z
+        if self.as_group:
+            min_z[:] = min_z.min()
 
+        for obj, delta_z in zip(objects, (-min_z).tolist()):
             obj.location.z += delta_z
 
         return {'FINISHED'}
@@ -424,13 +705,18 @@ class MODIFIER_PIE_OT_move_bottom_to_z0(bpy.types.Operator):
 # Subsurf Modifier 
 # ─────────────────────────────────────────────
 
-class MODIFIER_PIE_OT_add_subsurf_popup(bpy.types.Operator):
+class MODIFIER_PIE_OT_add_subsurf_popup(popup_session.MultiObjectPopup, bpy.types.Operator):
     bl_idname = "modifier_pie.add_subsurf_popup"
     bl_label = "Add Subdivision Surface"
     bl_description = "선택한 오브젝트에 Subdivision Surface 모디파이어를 추가하고 설정창을 엽니다. 메쉬를 부드럽게 만들고 면을 나눕니다"
     bl_options = {'UNDO'}
 
     mod = None
+
+    # 프리뷰 컨트롤러에 연결되는 프록시 속성 (무거운 메시에서는 드래그 중 레벨 1로 제한)
+    preview_props = ("levels",)
+    levels: bpy.props.IntProperty(name="Levels", min=0, max=11, soft_max=6,
+                                  update=preview_update("levels", capped_preview(1)))
     
     @classmethod
     def poll(cls, context):
@@ -444,47 +730,59 @@ class MODIFIER_PIE_OT_add_subsurf_popup(bpy.types.Operator):
         self.mod = next((m for m in obj.modifiers if m.type == 'SUBSURF'), None)
         if not self.mod:
             self.mod = obj.modifiers.new(name="Subdivision", type='SUBSURF')
+        popup_session.sync_preview_props(self, self.mod, self.preview_props)
+        popup_session.begin_popup_multi_edit(self, context)
         return context.window_manager.invoke_props_dialog(self, width=300)
 
     def draw(self, context):
         layout = self.layout
+        popup_session.draw_multi_object(layout, self)
         mod = self.mod
 
         layout.prop(mod, "subdivision_type", expand=True, text="Type")
-        layout.prop(mod, "levels", text="Viewport")
+        layout.prop(self, "levels", text="Viewport")
         layout.prop(mod, "render_levels", text="Render")
         layout.prop(mod, "uv_smooth", text="UV Smooth")
 
         layout.separator()
-        layout.operator("modifier_pie.apply_modifier_subsurf", text="Apply", icon='CHECKMARK')
+        op = layout.operator("modifier_pie.apply_modifier_subsurf", text="Apply", icon='CHECKMARK')
+        op.use_selection = popup_session.linked_count() > 0
 
     def execute(self, context):
+        popup_session.finish_popup_session()
         return {'FINISHED'}
 
+    def cancel(self, context):
+        popup_session.finish_popup_session(cancelled=True)
+
 class MODIFIER_PIE_OT_apply_modifier_subsurf(bpy.types.Operator):
     bl_idname = "modifier_pie.apply_modifier_subsurf"
     bl_label = "Apply Subdivision Modifier"
     bl_description = "Subdivision Surface 모디파이어를 적용합니다"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    use_selection: bpy.props.BoolProperty(name="Selected Objects", description="선택한 모든 메시의 Subsurf 모디파이어를 한 번에 적용합니다", default=False)
 
     def execute(self, context):
-        mod = next((m for m in context.object.modifiers if m.type == 'SUBSURF'), None)
-        if not mod:
-            self.report({'WARNING'}, "No Subsurf modifier found.")
-            return {'CANCELLED'}
-        bpy.ops.object.modifier_apply(modifier=mod.name)
-        return {'FINISHED'}
+        return apply_modifier_type(self, context, 'SUBSURF', "Subsurf")
     
 # ─────────────────────────────────────────────
 # Solidify Modifier
 # ─────────────────────────────────────────────
 
-class MODIFIER_PIE_OT_add_solidify_popup(bpy.types.Operator):
+class MODIFIER_PIE_OT_add_solidify_popup(popup_session.MultiObjectPopup, bpy.types.Operator):
     bl_idname = "modifier_pie.add_solidify_popup"
     bl_label = "Add Solidify Modifier"
     bl_description = "선택한 오브젝트에 Solidify 모디파이어를 추가하고 설정창을 엽니다. 면에 두께를 부여합니다"
     bl_options = {'UNDO'}
     
     mod = None
+
+    preview_props = ("thickness", "offset")
+    thickness: bpy.props.FloatProperty(name="Thickness", soft_min=-10.0, soft_max=10.0, subtype='DISTANCE',
+                                       update=preview_update("thickness"))
+    offset: bpy.props.FloatProperty(name="Offset", min=-1.0, max=1.0, subtype='FACTOR',
+                                    update=preview_update("offset"))
     
     @classmethod
     def poll(cls, context):
@@ -504,15 +802,18 @@ class MODIFIER_PIE_OT_add_solidify_popup(bpy.types.Operator):
             self.mod.use_rim = True
             self.mod.use_rim_only = False
         
+        popup_session.sync_preview_props(self, self.mod, self.preview_props)
+        popup_session.begin_popup_multi_edit(self, context)
         return context.window_manager.invoke_props_dialog(self, width=300)
     
     def draw(self, context):
         layout = self.layout
+        popup_session.draw_multi_object(layout, self)
         mod = self.mod
         
         layout.prop(mod, "solidify_mode", text="Mode")
-        layout.prop(mod, "thickness", text="Thickness")
-        layout.prop(mod, "offset", text="Offset")
+        layout.prop(self, "thickness", text="Thickness")
+        layout.prop(self, "offset", text="Offset")
         layout.prop(mod, "use_even_offset", text="Even Thickness")
         
         layout.separator()
@@ -521,24 +822,26 @@ class MODIFIER_PIE_OT_add_solidify_popup(bpy.types.Operator):
         layout.prop(mod, "use_rim_only", text="Only Rim")
         
         layout.separator()
-        layout.operator("modifier_pie.apply_modifier_solidify", text="Apply", icon='CHECKMARK')
+        op = layout.operator("modifier_pie.apply_modifier_solidify", text="Apply", icon='CHECKMARK')
+        op.use_selection = popup_session.linked_count() > 0
     
     def execute(self, context):
+        popup_session.finish_popup_session()
         return {'FINISHED'}
 
+    def cancel(self, context):
+        popup_session.finish_popup_session(cancelled=True)
+
 class MODIFIER_PIE_OT_apply_modifier_solidify(bpy.types.Operator):
     bl_idname = "modifier_pie.apply_modifier_solidify"
     bl_label = "Apply Solidify Modifier"
     bl_description = "Solidify 모디파이어를 적용합니다"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    use_selection: bpy.props.BoolProperty(name="Selected Objects", description="선택한 모든 메시의 Solidify 모디파이어를 한 번에 적용합니다", default=False)
 
     def execute(self, context):
-        mod = next((m for m in context.object.modifiers if m.type == 'SOLIDIFY'), None)
-        if not mod:
-            self.report({'WARNING'}, "No Solidify modifier found.")
-            return {'CANCELLED'}
-        
-        bpy.ops.object.modifier_apply(modifier=mod.name)
-        return {'FINISHED'}
+        return apply_modifier_type(self, context, 'SOLIDIFY', "Solidify")
 
 
 # ─────────────────────────────────────────────    
@@ -642,13 +945,24 @@ class MESH_VERTEX_OT_add_vertex_at_cursor(bpy.types.Operator):
 # Remesh Modifier
 # ─────────────────────────────────────────────
 
-class MODIFIER_PIE_OT_add_remesh_popup(bpy.types.Operator):
+class MODIFIER_PIE_OT_add_remesh_popup(popup_session.MultiObjectPopup, bpy.types.Operator):
     bl_idname = "modifier_pie.add_remesh_popup"
     bl_label = "Add Remesh Modifier"
     bl_description = "선택한 오브젝트에 Remesh 모디파이어를 추가하고 설정창을 엽니다. 메쉬의 토폴로지를 재구성합니다"
     bl_options = {'UNDO'}
     
     mod = None
+
+    # 무거운 메시에서는 드래그 중 복셀 해상도/옥트리 깊이를 낮춘 프록시로 미리보기
+    preview_props = ("voxel_size", "adaptivity", "octree_depth", "scale")
+    voxel_size: bpy.props.FloatProperty(name="Voxel Size", min=0.0001, soft_max=2.0, precision=4, subtype='DISTANCE',
+                                        update=preview_update("voxel_size", coarse_voxel_preview))
+    adaptivity: bpy.props.FloatProperty(name="Adaptivity", min=0.0, max=1.0, subtype='DISTANCE',
+                                        update=preview_update("adaptivity"))
+    octree_depth: bpy.props.IntProperty(name="Octree Depth", min=1, max=24,
+                                        update=preview_update("octree_depth", capped_preview(4)))
+    scale: bpy.props.FloatProperty(name="Scale", min=0.0, max=0.99,
+                                   update=preview_update("scale"))
     
     @classmethod
     def poll(cls, context):
@@ -665,20 +979,23 @@ class MODIFIER_PIE_OT_add_remesh_popup(bpy.types.Operator):
             self.mod.mode = 'VOXEL'
             self.mod.voxel_size = 0.1
         
+        popup_session.sync_preview_props(self, self.mod, self.preview_props)
+        popup_session.begin_popup_multi_edit(self, context)
         return context.window_manager.invoke_props_dialog(self, width=300)
     
     def draw(self, context):
         layout = self.layout
+        popup_session.draw_multi_object(layout, self)
         mod = self.mod
         
         layout.prop(mod, "mode", text="Mode")
         
         if mod.mode == 'VOXEL':
-            layout.prop(mod, "voxel_size", text="Voxel Size")
-            layout.prop(mod, "adaptivity", text="Adaptivity")
+            layout.prop(self, "voxel_size", text="Voxel Size")
+            layout.prop(self, "adaptivity", text="Adaptivity")
         else:
-            layout.prop(mod, "octree_depth", text="Octree Depth")
-            layout.prop(mod, "scale", text="Scale")
+            layout.prop(self, "octree_depth", text="Octree Depth")
+            layout.prop(self, "scale", text="Scale")
             
             if mod.mode == 'SMOOTH':
                 layout.prop(mod, "sharpness", text="Sharpness")
@@ -692,36 +1009,44 @@ class MODIFIER_PIE_OT_add_remesh_popup(bpy.types.Operator):
         layout.prop(mod, "use_smooth_shade", text="Smooth Shading")
         
         layout.separator()
-        layout.operator("modifier_pie.apply_modifier_remesh", text="Apply", icon='CHECKMARK')
+        op = layout.operator("modifier_pie.apply_modifier_remesh", text="Apply", icon='CHECKMARK')
+        op.use_selection = popup_session.linked_count() > 0
     
     def execute(self, context):
+        popup_session.finish_popup_session()
         return {'FINISHED'}
 
+    def cancel(self, context):
+        popup_session.finish_popup_session(cancelled=True)
+
 class MODIFIER_PIE_OT_apply_modifier_remesh(bpy.types.Operator):
     bl_idname = "modifier_pie.apply_modifier_remesh"
     bl_label = "Apply Remesh Modifier"
     bl_description = "Remesh 모디파이어를 적용합니다"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    use_selection: bpy.props.BoolProperty(name="Selected Objects", description="선택한 모든 메시의 Remesh 모디파이어를 한 번에 적용합니다", default=False)
 
     def execute(self, context):
-        mod = next((m for m in context.object.modifiers if m.type == 'REMESH'), None)
-        if not mod:
-            self.report({'WARNING'}, "No Remesh modifier found.")
-            return {'CANCELLED'}
-        
-        bpy.ops.object.modifier_apply(modifier=mod.name)
-        return {'FINISHED'}
+        return apply_modifier_type(self, context, 'REMESH', "Remesh")
 
 # ─────────────────────────────────────────────
 # Displace Modifier
 # ─────────────────────────────────────────────
 
-class MODIFIER_PIE_OT_add_displace_popup(bpy.types.Operator):
+class MODIFIER_PIE_OT_add_displace_popup(popup_session.MultiObjectPopup, bpy.types.Operator):
     bl_idname = "modifier_pie.add_displace_popup"
     bl_label = "Add Displace Modifier"
     bl_description = "선택한 오브젝트에 Displace 모디파이어를 추가하고 설정창을 엽니다. 텍스처를 이용해 메쉬를 변형시킵니다"
     bl_options = {'UNDO'}
     
     mod = None
+
+    preview_props = ("strength", "mid_level")
+    strength: bpy.props.FloatProperty(name="Strength", soft_min=-100.0, soft_max=100.0,
+                                      update=preview_update("strength"))
+    mid_level: bpy.props.FloatProperty(name="Midlevel", soft_min=0.0, soft_max=1.0, subtype='FACTOR',
+                                       update=preview_update("mid_level"))
     
     @classmethod
     def poll(cls, context):
@@ -738,10 +1063,13 @@ class MODIFIER_PIE_OT_add_displace_popup(bpy.types.Operator):
             self.mod.strength = 0.1
             self.mod.direction = 'NORMAL'
         
+        popup_session.sync_preview_props(self, self.mod, self.preview_props)
+        popup_session.begin_popup_multi_edit(self, context)
         return context.window_manager.invoke_props_dialog(self, width=300)
     
     def draw(self, context):
         layout = self.layout
+        popup_session.draw_multi_object(layout, self)
         mod = self.mod
         
         row = layout.row()
@@ -774,19 +1102,24 @@ class MODIFIER_PIE_OT_add_displace_popup(bpy.types.Operator):
         layout.separator()
         
         layout.prop(mod, "direction", text="Direction")
-        layout.prop(mod, "strength", text="Strength")
-        layout.prop(mod, "mid_level", text="Midlevel")
+        layout.prop(self, "strength", text="Strength")
+        layout.prop(self, "mid_level", text="Midlevel")
         
         layout.separator()
         
         layout.prop_search(mod, "vertex_group", context.object, "vertex_groups", text="Vertex Group")
         
         layout.separator()
-        layout.operator("modifier_pie.apply_modifier_displace", text="Apply", icon='CHECKMARK')
+        op = layout.operator("modifier_pie.apply_modifier_displace", text="Apply", icon='CHECKMARK')
+        op.use_selection = popup_session.linked_count() > 0
     
     def execute(self, context):
+        popup_session.finish_popup_session()
         return {'FINISHED'}
 
+    def cancel(self, context):
+        popup_session.finish_popup_session(cancelled=True)
+
 class MODIFIER_PIE_OT_create_new_texture(bpy.types.Operator):
     bl_idname = "modifier_pie.create_new_texture"
     bl_label = "Create New Texture"
@@ -805,6 +1138,8 @@ class MODIFIER_PIE_OT_create_new_texture(bpy.types.Operator):
         new_tex.image = new_image
         
         mod.texture = new_tex
+        # 파이썬에서 바꾼 값은 msgbus 로 전달되지 않으므로 직접 전파
+        popup_session.propagate_master_changes()
         
         return {'FINISHED'}
 
@@ -812,28 +1147,31 @@ class MODIFIER_PIE_OT_apply_modifier_displace(bpy.types.Operator):
     bl_idname = "modifier_pie.apply_modifier_displace"
     bl_label = "Apply Displace Modifier"
     bl_description = "Displace 모디파이어를 적용합니다"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    use_selection: bpy.props.BoolProperty(name="Selected Objects", description="선택한 모든 메시의 Displace 모디파이어를 한 번에 적용합니다", default=False)
 
     def execute(self, context):
-        mod = next((m for m in context.object.modifiers if m.type == 'DISPLACE'), None)
-        if not mod:
-            self.report({'WARNING'}, "No Displace modifier found.")
-            return {'CANCELLED'}
-        
-        bpy.ops.object.modifier_apply(modifier=mod.name)
-        return {'FINISHED'}
+        return apply_modifier_type(self, context, 'DISPLACE', "Displace")
 
 
 # ─────────────────────────────────────────────
 # Wireframe Modifier
 # ─────────────────────────────────────────────
 
-class MODIFIER_PIE_OT_add_wireframe_popup(bpy.types.Operator):
+class MODIFIER_PIE_OT_add_wireframe_popup(popup_session.MultiObjectPopup, bpy.types.Operator):
     bl_idname = "modifier_pie.add_wireframe_popup"
     bl_label = "Add Wireframe Modifier"
     bl_description = "선택한 오브젝트에 Wireframe 모디파이어를 추가하고 설정창을 엽니다. 메쉬의 뼈대만 남깁니다"
     bl_options = {'UNDO'}
     
     mod = None
+
+    preview_props = ("thickness", "offset")
+    thickness: bpy.props.FloatProperty(name="Thickness", soft_min=-1.0, soft_max=1.0, precision=4, subtype='DISTANCE',
+                                       update=preview_update("thickness"))
+    offset: bpy.props.FloatProperty(name="Offset", min=-1.0, max=1.0, subtype='FACTOR',
+                                    update=preview_update("offset"))
     
     @classmethod
     def poll(cls, context):
@@ -850,14 +1188,17 @@ class MODIFIER_PIE_OT_add_wireframe_popup(bpy.types.Operator):
             self.mod.thickness = 0.02
             self.mod.use_even_offset = True
         
+        popup_session.sync_preview_props(self, self.mod, self.preview_props)
+        popup_session.begin_popup_multi_edit(self, context)
         return context.window_manager.invoke_props_dialog(self, width=300)
     
     def draw(self, context):
         layout = self.layout
+        popup_session.draw_multi_object(layout, self)
         mod = self.mod
         
-        layout.prop(mod, "thickness", text="Thickness")
-        layout.prop(mod, "offset", text="Offset")
+        layout.prop(self, "thickness", text="Thickness")
+        layout.prop(self, "offset", text="Offset")
         
         layout.separator()
         
@@ -876,36 +1217,46 @@ class MODIFIER_PIE_OT_add_wireframe_popup(bpy.types.Operator):
         layout.prop(mod, "invert_vertex_group", text="Invert")
         
         layout.separator()
-        layout.operator("modifier_pie.apply_modifier_wireframe", text="Apply", icon='CHECKMARK')
+        op = layout.operator("modifier_pie.apply_modifier_wireframe", text="Apply", icon='CHECKMARK')
+        op.use_selection = popup_session.linked_count() > 0
     
     def execute(self, context):
+        popup_session.finish_popup_session()
         return {'FINISHED'}
 
+    def cancel(self, context):
+        popup_session.finish_popup_session(cancelled=True)
+
 class MODIFIER_PIE_OT_apply_modifier_wireframe(bpy.types.Operator):
     bl_idname = "modifier_pie.apply_modifier_wireframe"
     bl_label = "Apply Wireframe Modifier"
     bl_description = "Wireframe 모디파이어를 적용합니다"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    use_selection: bpy.props.BoolProperty(name="Selected Objects", description="선택한 모든 메시의 Wireframe 모디파이어를 한 번에 적용합니다", default=False)
 
     def execute(self, context):
-        mod = next((m for m in context.object.modifiers if m.type == 'WIREFRAME'), None)
-        if not mod:
-            self.report({'WARNING'}, "No Wireframe modifier found.")
-            return {'CANCELLED'}
-        
-        bpy.ops.object.modifier_apply(modifier=mod.name)
-        return {'FINISHED'}
+        return apply_modifier_type(self, context, 'WIREFRAME', "Wireframe")
 
 # ─────────────────────────────────────────────
 # Screw Modifier
 # ─────────────────────────────────────────────
 
-class MODIFIER_PIE_OT_add_screw_popup(bpy.types.Operator):
+class MODIFIER_PIE_OT_add_screw_popup(popup_session.MultiObjectPopup, bpy.types.Operator):
     bl_idname = "modifier_pie.add_screw_popup"
     bl_label = "Add Screw Modifier"
     bl_description = "선택한 오브젝트에 Screw 모디파이어를 추가하고 설정창을 엽니다. 프로파일을 축 중심으로 회전시켜 입체를 만듭니다"
     bl_options = {'UNDO'}
     
     mod = None
+
+    preview_props = ("angle", "screw_offset", "iterations")
+    angle: bpy.props.FloatProperty(name="Angle", soft_min=-2 * math.pi, soft_max=2 * math.pi, subtype='ANGLE',
+                                   update=preview_update("angle"))
+    screw_offset: bpy.props.FloatProperty(name="Screw", soft_min=-100.0, soft_max=100.0, subtype='DISTANCE',
+                                          update=preview_update("screw_offset"))
+    iterations: bpy.props.IntProperty(name="Iterations", min=1, max=10000, soft_max=100,
+                                      update=preview_update("iterations", capped_preview(1)))
     
     @classmethod
     def poll(cls, context):
@@ -924,10 +1275,13 @@ class MODIFIER_PIE_OT_add_screw_popup(bpy.types.Operator):
             self.mod.iterations = 1
             self.mod.axis = 'Z'
         
+        popup_session.sync_preview_props(self, self.mod, self.preview_props)
+        popup_session.begin_popup_multi_edit(self, context)
         return context.window_manager.invoke_props_dialog(self, width=300)
     
     def draw(self, context):
         layout = self.layout
+        popup_session.draw_multi_object(layout, self)
         mod = self.mod
         
         layout.prop(mod, "axis", text="Axis")
@@ -935,9 +1289,9 @@ class MODIFIER_PIE_OT_add_screw_popup(bpy.types.Operator):
         
         layout.separator()
         
-        layout.prop(mod, "angle", text="Angle")
-        layout.prop(mod, "screw_offset", text="Screw")
-        layout.prop(mod, "iterations", text="Iterations")
+        layout.prop(self, "angle", text="Angle")
+        layout.prop(self, "screw_offset", text="Screw")
+        layout.prop(self, "iterations", text="Iterations")
         
         layout.separator()
         
@@ -951,24 +1305,26 @@ class MODIFIER_PIE_OT_add_screw_popup(bpy.types.Operator):
         layout.prop(mod, "use_stretch_v", text="Stretch V")
         
         layout.separator()
-        layout.operator("modifier_pie.apply_modifier_screw", text="Apply", icon='CHECKMARK')
+        op = layout.operator("modifier_pie.apply_modifier_screw", text="Apply", icon='CHECKMARK')
+        op.use_selection = popup_session.linked_count() > 0
     
     def execute(self, context):
+        popup_session.finish_popup_session()
         return {'FINISHED'}
 
+    def cancel(self, context):
+        popup_session.finish_popup_session(cancelled=True)
+
 class MODIFIER_PIE_OT_apply_modifier_screw(bpy.types.Operator):
     bl_idname = "modifier_pie.apply_modifier_screw"
     bl_label = "Apply Screw Modifier"
     bl_description = "Screw 모디파이어를 적용합니다"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    use_selection: bpy.props.BoolProperty(name="Selected Objects", description="선택한 모든 메시의 Screw 모디파이어를 한 번에 적용합니다", default=False)
 
     def execute(self, context):
-        mod = next((m for m in context.object.modifiers if m.type == 'SCREW'), None)
-        if not mod:
-            self.report({'WARNING'}, "No Screw modifier found.")
-            return {'CANCELLED'}
-        
-        bpy.ops.object.modifier_apply(modifier=mod.name)
-        return {'FINISHED'}
+        return apply_modifier_type(self, context, 'SCREW', "Screw")
 
 class SmartSelect(bpy.types.Operator):
     bl_idname = "object.smartselect"
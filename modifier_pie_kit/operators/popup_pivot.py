@@ -1,6 +1,6 @@
 import bpy
-import bmesh
-from mathutils import Vector
+import numpy as np
+from mathutils import Matrix, Vector
 
 # ─────────────────────────────────────────────
 # Pivot 관련 오퍼레이터
@@ -19,64 +19,75 @@ class OBJECT_OT_origin_to_bottom(bpy.types.Operator):
                 len(context.selected_objects) > 0)
 
     def execute(self, context):
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        threshold = 1e-6
+        processed_meshes = set()
+        mesh_users = None
+
         for obj in context.selected_objects:
             if obj.type != 'MESH':
                 continue
 
-            mw = obj.matrix_world.copy()
-            original_location = obj.location.copy()
-
-            # 활성 객체 설정 및 에디트 모드 진입
-            context.view_layer.objects.active = obj
-            bpy.ops.object.mode_set(mode='EDIT')
-
-            bm = bmesh.from_edit_mesh(obj.data)
-
-            # 글로벌 Z 최소값 찾기
-            world_zs = [(mw @ v.co).z for v in bm.verts]
-            if not world_zs:
-                bpy.ops.object.mode_set(mode='OBJECT')
+            # 메시를 공유하는 오브젝트는 한 번만 처리
+            mesh = obj.data
+            if mesh.name_full in processed_meshes:
                 continue
+            processed_meshes.add(mesh.name_full)
 
-            min_z_global = min(world_zs)
-            threshold = 1e-6
-            bottom_verts = [v for i, v in enumerate(bm.verts) if abs(world_zs[i] - min_z_global) < threshold]
-
-            if not bottom_verts:
-                bpy.ops.object.mode_set(mode='OBJECT')
+            center_local = bottom_center_local(obj, threshold)
+            if center_local is None:
                 continue
 
-            # 바닥 버텍스의 로컬 중앙 계산
-            center_local = sum((v.co for v in bottom_verts), Vector((0, 0, 0))) / len(bottom_verts)
-
-            # 현재 오리진의 글로벌 위치
-            origin_global = mw @ Vector((0, 0, 0))
+            # 누적 방지: 오프셋이 매우 작으면 스킵 (이미 바닥에 있음)
+            if center_local.length < threshold:
+                continue
 
-            # 목표 오리진의 글로벌 위치
-            target_global = mw @ center_local
+            # 지오메트리를 오프셋만큼 이동 (오브젝트 모드 유지)
+            mesh.transform(Matrix.Translation(-center_local), shape_keys=True)
+            mesh.update()
+
+            # 같은 메시를 쓰는 모든 오브젝트의 위치 보정: 글로벌 위치 유지
+            users = [obj]
+            if mesh.users > 1:
+                if mesh_users is None:
+                    mesh_users = {}
+                    for o in bpy.data.objects:
+                        if o.type == 'MESH':
+                            mesh_users.setdefault(o.data.name_full, []).append(o)
+                users = mesh_users.get(mesh.name_full, users)
+            for user in users:
+                mw = user.matrix_world.copy()
+                mw.translation = mw @ center_local
+                user.matrix_world = mw
 
-            # 오프셋 계산
-            offset = target_global - origin_global
+        self.report({'INFO'}, "Origin moved to bottom")
+        return {'FINISHED'}
 
-            # 누적 방지: 오프셋이 매우 작으면 스킵 (이미 바닥에 있음)
-            if offset.length < threshold:
-                bpy.ops.object.mode_set(mode='OBJECT')
-                continue
 
-            # 버텍스 이동: geometry를 오프셋만큼 조정
-            for v in bm.verts:
-                v.co -= center_local  # 부호 조정으로 누적 방지
+def bottom_center_local(obj, threshold):
+    """월드 Z 최솟값에 있는 버텍스들의 로컬 중앙 (NumPy 일괄 계산)"""
+    vertices = obj.data.vertices
+    count = len(vertices)
+    if count == 0:
+        return None
 
-            bmesh.update_edit_mesh(obj.data)
+    co = np.empty(count * 3, dtype=np.float32)
+    vertices.foreach_get("co", co)
+    co = co.reshape(count, 3).astype(np.float64)
 
-            # 모드 복귀
-            bpy.ops.object.mode_set(mode='OBJECT')
+    # 글로벌 Z = 행렬 3행 · 로컬 좌표
+    mw = np.array(obj.matrix_world, dtype=np.float64)
+    world_z = co @ mw[2, :3] + mw[2, 3]
 
-            # 객체 위치 보정: 글로벌 위치 유지
-            obj.location += offset
+    min_z_global = world_z.min()
+    bottom = co[np.abs(world_z - min_z_global) < threshold]
+    if len(bottom) == 0:
+        return None
 
-        self.report({'INFO'}, "Origin moved to bottom")
-        return {'FINISHED'}
+    # 바닥 버텍스의 로컬 중앙 계산
+    return Vector(bottom.mean(axis=0))
 
 
 class MODIFIER_PIE_OT_toggle_pivot(bpy.types.Operator):
@@ -0,0 +1,382 @@
+import bpy
+import time
+
+# ─────────────────────────────────────────────
+# 팝업 세션 헬퍼 (모디파이어 목록 캐시 / 언두 병합 / 리드로우)
+# ─────────────────────────────────────────────
+
+
+class ModifierListCache:
+    """팝업이 열려 있는 동안 특정 타입 모디파이어 목록을 캐시합니다.
+
+    오브젝트 포인터와 모디파이어 개수가 같으면 draw/check 마다 다시 필터링하지 않습니다.
+    """
+
+    def __init__(self, modifier_type):
+        self.modifier_type = modifier_type
+        self._key = None
+        self._indices = []
+
+    def invalidate(self):
+        self._key = None
+
+    def get(self, obj):
+        if obj is None:
+            return []
+        modifiers = obj.modifiers
+        key = (obj.as_pointer(), len(modifiers))
+        if key == self._key:
+            result = [modifiers[i] for i in self._indices]
+            # 순서가 바뀌었거나 언두로 교체된 경우에만 다시 필터링
+            if all(m.type == self.modifier_type for m in result):
+                return result
+        self._indices = [i for i, m in enumerate(modifiers) if m.type == self.modifier_type]
+        self._key = key
+        return [modifiers[i] for i in self._indices]
+
+
+# 슬라이더 드래그 동안 들어오는 언두 요청을 하나로 합침
+UNDO_IDLE_INTERVAL = 0.35
+
+_pending_undo = {"message": None, "deadline": 0.0}
+
+
+def _flush_undo_push():
+    remaining = _pending_undo["deadline"] - time.monotonic()
+    if remaining > 0:
+        return remaining
+    message = _pending_undo["message"]
+    _pending_undo["message"] = None
+    if message:
+        try:
+            bpy.ops.ed.undo_push(message=message)
+        except RuntimeError:
+            pass
+    return None
+
+
+def request_undo_push(message):
+    """마지막 변경 후 UNDO_IDLE_INTERVAL 초 동안 조용하면 언두 스텝을 한 번만 기록"""
+    _pending_undo["deadline"] = time.monotonic() + UNDO_IDLE_INTERVAL
+    if _pending_undo["message"] is None:
+        _pending_undo["message"] = message
+        bpy.app.timers.register(_flush_undo_push, first_interval=UNDO_IDLE_INTERVAL)
+    else:
+        _pending_undo["message"] = message
+
+
+def cancel_undo_push():
+    """대기 중인 언두 요청을 버립니다. 팝업 execute 가 자체 언두 스텝을 남길 때 사용"""
+    _pending_undo["message"] = None
+    if bpy.app.timers.is_registered(_flush_undo_push):
+        bpy.app.timers.unregister(_flush_undo_push)
+
+
+def flush_undo_push():
+    """대기 중인 언두 요청을 바로 기록합니다. 팝업이 취소되어 닫힐 때 사용"""
+    if _pending_undo["message"] is None:
+        return
+    _pending_undo["deadline"] = 0.0
+    if bpy.app.timers.is_registered(_flush_undo_push):
+        bpy.app.timers.unregister(_flush_undo_push)
+    _flush_undo_push()
+
+
+def tag_popup_area(area):
+    """팝업을 띄운 영역만 다시 그립니다. 영역이 이미 닫혔으면 무시"""
+    if area is None:
+        return
+    try:
+        area.tag_redraw()
+    except ReferenceError:
+        pass
+
+
+# ─────────────────────────────────────────────
+# 무거운 메시용 라이브 프리뷰 (저해상도 프록시 + 디바운스 커밋)
+# ─────────────────────────────────────────────
+# 팝업은 슬라이더를 모디파이어 속성 대신 오퍼레이터 프록시 속성에 연결하고
+# update=preview_update(...) 로 이 컨트롤러에 참여합니다.
+HEAVY_POLY_COUNT = 200000
+PREVIEW_SETTLE_INTERVAL = 0.3
+PREVIEW_VOXEL_RESOLUTION = 64
+
+# (오브젝트 이름, 모디파이어 이름, 속성 이름) → (실제 값, 커밋 시각)
+_pending_commits = {}
+
+
+def is_heavy_mesh(obj):
+    return obj is not None and obj.type == 'MESH' and len(obj.data.polygons) >= HEAVY_POLY_COUNT
+
+
+def coarse_voxel_preview(obj, value):
+    """드래그 중에는 복셀 수를 PREVIEW_VOXEL_RESOLUTION 으로 제한"""
+    corners = [corner[:] for corner in obj.bound_box]
+    extent = max(max(c[i] for c in corners) - min(c[i] for c in corners) for i in range(3))
+    return max(value, extent / PREVIEW_VOXEL_RESOLUTION)
+
+
+def capped_preview(limit):
+    """드래그 중에는 레벨/반복 수를 limit 이하로 제한"""
+    def preview(obj, value):
+        return min(value, limit)
+    return preview
+
+
+def _commit_previews():
+    now = time.monotonic()
+    for key, (value, deadline) in list(_pending_commits.items()):
+        if deadline > now:
+            continue
+        del _pending_commits[key]
+        _write_modifier_value(key, value)
+    if _pending_commits:
+        return max(0.01, min(d for _, d in _pending_commits.values()) - now)
+    return None
+
+
+def _write_modifier_value(key, value):
+    obj_name, mod_name, prop_name = key
+    obj = bpy.data.objects.get(obj_name)
+    mod = obj.modifiers.get(mod_name) if obj else None
+    if mod is not None and getattr(mod, prop_name) != value:
+        setattr(mod, prop_name, value)
+        if mod == _master_link["master"]:
+            propagate_master_changes()
+
+
+def flush_previews():
+    """대기 중인 실제 값을 즉시 커밋 (적용/확인 직전에 호출)"""
+    for key, (value, _) in list(_pending_commits.items()):
+        _write_modifier_value(key, value)
+    _pending_commits.clear()
+    if bpy.app.timers.is_registered(_commit_previews):
+        bpy.app.timers.unregister(_commit_previews)
+
+
+def sync_preview_props(op, mod, names):
+    """팝업을 열 때 모디파이어 값을 프록시 속성으로 복사 (update 콜백은 무시)"""
+    op._preview_syncing = True
+    try:
+        for name in names:
+            setattr(op, name, getattr(mod, name))
+    finally:
+        op._preview_syncing = False
+
+
+def preview_update(name, preview=None):
+    """프록시 속성용 update 콜백을 만듭니다.
+
+    가벼운 메시는 바로 모디파이어에 쓰고, 무거운 메시는 preview 로 낮춘 값을 보여준 뒤
+    드래그가 멈추면 실제 값을 커밋합니다.
+    """
+    def update(self, context):
+        if getattr(self, '_preview_syncing', False):
+            return
+        mod = getattr(self, 'mod', None)
+        if mod is None:
+            return
+        obj = mod.id_data
+        value = getattr(self, name)
+        linked = mod == _master_link["master"]
+        heavy = is_heavy_mesh(obj) or (linked and _master_link["poly_count"] >= HEAVY_POLY_COUNT)
+        if not heavy:
+            if getattr(mod, name) != value:
+                setattr(mod, name, value)
+                if linked:
+                    propagate_master_changes()
+            return
+
+        if preview is not None:
+            preview_value = preview(obj, value)
+            if getattr(mod, name) != preview_value:
+                setattr(mod, name, preview_value)
+                if linked:
+                    propagate_master_changes()
+
+        _pending_commits[(obj.name, mod.name, name)] = (value, time.monotonic() + PREVIEW_SETTLE_INTERVAL)
+        if not bpy.app.timers.is_registered(_commit_previews):
+            bpy.app.timers.register(_commit_previews, first_interval=PREVIEW_SETTLE_INTERVAL)
+    return update
+
+
+# ─────────────────────────────────────────────
+# 다중 오브젝트 편집 (마스터 모디파이어 → 선택 전체)
+# ─────────────────────────────────────────────
+# 팝업은 활성 오브젝트의 모디파이어(마스터)를 편집하고, 바뀐 속성만 골라
+# 선택된 다른 메시의 같은 타입 모디파이어에 한 번에 씁니다.
+# UI 에서 직접 바꾼 값은 msgbus 로, 프록시 속성(preview_update)은 직접 전파합니다.
+# 속성 쓰기는 depsgraph 태그만 남기므로 편집 한 번에 평가는 한 번만 일어납니다.
+
+# 이름, 펼침/고정 상태처럼 모디파이어마다 달라야 하는 속성은 복사하지 않음
+UNLINKED_PROPS = {"rna_type", "name", "show_expanded", "is_active", "use_pin_to_last", "is_override_data_editable"}
+
+_master_owner = object()
+_master_link = {"master": None, "targets": [], "created": [], "props": (), "snapshot": {}, "poly_count": 0}
+
+
+def linked_props(mod):
+    """마스터에서 복사할 수 있는 속성 이름 목록"""
+    return tuple(
+        prop.identifier for prop in mod.bl_rna.properties
+        if prop.identifier not in UNLINKED_PROPS and not prop.is_readonly and prop.type != 'COLLECTION'
+    )
+
+
+def modifier_settings(mod, props):
+    settings = {}
+    for name in props:
+        value = getattr(mod, name)
+        if hasattr(value, "__len__") and not isinstance(value, str):
+            value = tuple(value)
+        settings[name] = value
+    return settings
+
+
+def write_settings(modifiers, settings):
+    """바뀐 값만 각 모디파이어에 씁니다. 삭제된 모디파이어는 건너뜀"""
+    for mod in modifiers:
+        for name, value in settings.items():
+            try:
+                if getattr(mod, name) != value:
+                    setattr(mod, name, value)
+            except ReferenceError:
+                break
+            except (AttributeError, TypeError, ValueError):
+                # 오브젝트마다 유효하지 않은 값(다른 오브젝트 참조 등)은 그 속성만 건너뜀
+                continue
+
+
+def propagate_master_changes():
+    master = _master_link["master"]
+    if master is None:
+        return
+    try:
+        current = modifier_settings(master, _master_link["props"])
+    except ReferenceError:
+        end_multi_edit()
+        return
+    snapshot = _master_link["snapshot"]
+    changed = {name: value for name, value in current.items() if snapshot.get(name) != value}
+    if not changed:
+        return
+    _master_link["snapshot"] = current
+    write_settings(_master_link["targets"], changed)
+
+
+def _on_master_changed(*args):
+    propagate_master_changes()
+
+
+def find_or_create_modifiers(context, master):
+    """선택된 다른 메시에서 마스터와 같은 타입 모디파이어를 찾고, 없으면 마스터 설정으로 만듭니다
+
+    (대상 목록, 새로 만든 모디파이어 목록)을 반환합니다.
+    """
+    master_obj = master.id_data
+    props = linked_props(master)
+    targets, created = [], []
+    for obj in context.selected_objects:
+        if obj.type != 'MESH' or obj == master_obj:
+            continue
+        mod = next((m for m in obj.modifiers if m.type == master.type), None)
+        if mod is None:
+            mod = obj.modifiers.new(name=master.name, type=master.type)
+            created.append(mod)
+        targets.append(mod)
+    if created:
+        write_settings(created, modifier_settings(master, props))
+    return targets, created
+
+
+def begin_multi_edit(context, master):
+    """마스터 모디파이어의 편집을 선택된 메시 전체로 전파하기 시작. 연결된 오브젝트 수를 반환"""
+    end_multi_edit()
+    targets, created = find_or_create_modifiers(context, master)
+    if not targets:
+        return 0
+    props = linked_props(master)
+    _master_link.update(
+        master=master,
+        targets=targets,
+        created=created,
+        props=props,
+        snapshot=modifier_settings(master, props),
+        poly_count=sum(len(m.id_data.data.polygons) for m in targets) + len(master.id_data.data.polygons),
+    )
+    bpy.msgbus.subscribe_rna(key=master, owner=_master_owner, args=(), notify=_on_master_changed)
+    return len(targets)
+
+
+def end_multi_edit(discard=False):
+    """연결을 끊습니다. discard 가 True 면 이번 연결에서 새로 만든 모디파이어를 지웁니다"""
+    bpy.msgbus.clear_by_owner(_master_owner)
+    if discard:
+        remove_created_modifiers()
+    _master_link.update(master=None, targets=[], created=[], props=(), snapshot={}, poly_count=0)
+
+
+def remove_created_modifiers():
+    """취소되거나 토글이 꺼진 팝업이 다른 메시에 남긴 모디파이어를 정리"""
+    for mod in _master_link["created"]:
+        try:
+            obj = mod.id_data
+            obj.modifiers.remove(mod)
+        except (ReferenceError, RuntimeError):
+            # 이미 삭제되었거나 적용된 모디파이어
+            continue
+    _master_link["created"] = []
+
+
+def linked_count():
+    return len(_master_link["targets"])
+
+
+def multi_object_update(self, context):
+    """팝업의 multi_object 토글용 update 콜백"""
+    mod = getattr(self, 'mod', None)
+    if mod is None:
+        return
+    if self.multi_object:
+        begin_multi_edit(context, mod)
+    else:
+        end_multi_edit(discard=True)
+
+
+def begin_popup_multi_edit(op, context):
+    """팝업 invoke 에서 호출. 메시가 여러 개 선택되어 있고 multi_object 가 켜져 있으면 연결"""
+    op._multi_available = sum(1 for obj in context.selected_objects if obj.type == 'MESH') > 1
+    if op._multi_available and op.multi_object:
+        begin_multi_edit(context, op.mod)
+    else:
+        end_multi_edit()
+
+
+def finish_popup_session(cancelled=False):
+    """팝업 확인/취소/적용 시 대기 중인 프리뷰를 커밋하고 연결을 끊습니다
+
+    취소된 팝업은 다른 메시에 새로 만든 모디파이어를 남기지 않습니다.
+    """
+    flush_previews()
+    end_multi_edit(discard=cancelled)
+
+
+class MultiObjectPopup:
+    """다중 오브젝트 편집을 지원하는 모디파이어 팝업 공용 믹스인"""
+
+    multi_object: bpy.props.BoolProperty(name="Multi Object", description="선택한 모든 메시의 같은 모디파이어를 함께 편집합니다",
+                                         default=True, update=multi_object_update)
+
+
+def draw_multi_object(layout, op):
+    if not getattr(op, '_multi_available', False):
+        return
+    count = linked_count()
+    layout.prop(op, "multi_object", text=f"선택한 {count + 1}개 오브젝트에 함께 적용" if count else "선택한 오브젝트에 함께 적용")
+    layout.separator()
+
+
+def unregister():
+    end_multi_edit()
+    flush_previews()
+    cancel_undo_push()
@@ -0,0 +1,144 @@
+import bpy
+import math
+from mathutils import Vector
+
+# ─────────────────────────────────────────────
+# 인스턴스 기반 회전 어레이 (지오메트리 노드)
+# ─────────────────────────────────────────────
+# Transform(Scale) → Points(Count) → Instance on Points(원본 지오메트리) → Rotate Instances(피벗 기준) → Transform(1/Scale)
+# 복사본은 인스턴스라 개수가 늘어도 메모리가 늘지 않고, 개수는 모디파이어 입력값이라 드라이버가 필요 없습니다.
+# 로컬 공간에서 바로 회전하면 오브젝트 스케일이 균일하지 않을 때 월드에서 원이 아니라 타원이 되므로,
+# 오브젝트 스케일만 적용한 공간(월드와 회전/이동만 다른 공간)에서 회전한 뒤 스케일을 되돌립니다.
+
+NODE_GROUP_NAME = "MPK Radial Array"
+# 노드 구성이 바뀌면 올림. 이전 버전 그룹은 이름을 바꿔 기존 모디파이어가 계속 쓰게 둡니다.
+NODE_GROUP_VERSION = 2
+MODIFIER_NAME = "RotationalArray"
+
+AXES = {
+    'X': Vector((1.0, 0.0, 0.0)),
+    'Y': Vector((0.0, 1.0, 0.0)),
+    'Z': Vector((0.0, 0.0, 1.0)),
+}
+
+
+def _build_node_group():
+    group = bpy.data.node_groups.new(NODE_GROUP_NAME, 'GeometryNodeTree')
+    interface = group.interface
+    interface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    count = interface.new_socket(name="Count", in_out='INPUT', socket_type='NodeSocketInt')
+    count.default_value = 6
+    count.min_value = 1
+    pivot = interface.new_socket(name="Pivot", in_out='INPUT', socket_type='NodeSocketVector')
+    pivot.default_value = (0.0, 0.0, 0.0)
+    axis = interface.new_socket(name="Axis", in_out='INPUT', socket_type='NodeSocketVector')
+    axis.default_value = (0.0, 0.0, 1.0)
+    scale = interface.new_socket(name="Scale", in_out='INPUT', socket_type='NodeSocketVector')
+    scale.default_value = (1.0, 1.0, 1.0)
+    interface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+    group["mpk_version"] = NODE_GROUP_VERSION
+
+    nodes, links = group.nodes, group.links
+    group_in = nodes.new('NodeGroupInput')
+    group_in.location = (-800, 0)
+    group_out = nodes.new('NodeGroupOutput')
+    group_out.location = (400, 0)
+
+    points = nodes.new('GeometryNodePoints')
+    points.location = (-400, 200)
+    instance = nodes.new('GeometryNodeInstanceOnPoints')
+    instance.location = (-150, 100)
+
+    # 각도 = index * 2π / count
+    index = nodes.new('GeometryNodeInputIndex')
+    index.location = (-800, -250)
+    step = nodes.new('ShaderNodeMath')
+    step.operation = 'DIVIDE'
+    step.location = (-600, -150)
+    step.inputs[0].default_value = 2.0 * math.pi
+    angle = nodes.new('ShaderNodeMath')
+    angle.operation = 'MULTIPLY'
+    angle.location = (-400, -200)
+    rotation = nodes.new('FunctionNodeAxisAngleToRotation')
+    rotation.location = (-200, -200)
+
+    rotate = nodes.new('GeometryNodeRotateInstances')
+    rotate.location = (150, 0)
+
+    # 스케일 공간으로 보냈다가 되돌리기
+    to_scaled = nodes.new('GeometryNodeTransform')
+    to_scaled.location = (-400, 0)
+    inverse_scale = nodes.new('ShaderNodeVectorMath')
+    inverse_scale.operation = 'DIVIDE'
+    inverse_scale.location = (150, -250)
+    inverse_scale.inputs[0].default_value = (1.0, 1.0, 1.0)
+    from_scaled = nodes.new('GeometryNodeTransform')
+    from_scaled.location = (300, 0)
+    group_out.location = (550, 0)
+
+    links.new(group_in.outputs["Count"], points.inputs["Count"])
+    links.new(points.outputs["Geometry"], instance.inputs["Points"])
+    links.new(group_in.outputs["Geometry"], to_scaled.inputs["Geometry"])
+    links.new(group_in.outputs["Scale"], to_scaled.inputs["Scale"])
+    links.new(to_scaled.outputs["Geometry"], instance.inputs["Instance"])
+    links.new(group_in.outputs["Scale"], inverse_scale.inputs[1])
+    links.new(group_in.outputs["Count"], step.inputs[1])
+    links.new(index.outputs["Index"], angle.inputs[0])
+    links.new(step.outputs[0], angle.inputs[1])
+    links.new(group_in.outputs["Axis"], rotation.inputs["Axis"])
+    links.new(angle.outputs[0], rotation.inputs["Angle"])
+    links.new(instance.outputs["Instances"], rotate.inputs["Instances"])
+    links.new(rotation.outputs["Rotation"], rotate.inputs["Rotation"])
+    links.new(group_in.outputs["Pivot"], rotate.inputs["Pivot Point"])
+    rotate.inputs["Local Space"].default_value = False
+    links.new(rotate.outputs["Instances"], from_scaled.inputs["Geometry"])
+    links.new(inverse_scale.outputs["Vector"], from_scaled.inputs["Scale"])
+    links.new(from_scaled.outputs["Geometry"], group_out.inputs["Geometry"])
+    return group
+
+
+def get_node_group():
+    """공용 노드 그룹을 반환 (파일에 없으면 한 번만 생성)"""
+    group = bpy.data.node_groups.get(NODE_GROUP_NAME)
+    if group is not None and group.bl_idname == 'GeometryNodeTree' and group.get("mpk_version") == NODE_GROUP_VERSION:
+        return group
+    if group is not None:
+        group.name = f"{NODE_GROUP_NAME} v{group.get('mpk_version', 1)}"
+    return _build_node_group()
+
+
+def input_identifiers(group):
+    """입력 소켓 이름 → 모디파이어 키(identifier)"""
+    return {
+        item.name: item.identifier
+        for item in group.interface.items_tree
+        if item.item_type == 'SOCKET' and item.in_out == 'INPUT'
+    }
+
+
+def set_inputs(mod, **values):
+    ids = input_identifiers(mod.node_group)
+    for name, value in values.items():
+        mod[ids[name]] = value
+    # ID 속성으로 바꾼 값은 태그가 필요
+    mod.id_data.update_tag()
+
+
+def add_radial_instances(obj, count, axis, pivot_world):
+    """obj 에 인스턴스 회전 어레이 모디파이어를 추가.
+
+    피벗/축은 오브젝트 스케일만 적용한 공간으로 변환해 넣으므로, 스케일이 균일하지 않아도 월드에서 원 위에 놓입니다.
+    """
+    if MODIFIER_NAME in obj.modifiers:
+        obj.modifiers.remove(obj.modifiers[MODIFIER_NAME])
+    mod = obj.modifiers.new(MODIFIER_NAME, 'NODES')
+    mod.node_group = get_node_group()
+
+    _, rotation, scale = obj.matrix_world.decompose()
+    # 0 스케일 축은 되돌릴 수 없으므로 1 로 취급
+    scale = Vector(s if abs(s) > 1e-8 else 1.0 for s in scale)
+    pivot_local = obj.matrix_world.inverted_safe() @ pivot_world
+    pivot_scaled = Vector(p * s for p, s in zip(pivot_local, scale))
+    axis_scaled = (rotation.inverted() @ AXES[axis]).normalized()
+    set_inputs(mod, Count=count, Pivot=pivot_scaled[:], Axis=axis_scaled[:], Scale=scale[:])
+    return mod
@@ -1,16 +1,15 @@
 import bpy
 from bpy.props import StringProperty, BoolProperty, FloatProperty, IntProperty, EnumProperty
 from bpy.types import AddonPreferences, Operator
-import urllib.request
-import zipfile
 import os
-import shutil
-import threading
 import sys
 import time
-import blf
-import gpu
 from bpy.app.handlers import persistent
+from . import log
+from . import profiling
+from .profiling import profiled
+
+logger = log.get_logger(__name__)
 
 # --- GitHub 정보 ---
 GITHUB_USER = "art2coder"
@@ -35,13 +34,14 @@ def compare_versions(v1, v2):
     return v1 > v2
 
 def fetch_latest_version_info():
+    import urllib.request
     url = f"https://raw.githubusercontent.com/{GITHUB_USER}/{GITHUB_REPO}/main/version.txt"
     try:
         with urllib.request.urlopen(url, timeout=5) as response:
             latest_version_str = response.read().decode('utf-8').strip()
             return tuple(map(int, latest_version_str.split('.')))
     except Exception as e:
-        print(f"Error checking for update: {e}")
+        logger.warning("Error checking for update: %s", e)
         return None
 
 def get_download_url(version_str):
@@ -93,13 +93,11 @@ class MODIFIERPIEKIT_OT_show_update_complete_messages(Operator):
     def execute(self, context):
         # 즉시 설치 완료 메시지 표시
         context.workspace.status_text_set_internal("업데이트 완료!")
-        print("설치 완료 메시지 표시")
         
         # 2초 후에 재시작 메시지로 변경하는 타이머 등록
         def switch_to_restart_message():
             try:
                 bpy.context.workspace.status_text_set_internal("업데이트 완료! 적용을 위해 블렌더를 재시작하세요.")
-                print("재시작 메시지로 전환 완료")
             except:
                 pass
             return None  # 타이머 종료
@@ -117,6 +115,10 @@ class MODIFIERPIEKIT_OT_install_update(Operator):
 
     def install_thread_task(self, latest_version_str):  # 클래스 내부로 이동
         global update_status
+        # 업데이트할 때만 필요한 모듈은 여기서 불러옵니다 (애드온 시작 시간 단축)
+        import urllib.request
+        import zipfile
+        import shutil
         
         try:
             update_status["message"] = "다운로드 중..."
@@ -162,7 +164,7 @@ class MODIFIERPIEKIT_OT_install_update(Operator):
             update_status["message"] = "설치 성공"
 
         except Exception as e:
-            print(f"Update failed: {e}")
+            logger.error("Update failed: %s", e)
             update_status["error"] = str(e)
         finally:
             update_status["finished"] = True
@@ -215,6 +217,7 @@ class MODIFIERPIEKIT_OT_install_update(Operator):
         updater_props = context.scene.modifier_pie_kit_updater
         
         # 백그라운드 스레드에서 다운로드 시작 (이제 정상 동작함)
+        import threading
         self._thread = threading.Thread(
             target=self.install_thread_task, 
             args=(updater_props.latest_version,)
@@ -233,6 +236,10 @@ def update_outliner_focus_handler(self, context):
     if hasattr(bpy.types.Scene, "outliner_enhancer_reinit_handler"):
         bpy.types.Scene.outliner_enhancer_reinit_handler(self.use_outliner_auto_focus)
 
+def update_auto_sort(self, context):
+    if hasattr(bpy.types.Scene, "outliner_enhancer_apply_auto_sort"):
+        bpy.types.Scene.outliner_enhancer_apply_auto_sort(self)
+
 def update_resolution_on_toggle(self, context):
     if not context.scene: return
     try:
@@ -245,6 +252,22 @@ def update_resolution_on_toggle(self, context):
         context.scene.render.resolution_x = 1920
         context.scene.render.resolution_y = 1080
 
+def update_boolean_solver_policy(self, context):
+    # 정책을 바꾸면 편집용으로 바꿔 둔 솔버를 사용자가 지정한 값으로 되돌림
+    from .operators import boolean
+    boolean.restore_original_solvers()
+
+def update_profiling(self, context):
+    profiling.set_enabled(self.enable_profiling)
+
+def update_log_level(self, context):
+    log.apply_preferences(self)
+
+def update_pie_layout(self, context):
+    # 파이 draw 는 캐시된 레이아웃만 읽으므로 관련 설정이 바뀔 때 비움
+    from .operators import pie_pivot
+    pie_pivot.invalidate_pie_layout()
+
 def get_icon_size_preset(self):
     val = self.icon_size
     if val < 1.15: return 0
@@ -276,6 +299,27 @@ class WM_OT_capture_key(Operator):
             return {'FINISHED'}
         return {'PASS_THROUGH'}
 
+LOG_TEXT_NAME = "ModifierPieKit Log"
+
+class MODIFIERPIEKIT_OT_show_log(Operator):
+    bl_idname = "modifierpiekit.show_log"
+    bl_label = "로그 보기"
+    bl_description = "최근 애드온 로그를 텍스트 에디터용 텍스트 블록으로 내보냅니다"
+    def execute(self, context):
+        lines = log.ring_buffer.lines()
+        text = bpy.data.texts.get(LOG_TEXT_NAME) or bpy.data.texts.new(LOG_TEXT_NAME)
+        text.from_string("\n".join(lines))
+        self.report({'INFO'}, f"로그 {len(lines)}줄을 '{LOG_TEXT_NAME}' 텍스트에 기록했습니다.")
+        return {'FINISHED'}
+
+class MODIFIERPIEKIT_OT_clear_log(Operator):
+    bl_idname = "modifierpiekit.clear_log"
+    bl_label = "로그 지우기"
+    bl_description = "메모리에 보관된 애드온 로그를 비웁니다"
+    def execute(self, context):
+        log.ring_buffer.clear()
+        return {'FINISHED'}
+
 class ModifierPiePreferences(AddonPreferences):
     bl_idname = "modifier_pie_kit"
     grouping_key: StringProperty(name="그룹핑 키", default="G", update=lambda self, context: update_keymaps())
@@ -294,21 +338,33 @@ class ModifierPiePreferences(AddonPreferences):
     smart_select_ctrl: BoolProperty(name="스마트 셀렉트 Ctrl", default=False, update=lambda self, context: update_keymaps())
     smart_select_shift: BoolProperty(name="스마트 셀렉트 Shift", default=False, update=lambda self, context: update_keymaps())
     smart_select_alt: BoolProperty(name="스마트 셀렉트 Alt", default=False, update=lambda self, context: update_keymaps())
-    icon_size: FloatProperty(name="아이콘 크기", default=1.2, min=0.5, max=2.0)    
+    icon_size: FloatProperty(name="아이콘 크기", default=1.2, min=0.5, max=2.0, update=update_pie_layout)    
     icon_size_preset: EnumProperty(name="아이콘 크기", items=[('SMALL', "작게", ""), ('MEDIUM', "중간", ""), ('LARGE', "크게", "")], get=get_icon_size_preset, set=set_icon_size_preset)
-    show_text: BoolProperty(name="아이콘 이름 표시", default=False)
+    show_text: BoolProperty(name="아이콘 이름 표시", default=False, update=update_pie_layout)
+    rotational_array_backend: EnumProperty(name="회전 어레이 방식", items=[
+        ('ARRAY', "Array 모디파이어", "엠프티와 드라이버로 실제 지오메트리를 복제합니다 (기존 방식)"),
+        ('INSTANCES', "지오메트리 노드 인스턴스", "인스턴스로 배열해 개수와 상관없이 메모리를 일정하게 유지합니다"),
+    ], default='ARRAY')
+    boolean_solver_policy: EnumProperty(name="불리언 솔버", items=[
+        ('MANUAL', "수동", "모디파이어에 지정된 솔버를 그대로 사용합니다"),
+        ('AUTO', "자동", "불리언 팝업에서 편집하는 동안에는 Fast, 적용할 때는 Exact 를 사용합니다. 팝업을 닫거나 렌더/저장할 때는 원래 솔버로 되돌립니다"),
+    ], default='MANUAL', update=update_boolean_solver_policy)
     use_custom_camera_resolution: BoolProperty(name="커스텀 카메라 해상도 사용", default=True, update=update_resolution_on_toggle)
     min_resolution: IntProperty(name="최소 해상도", default=1000, min=1, max=1000)
     max_resolution: IntProperty(name="최대 해상도", default=15000, min=1920, max=50000)
     default_width: IntProperty(name="기본 가로 해상도", default=3272, min=1080, max=20000)
     default_height: IntProperty(name="기본 세로 해상도", default=1600, min=16, max=20000)
-    use_collection_sorting: BoolProperty(name="컬렉션 정리 사용", default=True)
+    use_collection_sorting: BoolProperty(name="컬렉션 정리 사용", default=True, update=update_auto_sort)
+    use_auto_sort_new_objects: BoolProperty(name="새 오브젝트 자동 정리", description="새로 추가된 카메라, 조명 등을 나타나는 대로 컬렉션에 정리합니다", default=False, update=update_auto_sort)
     use_outliner_auto_focus: BoolProperty(name="아웃라이너 포커스 사용", default=True, update=update_outliner_focus_handler)
     ui_keymap_expanded: BoolProperty(name="키 설정", default=True)
     ui_display_expanded: BoolProperty(name="파이 메뉴", default=True)
     ui_camera_expanded: BoolProperty(name="카메라 해상도", default=True)
     ui_outliner_expanded: BoolProperty(name="아웃라이너", default=True)
     ui_updater_expanded: BoolProperty(name="업데이트", default=True)
+    log_level: EnumProperty(name="로그 레벨", items=log.LOG_LEVELS, default=log.DEFAULT_LEVEL, update=update_log_level)
+    ui_log_expanded: BoolProperty(name="로그", default=False)
+    enable_profiling: BoolProperty(name="핸들러 프로파일링", description="상주 핸들러의 호출 수와 소요 시간을 기록합니다 (약간의 오버헤드)", default=False, update=update_profiling)
     def draw(self, context):
         layout = self.layout
         main_row = layout.row(); main_row.column()
@@ -356,6 +412,8 @@ class ModifierPiePreferences(AddonPreferences):
         if self.ui_display_expanded:
             row = center_col.row(align=True); split = row.split(factor=0.5); split.alignment = 'RIGHT'; split.label(text="아이콘 크기"); split.prop(self, "icon_size_preset", text="")
             row = center_col.row(align=True); split = row.split(factor=0.5); split.label(text=""); split.prop(self, "show_text")
+            row = center_col.row(align=True); split = row.split(factor=0.5); split.alignment = 'RIGHT'; split.label(text="회전 어레이 방식"); split.prop(self, "rotational_array_backend", text="")
+            row = center_col.row(align=True); split = row.split(factor=0.5); split.alignment = 'RIGHT'; split.label(text="불리언 솔버"); split.prop(self, "boolean_solver_policy", text="")
         center_col.separator(factor=3)
         row = center_col.row(align=True)
         icon = 'TRIA_DOWN' if self.ui_camera_expanded else 'TRIA_RIGHT'
@@ -375,8 +433,22 @@ class ModifierPiePreferences(AddonPreferences):
         row.label(text="아웃라이너")
         if self.ui_outliner_expanded:
             row = center_col.row(align=True); split = row.split(factor=0.5); split.label(text=""); split.prop(self, "use_collection_sorting")
+            row = center_col.row(align=True); split = row.split(factor=0.5); split.label(text=""); sub = split.row(); sub.enabled = self.use_collection_sorting; sub.prop(self, "use_auto_sort_new_objects")
             row = center_col.row(align=True); split = row.split(factor=0.5); split.label(text=""); split.prop(self, "use_outliner_auto_focus")
         center_col.separator(factor=3)
+        row = center_col.row(align=True)
+        icon = 'TRIA_DOWN' if self.ui_log_expanded else 'TRIA_RIGHT'
+        row.prop(self, "ui_log_expanded", text="", icon=icon, emboss=False)
+        row.label(text="로그")
+        if self.ui_log_expanded:
+            row = center_col.row(align=True); split = row.split(factor=0.5); split.alignment = 'RIGHT'; split.label(text="로그 레벨"); split.prop(self, "log_level", text="")
+            row = center_col.row(align=True); split = row.split(factor=0.5); split.label(text=""); sub = split.row(align=True)
+            sub.operator("modifierpiekit.show_log", icon='TEXT'); sub.operator("modifierpiekit.clear_log", text="", icon='TRASH')
+            row = center_col.row(align=True); split = row.split(factor=0.5); split.label(text=""); split.prop(self, "enable_profiling")
+            row = center_col.row(align=True); split = row.split(factor=0.5); split.label(text=""); sub = split.row(align=True); sub.enabled = self.enable_profiling or bool(profiling.handler_stats)
+            sub.operator("modifierpiekit.toggle_profiler_hud", icon='HIDE_OFF' if profiling.is_hud_visible() else 'HIDE_ON', depress=profiling.is_hud_visible())
+            sub.operator("modifierpiekit.export_profiler_stats", text="", icon='EXPORT'); sub.operator("modifierpiekit.reset_profiler_stats", text="", icon='TRASH')
+        center_col.separator(factor=3)
 
 addon_keymaps = []
 def update_keymaps():
@@ -413,8 +485,9 @@ def unregister_keymaps():
 loaded_handlers = []
 
 @persistent
+@profiled("preferences.load_post")
 def on_file_loaded(dummy):    
-    print("파일 로드 완료, 키맵을 다시 설정합니다.") # 디버깅용
+    logger.debug("파일 로드 완료, 키맵을 다시 설정합니다.")
     update_keymaps()
 
 def register_load_handler():
@@ -437,12 +510,17 @@ classes = (
     MODIFIERPIEKIT_OT_check_for_updates,
     MODIFIERPIEKIT_OT_install_update,
     MODIFIERPIEKIT_OT_show_update_complete_messages,    
+    MODIFIERPIEKIT_OT_show_log,
+    MODIFIERPIEKIT_OT_clear_log,
 )
 
 def register():
     for cls in classes: 
         bpy.utils.register_class(cls)
     bpy.types.Scene.modifier_pie_kit_updater = bpy.props.PointerProperty(type=UpdaterProperties)
+    log.apply_preferences()
+    profiling.register()
+    profiling.apply_preferences()
     
     update_keymaps()
     register_load_handler()    
@@ -451,6 +529,7 @@ def unregister():
     
     unregister_load_handler()
     unregister_keymaps()
+    profiling.unregister()
     for cls in reversed(classes): 
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.modifier_pie_kit_updater
@@ -0,0 +1,246 @@
+import bpy
+import functools
+import json
+import time
+import traceback
+from collections import deque
+
+from .log import get_logger
+
+logger = get_logger(__name__)
+
+# ─────────────────────────────────────────────
+# 핸들러 프로파일러 (opt-in)
+# ─────────────────────────────────────────────
+# 상주 핸들러/구독 콜백을 @profiled("이름") 으로 감싸면 호출 수, 누적 시간, p95, 마지막 예외를 모읍니다.
+# 꺼져 있으면 플래그 확인 한 번만 하고 원래 함수를 그대로 호출합니다.
+#   @persistent
+#   @profiled("boolean.depsgraph_update_post")
+#   def handler(scene, depsgraph): ...
+
+SAMPLE_WINDOW = 512
+HUD_FONT_SIZE = 12
+HUD_LINE_HEIGHT = 16
+HUD_MARGIN = 20
+
+_state = {"enabled": False, "hud": None}
+
+# 이름 → 통계 dict
+handler_stats = {}
+
+
+def _new_stats():
+    return {"calls": 0, "total": 0.0, "max": 0.0, "samples": deque(maxlen=SAMPLE_WINDOW), "last_error": None}
+
+
+def is_enabled():
+    return _state["enabled"]
+
+
+def set_enabled(enabled):
+    _state["enabled"] = bool(enabled)
+    logger.info("핸들러 프로파일링 %s", "켜짐" if enabled else "꺼짐")
+
+
+def reset_stats():
+    handler_stats.clear()
+
+
+def profiled(name):
+    """핸들러를 감싸 실행 시간을 기록합니다. 예외는 기록 후 그대로 다시 발생시킵니다."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _state["enabled"]:
+                return func(*args, **kwargs)
+            stats = handler_stats.get(name)
+            if stats is None:
+                stats = handler_stats[name] = _new_stats()
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                stats["last_error"] = f"{type(e).__name__}: {e}"
+                logger.debug("%s 예외\n%s", name, traceback.format_exc())
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                stats["calls"] += 1
+                stats["total"] += elapsed
+                stats["samples"].append(elapsed)
+                if elapsed > stats["max"]:
+                    stats["max"] = elapsed
+        return wrapper
+    return decorator
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summary():
+    """이름별 요약 (시간 단위: ms), 누적 시간이 큰 순서"""
+    rows = []
+    for name, stats in handler_stats.items():
+        calls = stats["calls"]
+        rows.append({
+            "name": name,
+            "calls": calls,
+            "total_ms": stats["total"] * 1000.0,
+            "mean_ms": stats["total"] * 1000.0 / calls if calls else 0.0,
+            "p95_ms": percentile(stats["samples"], 0.95) * 1000.0,
+            "max_ms": stats["max"] * 1000.0,
+            "last_error": stats["last_error"],
+        })
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return rows
+
+
+# ─────────────────────────────────────────────
+# 3D 뷰포트 HUD
+# ─────────────────────────────────────────────
+# gpu/blf 는 HUD 를 켤 때만 필요하므로 그리기 함수 안에서 불러옵니다.
+
+def _draw_background(x, y, width, height):
+    import gpu
+    from gpu_extras.batch import batch_for_shader
+    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+    batch = batch_for_shader(shader, 'TRI_FAN', {"pos": ((x, y), (x + width, y), (x + width, y + height), (x, y + height))})
+    gpu.state.blend_set('ALPHA')
+    shader.uniform_float("color", (0.0, 0.0, 0.0, 0.55))
+    batch.draw(shader)
+    gpu.state.blend_set('NONE')
+
+
+def _draw_hud():
+    import blf
+    font_id = 0
+    region = bpy.context.region
+    if region is None:
+        return
+    lines = ["Modifier Pie Kit handlers   calls   total ms   p95 ms"]
+    for row in summary():
+        line = f"{row['name'][:26]:26s} {row['calls']:7d} {row['total_ms']:10.2f} {row['p95_ms']:8.3f}"
+        if row["last_error"]:
+            line += "  !"
+        lines.append(line)
+    if not _state["enabled"]:
+        lines.append("(profiling off)")
+
+    blf.size(font_id, HUD_FONT_SIZE)
+    width = max(blf.dimensions(font_id, line)[0] for line in lines) + 12
+    height = HUD_LINE_HEIGHT * len(lines) + 8
+    top = region.height - HUD_MARGIN
+    _draw_background(HUD_MARGIN - 6, top - height, width, height)
+
+    y = top - HUD_LINE_HEIGHT
+    for i, line in enumerate(lines):
+        if i == 0:
+            blf.color(font_id, 1.0, 0.8, 0.3, 1.0)
+        else:
+            blf.color(font_id, 0.9, 0.9, 0.9, 1.0)
+        blf.position(font_id, HUD_MARGIN, y, 0)
+        blf.draw(font_id, line)
+        y -= HUD_LINE_HEIGHT
+
+
+def _tag_view3d_redraw(context):
+    for window in context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+def is_hud_visible():
+    return _state["hud"] is not None
+
+
+def show_hud(visible):
+    if visible and _state["hud"] is None:
+        _state["hud"] = bpy.types.SpaceView3D.draw_handler_add(_draw_hud, (), 'WINDOW', 'POST_PIXEL')
+    elif not visible and _state["hud"] is not None:
+        bpy.types.SpaceView3D.draw_handler_remove(_state["hud"], 'WINDOW')
+        _state["hud"] = None
+
+
+class MODIFIERPIEKIT_OT_toggle_profiler_hud(bpy.types.Operator):
+    bl_idname = "modifierpiekit.toggle_profiler_hud"
+    bl_label = "핸들러 HUD"
+    bl_description = "3D 뷰포트에 핸들러별 호출 수와 소요 시간을 표시하거나 숨깁니다"
+
+    def execute(self, context):
+        show_hud(not is_hud_visible())
+        _tag_view3d_redraw(context)
+        return {'FINISHED'}
+
+
+class MODIFIERPIEKIT_OT_reset_profiler_stats(bpy.types.Operator):
+    bl_idname = "modifierpiekit.reset_profiler_stats"
+    bl_label = "통계 초기화"
+    bl_description = "모은 핸들러 통계를 비웁니다"
+
+    def execute(self, context):
+        reset_stats()
+        _tag_view3d_redraw(context)
+        return {'FINISHED'}
+
+
+class MODIFIERPIEKIT_OT_export_profiler_stats(bpy.types.Operator):
+    bl_idname = "modifierpiekit.export_profiler_stats"
+    bl_label = "통계 내보내기"
+    bl_description = "핸들러 통계를 JSON 파일로 저장합니다"
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH', default="modifier_pie_kit_handlers.json")
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        data = {
+            "blender_version": bpy.app.version_string,
+            "enabled": is_enabled(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "handlers": summary(),
+        }
+        try:
+            with open(bpy.path.abspath(self.filepath), "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        except OSError as e:
+            self.report({'ERROR'}, f"저장 실패: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"핸들러 {len(data['handlers'])}개 통계를 저장했습니다.")
+        return {'FINISHED'}
+
+
+classes = (
+    MODIFIERPIEKIT_OT_toggle_profiler_hud,
+    MODIFIERPIEKIT_OT_reset_profiler_stats,
+    MODIFIERPIEKIT_OT_export_profiler_stats,
+)
+
+
+def apply_preferences(prefs=None):
+    """ModifierPiePreferences.enable_profiling 을 반영"""
+    if prefs is None:
+        try:
+            prefs = bpy.context.preferences.addons["modifier_pie_kit"].preferences
+        except (KeyError, AttributeError):
+            return
+    _state["enabled"] = getattr(prefs, "enable_profiling", False)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    show_hud(False)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)